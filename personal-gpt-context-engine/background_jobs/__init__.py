@@ -1 +1,5 @@
 from .ingestion import run_cv_ingestion_job
+from .batch_ingestion import run_batch_ingestion_job
+from .github_ingestion import run_github_ingestion_job
+from .linkedin_ingestion import run_linkedin_ingestion_job
+from .handlers import JOB_HANDLERS
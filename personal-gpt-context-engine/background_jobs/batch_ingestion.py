@@ -0,0 +1,162 @@
+import os
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from config import settings
+from job_manager import job_manager
+from services import iter_pdf_pages, IngestionPipeline, PipelineDocument
+
+from models import JobStatus, JobStage
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+async def _pages(file_path: str, on_failure: Callable[[], Awaitable[None]]):
+    try:
+        async for _, content in iter_pdf_pages(file_path):
+            if content != "":
+                yield content
+    except Exception:
+        await on_failure()
+        raise
+
+
+async def run_batch_ingestion_job(
+    job_id: str, documents: List[Dict[str, str]], tenant_id: Optional[str] = None
+):
+    """
+    Background job to ingest the documents of a batch upload together.
+
+    Every document has its own job, which is updated as the document moves
+    through the pipeline; the batch job counts the ingested and failed ones.
+
+    Args:
+        job_id (str): The id of the batch job.
+        documents (List[Dict[str, str]]): The `job_id`, `file_path` and
+            `filename` of every document.
+        tenant_id (Optional[str]): The tenant the batch ingests for.
+    """
+    tenant_id = tenant_id or settings.DEFAULT_TENANT_ID
+    total = len(documents)
+    logger.info(
+        f"Starting batch ingestion job_id: {job_id}, {total} documents, tenant: {tenant_id}."
+    )
+    extracted = 0
+
+    def on_extraction_finished(document: Dict[str, str], failed: bool = False):
+        async def update():
+            nonlocal extracted
+            extracted += 1
+            updates = {
+                job_id: {
+                    "details": f"Finished extracting {extracted} of {total} documents."
+                },
+            }
+            # Embedding and upserting may still be catching up with the last pages.
+            if not failed:
+                updates[document["job_id"]] = {
+                    "job_stage": JobStage.VECTORIZATION,
+                    "details": "Vectoring the text.",
+                }
+            # Failed documents count too, or the batch would never move on.
+            if extracted == total:
+                updates[job_id]["job_stage"] = JobStage.VECTORIZATION
+            await job_manager.update_jobs(updates)
+
+        return update
+
+    try:
+        running = {
+            "job_stage": JobStage.EXTRACTING_TEXT,
+            "status": JobStatus.RUNNING,
+            "details": "Extracting text from the uploaded documents.",
+        }
+        await job_manager.update_jobs(
+            {job_id: running, **{document["job_id"]: running for document in documents}}
+        )
+
+        pipeline = IngestionPipeline(
+            metadata={"source": "document", "tenant_id": tenant_id}
+        )
+        results = await pipeline.run_batch(
+            [
+                PipelineDocument(
+                    metadata={"filename": document["filename"]},
+                    segments=_pages(
+                        document["file_path"],
+                        on_extraction_finished(document, failed=True),
+                    ),
+                    on_extraction_complete=on_extraction_finished(document),
+                )
+                for document in documents
+            ]
+        )
+
+        updates = {}
+        completed = 0
+        for document, result in zip(documents, results):
+            if result.error or not result.chunks:
+                updates[document["job_id"]] = {
+                    "status": JobStatus.FAILED,
+                    "errorMsg": (
+                        f"An unexpected error occurred: {result.error}"
+                        if result.error
+                        else "Critical error: Failed to extract text from PDF."
+                    ),
+                }
+                continue
+
+            completed += 1
+            updates[document["job_id"]] = {
+                "status": JobStatus.COMPLETED,
+                "job_stage": JobStage.COMPLETED,
+                "details": (
+                    f"Document has been successfully parsed: {result.chunks} chunks, "
+                    f"{result.new_chunks} new."
+                ),
+            }
+
+        failed = total - completed
+        updates[job_id] = {
+            "status": JobStatus.FAILED,
+            "completed_documents": completed,
+            "failed_documents": failed,
+            "details": f"{completed} of {total} documents ingested, {failed} failed.",
+            "errorMsg": "None of the documents could be ingested.",
+        }
+        if completed:
+            updates[job_id].update(
+                status=JobStatus.COMPLETED, job_stage=JobStage.COMPLETED, errorMsg=None
+            )
+        await job_manager.update_jobs(updates)
+        logger.info(
+            f"Completed batch job {job_id}: {completed} of {total} documents ingested."
+        )
+
+    except Exception as e:
+        logger.error(
+            f"An unexpected error occurred during batch ingestion for job {job_id}: {e}",
+            exc_info=True,
+        )
+        failure = {
+            "status": JobStatus.FAILED,
+            "errorMsg": f"An unexpected error occurred: {str(e)}",
+        }
+        await job_manager.update_jobs(
+            {
+                job_id: {**failure, "failed_documents": total},
+                **{document["job_id"]: failure for document in documents},
+            }
+        )
+    finally:
+        # The job has reached a final state, the uploads are no longer needed.
+        for document in documents:
+            try:
+                os.remove(document["file_path"])
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,240 @@
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from config import settings
+from job_manager import job_manager
+from services import (
+    IngestionPipeline,
+    PipelineDocument,
+    GitRepository,
+    RepositoryFile,
+    get_code_splitter,
+    get_language,
+    is_binary,
+    is_ingestible,
+)
+from vector_db_manager import vector_db_manager
+
+from models import JobStatus, JobStage
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+async def _file_content(reader, file: RepositoryFile):
+    content = await reader.read(file.blob)
+    if not is_binary(content):
+        yield content.decode("utf-8", errors="replace")
+
+
+def _file_metadata(file: RepositoryFile) -> Dict[str, str]:
+    metadata = {"path": file.path}
+    language = get_language(file.path)
+    if language is not None:
+        metadata["language"] = language
+    return metadata
+
+
+def _code_splitters(files: List[RepositoryFile]) -> List[Callable[[str], List[str]]]:
+    # Building a splitter loads its parser and tokenizer, so it runs off the loop.
+    return [get_code_splitter(file.path) for file in files]
+
+
+async def _get_changed_files(
+    metadata: Dict[str, str], files: List[RepositoryFile]
+) -> Tuple[List[RepositoryFile], List[str]]:
+    """
+    Compares the files of a commit with the blobs stored for the repository.
+    A file is unchanged when all of its points were stored for its current
+    blob, so files that failed or were interrupted in a previous sync are
+    ingested again.
+
+    Returns:
+        Tuple[List[RepositoryFile], List[str]]: The files to ingest, and the
+            stored paths no longer in the commit.
+    """
+    stored = await run_in_threadpool(
+        vector_db_manager.get_metadata_values, metadata, ["path", "blob"]
+    )
+    stored_blobs: Dict[str, set] = {}
+    for path, blob in stored:
+        stored_blobs.setdefault(path, set()).add(blob)
+
+    current = {file.path for file in files}
+    changed = [file for file in files if stored_blobs.get(file.path) != {file.blob}]
+    removed = sorted(path for path in stored_blobs if path not in current)
+    return changed, removed
+
+
+async def run_github_ingestion_job(
+    job_id: str,
+    repository_path: str,
+    repository: str,
+    ref: str = "HEAD",
+    tenant_id: Optional[str] = None,
+):
+    """
+    Background job to sync a git repository, a clone or a bundle, into the
+    vector database.
+
+    Only files whose content changed since they were last ingested are run
+    through the pipeline, split by a splitter aware of their language; files
+    removed from the repository are deleted.
+
+    Args:
+        job_id (str): The id of the job.
+        repository_path (str): The clone directory or bundle file.
+        repository (str): The name the repository is stored under.
+        ref (str): The branch, tag or commit to sync.
+        tenant_id (Optional[str]): The tenant the job ingests for.
+    """
+    tenant_id = tenant_id or settings.DEFAULT_TENANT_ID
+    logger.info(
+        f"Starting GitHub ingestion job_id: {job_id}, repository: {repository}@{ref}, tenant: {tenant_id}."
+    )
+    metadata = {"source": "github", "tenant_id": tenant_id, "repository": repository}
+
+    try:
+        await job_manager.update_job(
+            job_id=job_id,
+            updates={
+                "job_stage": JobStage.EXTRACTING_TEXT,
+                "status": JobStatus.RUNNING,
+                "details": f"Listing the files of {repository}@{ref}.",
+            },
+        )
+
+        async with GitRepository.open(repository_path) as git_repository:
+            commit = await git_repository.resolve(ref)
+            files = [
+                file
+                for file in await git_repository.list_files(commit)
+                if is_ingestible(file, settings.GITHUB_MAX_FILE_BYTES)
+            ]
+            changed, removed = await _get_changed_files(metadata, files)
+            logger.info(
+                f"Repository {repository}@{commit}: {len(files)} files, "
+                f"{len(changed)} changed, {len(removed)} removed."
+            )
+
+            if removed:
+                await run_in_threadpool(
+                    vector_db_manager.delete_points_by_metadata,
+                    {**metadata, "path": removed},
+                )
+
+            total = len(changed)
+            await job_manager.update_job(
+                job_id=job_id,
+                updates={
+                    "job_stage": JobStage.VECTORIZATION,
+                    "commit": commit,
+                    "total_documents": total,
+                    "details": f"Vectoring {total} changed files of {len(files)}.",
+                },
+            )
+
+            pipeline = IngestionPipeline(metadata=metadata)
+            completed = 0
+            skipped = 0
+            failed = 0
+            async with git_repository.blob_reader(
+                settings.GITHUB_READ_WORKERS
+            ) as reader:
+                for start in range(0, total, settings.GITHUB_FILES_PER_BATCH):
+                    batch = changed[start : start + settings.GITHUB_FILES_PER_BATCH]
+                    # One scroll reads the stored points of every file of the batch.
+                    existing = await run_in_threadpool(
+                        vector_db_manager.get_chunk_indexes_by_field,
+                        {**metadata, "path": [file.path for file in batch]},
+                        "path",
+                    )
+                    splitters = await run_in_threadpool(_code_splitters, batch)
+                    results = await pipeline.run_batch(
+                        [
+                            PipelineDocument(
+                                metadata=_file_metadata(file),
+                                segments=_file_content(reader, file),
+                                split_text=split_text,
+                                existing=existing.get(file.path, {}),
+                            )
+                            for file, split_text in zip(batch, splitters)
+                        ]
+                    )
+
+                    # Files that no longer hold any text, e.g. turned binary.
+                    emptied = []
+                    synced = []
+                    for file, result in zip(batch, results):
+                        if result.error:
+                            failed += 1
+                            logger.warning(
+                                f"Failed to ingest {repository}/{file.path}: {result.error}"
+                            )
+                            continue
+                        if result.chunks:
+                            completed += 1
+                            synced.append(file)
+                        else:
+                            skipped += 1
+                            emptied.append(file.path)
+
+                    # Marks the files as ingested, once all of their points are stored.
+                    await run_in_threadpool(
+                        vector_db_manager.set_metadata,
+                        [
+                            (
+                                {**metadata, "path": file.path},
+                                {"blob": file.blob, "commit": commit},
+                            )
+                            for file in synced
+                        ],
+                    )
+                    if emptied:
+                        await run_in_threadpool(
+                            vector_db_manager.delete_points_by_metadata,
+                            {**metadata, "path": emptied},
+                        )
+                    await job_manager.update_job(
+                        job_id=job_id,
+                        updates={
+                            "completed_documents": completed + skipped,
+                            "failed_documents": failed,
+                            "details": f"Vectored {completed + skipped + failed} of {total} changed files.",
+                        },
+                    )
+
+        details = (
+            f"Repository {repository} synced at {commit}: {completed} changed files "
+            f"ingested, {skipped} skipped as binary or empty, {failed} failed, "
+            f"{len(removed)} removed."
+        )
+        updates = {"details": details}
+        if failed and not completed + skipped:
+            updates.update(
+                status=JobStatus.FAILED,
+                errorMsg="None of the changed files could be ingested.",
+            )
+        else:
+            updates.update(status=JobStatus.COMPLETED, job_stage=JobStage.COMPLETED)
+        await job_manager.update_job(job_id=job_id, updates=updates)
+        logger.info(f"Completed GitHub ingestion job {job_id}. {details}")
+
+    except Exception as e:
+        logger.error(
+            f"An unexpected error occurred during GitHub ingestion for job {job_id}: {e}",
+            exc_info=True,
+        )
+        await job_manager.update_job(
+            job_id=job_id,
+            updates={
+                "status": JobStatus.FAILED,
+                "errorMsg": f"An unexpected error occurred: {str(e)}",
+            },
+        )
@@ -0,0 +1,16 @@
+from typing import Awaitable, Callable, Dict
+
+from models import ProcessingJobType
+from .ingestion import run_cv_ingestion_job
+from .batch_ingestion import run_batch_ingestion_job
+from .github_ingestion import run_github_ingestion_job
+from .linkedin_ingestion import run_linkedin_ingestion_job
+
+# Maps every queued job type to the coroutine that processes it. Handlers are
+# called with the job id and the keyword arguments stored in the job payload.
+JOB_HANDLERS: Dict[ProcessingJobType, Callable[..., Awaitable[None]]] = {
+    ProcessingJobType.CV_INGESTION: run_cv_ingestion_job,
+    ProcessingJobType.BATCH_INGESTION: run_batch_ingestion_job,
+    ProcessingJobType.GITHUB_REPO_INGESTION: run_github_ingestion_job,
+    ProcessingJobType.LINKEDIN_PROFILE_INGESTION: run_linkedin_ingestion_job,
+}
@@ -1,7 +1,10 @@
+import os
 import logging
+from typing import Optional
 
+from config import settings
 from job_manager import job_manager
-from services import extract_text_from_pdf, process_and_store_text
+from services import iter_pdf_pages, IngestionPipeline
 
 from models import JobStatus, JobStage
 
@@ -13,13 +16,19 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def run_cv_ingestion_job(job_id: str, file_bytes: bytes, filename: str):
-    """Background job to ingest and process the uploaded CV."""
-    logger.info(f"Starting CV ingestion job_id: {job_id}, filename: {filename}.")
+async def run_cv_ingestion_job(
+    job_id: str, file_path: str, filename: str, tenant_id: Optional[str] = None
+):
+    """Background job to ingest and process the uploaded CV stored at `file_path`."""
+    # Jobs queued before tenancy was introduced belong to the default tenant.
+    tenant_id = tenant_id or settings.DEFAULT_TENANT_ID
+    logger.info(
+        f"Starting CV ingestion job_id: {job_id}, filename: {filename}, tenant: {tenant_id}."
+    )
 
     try:
         # Perform Text Extraction
-        job_manager.update_job(
+        await job_manager.update_job(
             job_id=job_id,
             updates={
                 "job_stage": JobStage.EXTRACTING_TEXT,
@@ -28,14 +37,32 @@ async def run_cv_ingestion_job(job_id: str, file_bytes: bytes, filename: str):
             },
         )
 
-        extracted_text = await extract_text_from_pdf(file_bytes)
-        logger.info(f"CV ingestion job_id: {job_id}, filename: {filename} completed.")
+        async def pages():
+            async for _, content in iter_pdf_pages(file_path):
+                if content != "":
+                    yield content
 
-        if not extracted_text:
+        async def on_extraction_complete():
+            # Embedding and upserting may still be catching up with the last pages.
+            await job_manager.update_job(
+                job_id=job_id,
+                updates={
+                    "job_stage": JobStage.VECTORIZATION,
+                    "status": JobStatus.RUNNING,
+                    "details": "Vectoring the text.",
+                },
+            )
+
+        pipeline = IngestionPipeline(metadata={"source": "cv", "tenant_id": tenant_id})
+        result = await pipeline.run(
+            pages(), on_extraction_complete=on_extraction_complete
+        )
+
+        if not result.chunks:
             logger.info(
                 f"CV ingestion job_id: {job_id}, filename: {filename}. No text extracted."
             )
-            job_manager.update_job(
+            await job_manager.update_job(
                 job_id=job_id,
                 updates={
                     "status": JobStatus.FAILED,
@@ -44,46 +71,34 @@ async def run_cv_ingestion_job(job_id: str, file_bytes: bytes, filename: str):
             )
             return
 
-        # Vectorization
-        job_manager.update_job(
+        await job_manager.update_job(
             job_id=job_id,
             updates={
-                "job_stage": JobStage.VECTORIZATION,
-                "status": JobStatus.RUNNING,
-                "details": "Vectoring the text.",
+                "status": JobStatus.COMPLETED,
+                "job_stage": JobStage.COMPLETED,
+                "details": (
+                    f"CV has been successfully parsed: {result.chunks} chunks, "
+                    f"{result.new_chunks} new."
+                ),
             },
         )
-        success = process_and_store_text(extracted_text, job_id)
-        if success:
-            job_manager.update_job(
-                job_id=job_id,
-                updates={
-                    "status": JobStatus.COMPLETED,
-                    "stage": JobStage.COMPLETED,
-                    "details": "CV has been successfully parsed.",
-                },
-            )
-            logger.info(f"Successfully completed job {job_id}")
-        else:
-            job_manager.update_job(
-                job_id=job_id,
-                updates={
-                    "status": JobStatus.FAILED,
-                    "stage": JobStage.VECTORIZATION,
-                    "details": "CV has been successfully parsed.",
-                },
-            )
-            logger.error(f"Error completing job {job_id}")
+        logger.info(f"Successfully completed job {job_id}")
 
     except Exception as e:
         logger.error(
             f"An unexpected error occurred during cv ingestion for job {job_id}: {e}",
             exc_info=True,
         )
-        job_manager.update_job(
+        await job_manager.update_job(
             job_id=job_id,
             updates={
                 "status": JobStatus.FAILED,
                 "errorMsg": f"An unexpected error occurred: {str(e)}",
             },
         )
+    finally:
+        # The job has reached a final state, the upload is no longer needed.
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,175 @@
+import os
+import logging
+from collections import Counter
+from typing import List, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from config import settings
+from job_manager import job_manager
+from services import (
+    IngestionPipeline,
+    PipelineDocument,
+    get_text_chunker,
+    read_linkedin_export,
+)
+from vector_db_manager import vector_db_manager
+
+from models import JobStatus, JobStage
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+async def _record_text(text: str):
+    yield text
+
+
+def _split_record(text: str) -> List[str]:
+    """Keeps a record in a single chunk, unless it is longer than the model reads."""
+    chunker = get_text_chunker()
+    if chunker.count_tokens(text) <= chunker.max_tokens:
+        return [text]
+    return chunker.split_text(text)
+
+
+async def run_linkedin_ingestion_job(
+    job_id: str, file_path: str, filename: str, tenant_id: Optional[str] = None
+):
+    """
+    Background job to ingest a LinkedIn data export stored at `file_path`.
+
+    Every position, skill and project becomes its own chunk, with its fields
+    (company, title, years, ...) stored as metadata to filter on. An export
+    replaces the previous one: records it no longer holds are deleted.
+
+    Args:
+        job_id (str): The id of the job.
+        file_path (str): Path of the export zip archive.
+        filename (str): The name of the uploaded archive.
+        tenant_id (Optional[str]): The tenant the job ingests for.
+    """
+    tenant_id = tenant_id or settings.DEFAULT_TENANT_ID
+    logger.info(
+        f"Starting LinkedIn ingestion job_id: {job_id}, filename: {filename}, tenant: {tenant_id}."
+    )
+    metadata = {"source": "linkedin", "tenant_id": tenant_id}
+
+    try:
+        await job_manager.update_job(
+            job_id=job_id,
+            updates={
+                "job_stage": JobStage.EXTRACTING_TEXT,
+                "status": JobStatus.RUNNING,
+                "details": "Reading the records of the LinkedIn export.",
+            },
+        )
+
+        records = await run_in_threadpool(
+            read_linkedin_export,
+            file_path,
+            settings.LINKEDIN_MAX_RECORDS,
+            settings.LINKEDIN_MAX_FILE_BYTES,
+        )
+        if not records:
+            await job_manager.update_job(
+                job_id=job_id,
+                updates={
+                    "status": JobStatus.FAILED,
+                    "errorMsg": "The export holds no positions, skills or projects.",
+                },
+            )
+            return
+
+        counts = Counter(record.record_type for record in records)
+        summary = ", ".join(
+            f"{count} {kind}s" for kind, count in sorted(counts.items())
+        )
+        await job_manager.update_job(
+            job_id=job_id,
+            updates={
+                "job_stage": JobStage.VECTORIZATION,
+                "details": f"Vectoring {summary}.",
+            },
+        )
+
+        # One scroll reads the stored points of every record of the export.
+        existing = await run_in_threadpool(
+            vector_db_manager.get_chunk_indexes_by_field,
+            {
+                **metadata,
+                "record_key": [record.metadata["record_key"] for record in records],
+            },
+            "record_key",
+        )
+        pipeline = IngestionPipeline(metadata=metadata)
+        results = await pipeline.run_batch(
+            [
+                PipelineDocument(
+                    metadata=record.metadata,
+                    segments=_record_text(record.text),
+                    split_text=_split_record,
+                    existing=existing.get(record.metadata["record_key"], {}),
+                )
+                for record in records
+            ]
+        )
+        failed = sum(1 for result in results if result.error)
+        if failed == len(records):
+            raise RuntimeError(results[0].error)
+
+        # Records whose fields changed are stored under a new key, like removed
+        # ones their previous points are deleted. When a record failed, its
+        # previous version may be the only one stored, so nothing is deleted.
+        stale = []
+        if not failed:
+            current = {record.metadata["record_key"] for record in records}
+            stored = await run_in_threadpool(
+                vector_db_manager.get_metadata_values, metadata, ["record_key"]
+            )
+            stale = sorted(key for (key,) in stored if key not in current)
+        if stale:
+            await run_in_threadpool(
+                vector_db_manager.delete_points_by_metadata,
+                {**metadata, "record_key": stale},
+            )
+
+        details = (
+            f"LinkedIn export has been successfully parsed: {summary}, "
+            f"{sum(result.new_chunks for result in results)} new chunks, "
+            f"{len(stale)} stale records removed."
+        )
+        if failed:
+            details += f" {failed} records failed."
+        await job_manager.update_job(
+            job_id=job_id,
+            updates={
+                "status": JobStatus.COMPLETED,
+                "job_stage": JobStage.COMPLETED,
+                "details": details,
+            },
+        )
+        logger.info(f"Completed LinkedIn ingestion job {job_id}. {details}")
+
+    except Exception as e:
+        logger.error(
+            f"An unexpected error occurred during LinkedIn ingestion for job {job_id}: {e}",
+            exc_info=True,
+        )
+        await job_manager.update_job(
+            job_id=job_id,
+            updates={
+                "status": JobStatus.FAILED,
+                "errorMsg": f"An unexpected error occurred: {str(e)}",
+            },
+        )
+    finally:
+        # The job has reached a final state, the upload is no longer needed.
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,123 @@
+"""
+Peak memory of the embedding data path of a large ingest.
+
+Every mode runs in a fresh process, embeds a document of `--chunks` chunks and
+upserts it through `VectorDBManager.upsert_points`, then reports the peak RSS:
+
+    python -m benchmarks.ingest_memory --chunks 10000
+
+Modes:
+    lists    Embeddings converted to nested Python lists, as before.
+    float32  Embeddings kept as a float32 matrix up to the wire.
+    float16  Embeddings kept as a float16 matrix up to the wire.
+
+The embeddings are random and points are built in the gRPC wire format but
+discarded instead of sent, so neither the model nor a Qdrant server is needed
+and the numbers only reflect the client side of the path.
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+MODES = ("lists", "float32", "float16")
+DIMENSION = 384  # BAAI/bge-small-en-v1.5
+CHUNK_SIZE = 1000
+
+
+class _DiscardingClient:
+    """Accepts upserts in the gRPC wire format and drops them."""
+
+    init_options = {"prefer_grpc": True}
+
+    def __init__(self):
+        self.points = 0
+
+    def upsert(self, collection_name, points, wait):
+        self.points += len(points)
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _run_mode(mode: str, chunks: int, batch_size: int) -> dict:
+    from vector_db_manager import vector_db_manager
+
+    client = _DiscardingClient()
+    vector_db_manager.set_client(client)
+
+    text_chunks = [f"{i:08d}" + "x" * (CHUNK_SIZE - 8) for i in range(chunks)]
+    baseline = _peak_rss_mb()
+    started = time.perf_counter()
+
+    rng = np.random.default_rng(0)
+    dtype = "float32" if mode == "lists" else mode
+    embeddings = [] if mode == "lists" else np.empty((chunks, DIMENSION), dtype=dtype)
+    for start in range(0, chunks, batch_size):
+        # Stands in for one model.encode call of the inference executor.
+        batch = rng.standard_normal(
+            (min(batch_size, chunks - start), DIMENSION), dtype=np.float32
+        )
+        if mode == "lists":
+            embeddings.extend(batch.tolist())
+        else:
+            embeddings[start : start + len(batch)] = batch
+
+    vector_db_manager.upsert_points(text_chunks, embeddings, {"source": "benchmark"})
+
+    return {
+        "mode": mode,
+        "chunks": chunks,
+        "points": client.points,
+        "seconds": round(time.perf_counter() - started, 2),
+        "baseline_rss_mb": round(baseline, 1),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chunks", type=int, default=10000)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--mode", choices=MODES, help="Run a single mode in-process")
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(_run_mode(args.mode, args.chunks, args.batch_size)))
+        return
+
+    print(f"{'mode':<8} {'chunks':>7} {'seconds':>8} {'peak RSS':>10} {'over baseline':>14}")
+    for mode in MODES:
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.ingest_memory",
+                "--mode",
+                mode,
+                "--chunks",
+                str(args.chunks),
+                "--batch-size",
+                str(args.batch_size),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{mode:<8} {result['chunks']:>7} {result['seconds']:>8} "
+            f"{result['peak_rss_mb']:>8} MB "
+            f"{result['peak_rss_mb'] - result['baseline_rss_mb']:>11.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
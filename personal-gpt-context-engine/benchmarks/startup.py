@@ -0,0 +1,110 @@
+"""
+Import time and memory of the application modules on a cold start.
+
+Every module is imported in a fresh process, `--repeat` times, and the median
+import time is reported with the RSS the import added and the heavy
+dependencies it pulled in:
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --modules main worker sentence_transformers
+
+`main` is what every API replica pays before serving; heavy dependencies in
+its row are a regression. No Redis or Qdrant is needed, nothing is connected.
+"""
+
+import argparse
+import importlib
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+MODULES = (
+    "config",
+    "models",
+    "vector_db_manager",
+    "job_manager",
+    "services",
+    "main",
+    "worker",
+    # Third-party dependencies, for reference.
+    "numpy",
+    "fastapi",
+    "qdrant_client",
+    "langchain_text_splitters",
+    "fitz",
+    "onnxruntime",
+    "sentence_transformers",
+)
+
+# Dependencies that only inference or ingestion processes should load.
+HEAVY_MODULES = (
+    "torch",
+    "sentence_transformers",
+    "onnxruntime",
+    "langchain_text_splitters",
+    "fitz",
+)
+
+
+def _rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _import_module(module: str) -> dict:
+    baseline = _rss_mb()
+    started = time.perf_counter()
+    try:
+        importlib.import_module(module)
+    except ImportError as e:
+        return {"module": module, "error": str(e)}
+
+    return {
+        "module": module,
+        "seconds": time.perf_counter() - started,
+        "rss_mb": _rss_mb() - baseline,
+        "heavy": [name for name in HEAVY_MODULES if name in sys.modules],
+    }
+
+
+def _measure(module: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.startup", "--module", module],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--modules", nargs="+", default=MODULES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--module", help="Import a single module in-process")
+    args = parser.parse_args()
+
+    if args.module:
+        print(json.dumps(_import_module(args.module)))
+        return
+
+    print(f"{'module':<26} {'import s':>9} {'RSS':>10}  heavy dependencies loaded")
+    for module in args.modules:
+        runs = [_measure(module) for _ in range(max(1, args.repeat))]
+        if "error" in runs[0]:
+            print(f"{module:<26} {'-':>9} {'-':>10}  not importable: {runs[0]['error']}")
+            continue
+
+        seconds = statistics.median(run["seconds"] for run in runs)
+        rss_mb = statistics.median(run["rss_mb"] for run in runs)
+        print(
+            f"{module:<26} {seconds:>9.3f} {rss_mb:>7.1f} MB  "
+            f"{', '.join(runs[0]['heavy']) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
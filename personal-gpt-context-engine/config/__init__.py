@@ -1,3 +1,3 @@
 from .env import settings
-from .redis import connect_to_redis
+from .redis import connect_to_redis, connect_to_async_redis
 from .qdrant import connect_to_qdrant
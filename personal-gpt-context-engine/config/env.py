@@ -1,6 +1,6 @@
 import logging
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Optional
+from typing import Dict, Optional
 
 
 logging.basicConfig(
@@ -31,6 +31,110 @@ class EnvironmentSettings(BaseSettings):
     QDRANT_HOST: str
     QDRANT_PORT: int
     QDRANT_API_KEY: Optional[str] = None
+    QDRANT_UPSERT_BATCH_SIZE: int = 256
+    QDRANT_UPSERT_PARALLELISM: int = 2
+    QDRANT_UPSERT_WAIT: bool = False
+    QDRANT_HNSW_M: int = 16
+    QDRANT_HNSW_EF_CONSTRUCT: int = 100
+    QDRANT_HNSW_PAYLOAD_M: int = 16
+    QDRANT_INDEXING_THRESHOLD_KB: int = 20000
+    QDRANT_DEFAULT_SEGMENT_NUMBER: int = 0
+    QDRANT_QUANTIZATION: bool = False
+    QDRANT_QUANTIZATION_QUANTILE: float = 0.99
+    QDRANT_QUANTIZATION_OVERSAMPLING: float = 2.0
+
+    # Tenant Settings
+    DEFAULT_TENANT_ID: str = "default"
+    TENANT_MAX_POINTS: int = 50000
+    TENANT_POINT_QUOTAS: Dict[str, int] = {}
+
+    # Job Queue Settings
+    UPLOAD_DIR: str = "uploads"
+    UPLOAD_MAX_BYTES: int = 20 * 1024 * 1024
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024
+    BATCH_MAX_DOCUMENTS: int = 100
+    BATCH_MAX_BYTES: int = 200 * 1024 * 1024
+    JOB_QUEUE_STREAM: str = "processing_jobs:stream"
+    JOB_QUEUE_GROUP: str = "ingestion_workers"
+    JOB_QUEUE_MAXLEN: int = 100000
+    JOB_QUEUE_BLOCK_MS: int = 5000
+    JOB_QUEUE_CLAIM_IDLE_MS: int = 60000
+    JOB_QUEUE_MAX_DELIVERIES: int = 3
+    WORKER_CONCURRENCY: int = 2
+    JOB_COMPLETED_TTL_SECONDS: int = 604800
+
+    # Job Events Settings
+    JOB_EVENTS_CHANNEL: str = "processing_jobs:events"
+    JOB_EVENTS_KEEPALIVE_SECONDS: int = 15
+    JOB_EVENTS_CLIENT_BUFFER: int = 100
+
+    # PDF Extraction Settings
+    PDF_EXTRACTION_WORKERS: int = 4
+    PDF_PARALLEL_MIN_PAGES: int = 32
+    PDF_PAGES_PER_TASK: int = 8
+    PDF_PAGE_TIMEOUT_SECONDS: float = 10.0
+
+    # Inference Settings
+    INFERENCE_EXECUTOR: str = "process"  # "process" or "thread"
+    INFERENCE_WORKERS: int = 2
+    INFERENCE_MAX_PENDING: int = 8
+    INFERENCE_BATCH_SIZE: int = 64
+    INFERENCE_WARM_UP: str = "background"  # "eager", "background" or "off"
+    EMBEDDING_DTYPE: str = "float32"  # "float32" or "float16"
+
+    # Embedding Model Settings
+    EMBEDDING_MODEL: str = "BAAI/bge-small-en-v1.5"
+    EMBEDDING_DIMENSION: int = 384
+    EMBEDDING_BACKEND: str = "torch"  # "torch", "onnx" or "onnx-int8"
+    EMBEDDING_QUERY_INSTRUCTION: str = (
+        "Represent this sentence for searching relevant passages: "
+    )
+    EMBEDDING_THREADS: int = 0
+    EMBEDDING_MODEL_DIR: str = ".model_cache"
+
+    # Chunking Settings
+    CHUNK_MAX_TOKENS: int = 256
+    CHUNK_OVERLAP_TOKENS: int = 32
+    CHUNK_TOKEN_CACHE_SIZE: int = 10000
+
+    # Ingestion Pipeline Settings
+    PIPELINE_QUEUE_SIZE: int = 64
+    PIPELINE_EMBED_BATCH_SIZE: int = 64
+    PIPELINE_UPSERT_BATCH_SIZE: int = 256
+    BATCH_DOCUMENT_CONCURRENCY: int = 4
+
+    # GitHub Ingestion Settings
+    GITHUB_REPOS_DIR: str = "repositories"
+    GITHUB_MAX_FILE_BYTES: int = 1024 * 1024
+    GITHUB_READ_WORKERS: int = 4
+    GITHUB_FILES_PER_BATCH: int = 200
+
+    # LinkedIn Ingestion Settings
+    LINKEDIN_MAX_BYTES: int = 100 * 1024 * 1024
+    LINKEDIN_MAX_FILE_BYTES: int = 10 * 1024 * 1024
+    LINKEDIN_MAX_RECORDS: int = 2000
+
+    # Embedding Cache Settings
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_DTYPE: str = "float32"  # "float32" or "float16"
+    EMBEDDING_CACHE_TTL_SECONDS: int = 604800
+
+    # Search Settings
+    SEARCH_DEFAULT_LIMIT: int = 5
+    SEARCH_HYBRID: bool = True
+    SEARCH_PREFETCH_LIMIT: int = 50
+    SEARCH_CACHE_ENABLED: bool = True
+    SEARCH_CACHE_TTL_SECONDS: int = 3600
+    QUERY_BATCH_MAX_SIZE: int = 32
+    QUERY_BATCH_MAX_WAIT_MS: int = 10
+
+    # Re-ranking Settings
+    RERANK_ENABLED: bool = False
+    RERANK_MODEL: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    RERANK_CANDIDATES: int = 30
+    RERANK_BATCH_SIZE: int = 32
+    RERANK_BUDGET_MS: int = 300
+    RERANK_MMR_DIVERSITY: float = 0.3
 
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", extra="ignore"
@@ -1,6 +1,7 @@
 import logging
 
 from redis import Redis, RedisError
+from redis.asyncio import Redis as AsyncRedis
 from tenacity import retry, stop_after_attempt, wait_fixed, before_sleep_log
 
 from config import settings
@@ -23,10 +24,11 @@ before_sleep = before_sleep_log(logger, logging.INFO)
     stop=stop_after_attempt(10),  # Stop after 10 attempts (50 seconds total)
     before_sleep=before_sleep,  # Log a message before sleeping
 )
-def connect_to_redis() -> Redis:
+def connect_to_redis(decode_responses: bool = True) -> Redis:
     """
     Tries to connect to Redis with retries.
     If it fails after all retries, tenacity will re-raise the last exception.
+    Pass decode_responses=False for a client that reads and writes raw bytes.
     """
     logger.info("Attempting to connect to Redis...")
     if not settings:
@@ -37,7 +39,7 @@ def connect_to_redis() -> Redis:
         port=settings.REDIS_PORT,
         db=settings.REDIS_CONTEXT_ENGINE_DB,
         password=settings.REDIS_PASSWORD,
-        decode_responses=True,
+        decode_responses=decode_responses,
     )
 
     try:
@@ -51,3 +53,34 @@ def connect_to_redis() -> Redis:
 
     logger.info("Connected to Redis (ping OK).")
     return redis_client
+
+
+@retry(
+    wait=wait_fixed(5),  # Wait 5 seconds between each retry
+    stop=stop_after_attempt(10),  # Stop after 10 attempts (50 seconds total)
+    before_sleep=before_sleep,  # Log a message before sleeping
+)
+async def connect_to_async_redis() -> AsyncRedis:
+    """
+    Tries to connect to Redis with an asyncio client, with retries.
+    If it fails after all retries, tenacity will re-raise the last exception.
+    """
+    logger.info("Attempting to connect to Redis (asyncio)...")
+    if not settings:
+        raise ConnectionError("Settings are not loaded, cannot connect to Redis.")
+
+    redis_client = AsyncRedis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=settings.REDIS_CONTEXT_ENGINE_DB,
+        password=settings.REDIS_PASSWORD,
+        decode_responses=True,
+    )
+
+    pong = await redis_client.ping()
+    if pong is not True and pong != "PONG":
+        logger.error("Unexpected ping response from Redis: %r", pong)
+        raise ConnectionError(f"Unexpected Redis ping reply: {pong!r}")
+
+    logger.info("Connected to Redis with asyncio client (ping OK).")
+    return redis_client
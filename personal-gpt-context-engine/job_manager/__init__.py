@@ -1 +1,2 @@
 from .job_manager import job_manager
+from .job_events import job_events
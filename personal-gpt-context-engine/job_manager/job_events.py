@@ -0,0 +1,155 @@
+import asyncio
+import logging
+
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from redis.asyncio import Redis
+from typing import AsyncIterator, Dict, Optional, Set, Tuple
+
+from config import settings
+from models import ProcessingJob
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+class _JobEventBroadcaster:
+    """
+    Fans job updates published on the job events channel out to local listeners.
+
+    Each API process holds a single Redis subscription, however many clients
+    are watching. Listeners are indexed by their tenant and the job they watch,
+    so an update only reaches the listeners of that job and those watching all
+    jobs of its tenant, never another tenant's listeners. Every listener
+    gets its own bounded buffer; a listener that falls behind loses its oldest
+    events rather than slowing down the others.
+    """
+
+    _client: Redis = None  # The client will be attached at startup
+
+    def __init__(self, channel: str, buffer_size: int, default_tenant_id: str):
+        self.channel = channel
+        self.default_tenant_id = default_tenant_id
+        self.buffer_size = max(1, buffer_size)
+        self._listeners: Dict[Tuple[str, Optional[str]], Set[asyncio.Queue]] = (
+            defaultdict(set)
+        )
+        self._task: Optional[asyncio.Task] = None
+
+    def set_client(self, client: Redis):
+        """Attaches the active asyncio Redis client to the broadcaster."""
+        logger.info("Redis client has been attached to JobEventBroadcaster.")
+        self._client = client
+
+    @property
+    def listeners(self) -> int:
+        """Number of listeners currently connected to this process."""
+        return sum(len(queues) for queues in self._listeners.values())
+
+    def start(self):
+        """Starts the shared subscription on the running event loop."""
+        if self._task is not None:
+            return
+
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Job event broadcaster subscribed to '{self.channel}'.")
+
+    async def stop(self):
+        """Stops the shared subscription."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Job event broadcaster stopped.")
+
+    def _publish_locally(self, job: ProcessingJob):
+        # Jobs created before tenants existed belong to the default tenant.
+        tenant_id = job.tenant_id or self.default_tenant_id
+        watchers = (
+            *self._listeners.get((tenant_id, None), ()),
+            *self._listeners.get((tenant_id, job.job_id), ()),
+        )
+        for queue in watchers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(job)
+
+    async def _run(self):
+        while True:
+            pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                async for message in pubsub.listen():
+                    try:
+                        job = ProcessingJob.model_validate_json(message["data"])
+                    except ValueError as e:
+                        logger.warning(f"Ignoring malformed job event: {e}")
+                        continue
+                    self._publish_locally(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Job event subscription failed, resubscribing: {e}")
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    @asynccontextmanager
+    async def subscribe(
+        self, tenant_id: str, job_id: Optional[str] = None
+    ) -> AsyncIterator["JobEventSubscription"]:
+        """
+        Registers a listener for job updates for the duration of the context.
+
+        Args:
+            tenant_id (str): Only receive updates of this tenant's jobs.
+            job_id (Optional[str]): Only receive updates of this job.
+        """
+        key = (tenant_id, job_id)
+        queue = asyncio.Queue(maxsize=self.buffer_size)
+        self._listeners[key].add(queue)
+        try:
+            yield JobEventSubscription(queue)
+        finally:
+            self._listeners[key].discard(queue)
+            if not self._listeners[key]:
+                del self._listeners[key]
+
+
+class JobEventSubscription:
+    """The updates received by a single listener of the job event broadcaster."""
+
+    def __init__(self, queue: asyncio.Queue):
+        self._queue = queue
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[ProcessingJob]:
+        """
+        Waits for the next job update.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait, e.g. between keep-alives.
+
+        Returns:
+            Optional[ProcessingJob]: The updated job, or None on a timeout.
+        """
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+job_events = _JobEventBroadcaster(
+    channel=settings.JOB_EVENTS_CHANNEL if settings else "processing_jobs:events",
+    buffer_size=settings.JOB_EVENTS_CLIENT_BUFFER if settings else 100,
+    default_tenant_id=settings.DEFAULT_TENANT_ID if settings else "default",
+)
@@ -1,10 +1,14 @@
-import json
+import base64
 import logging
+import time
 
-from redis import Redis
-from typing import Optional
+from collections import OrderedDict
+from enum import Enum
+from redis.asyncio import Redis
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 
+from config import settings
 from models import JobStatus, ProcessingJobType, JobStage, ProcessingJob
 
 
@@ -15,17 +19,199 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Applies a partial update to an existing job hash, moves the job between the
+# status indexes of its tenant when its status changes, publishes the updated
+# job on the job events channel and returns it. Once the job is done, the
+# content index entry pointing to it expires with it when it completed, and is
+# removed when it failed. KEYS[1] is the job key, KEYS[2] the index of all jobs
+# of its tenant, KEYS[3] the tenant's expiry index and KEYS[4] the job's content
+# index entry, an empty string if it has none, followed by the tenant's index of
+# every status and then its index of every status for the job's type. ARGV
+# holds the channel, the job id, the retention of completed jobs, the number of
+# fields to set and the statuses in the order of their index keys, followed by
+# the field/value pairs to set and the fields to delete. Running it as a script
+# makes all of this a single atomic round-trip.
+_UPDATE_JOB_SCRIPT = """
+if #KEYS == 1 or redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+local job_id = ARGV[2]
+local completed_ttl = tonumber(ARGV[3])
+local set_count = tonumber(ARGV[4])
+local status_count = (#KEYS - 4) / 2
+local status_keys, type_status_keys = {}, {}
+for i = 1, status_count do
+    status_keys[ARGV[4 + i]] = KEYS[4 + i]
+    type_status_keys[ARGV[4 + i]] = KEYS[4 + status_count + i]
+end
+local first_field = 5 + status_count
+
+local old_status = redis.call('HGET', KEYS[1], 'status')
+if set_count > 0 then
+    redis.call('HSET', KEYS[1], unpack(ARGV, first_field, first_field + set_count * 2 - 1))
+end
+if #ARGV >= first_field + set_count * 2 then
+    redis.call('HDEL', KEYS[1], unpack(ARGV, first_field + set_count * 2))
+end
+
+local new_status = redis.call('HGET', KEYS[1], 'status')
+if new_status ~= old_status then
+    local created = redis.call('ZSCORE', KEYS[2], job_id)
+    if created then
+        if old_status and status_keys[old_status] then
+            redis.call('ZREM', status_keys[old_status], job_id)
+            redis.call('ZREM', type_status_keys[old_status], job_id)
+        end
+        if new_status and status_keys[new_status] then
+            redis.call('ZADD', status_keys[new_status], created, job_id)
+            redis.call('ZADD', type_status_keys[new_status], created, job_id)
+        end
+    end
+    if new_status == 'completed' and completed_ttl > 0 then
+        local now = tonumber(redis.call('TIME')[1])
+        redis.call('EXPIRE', KEYS[1], completed_ttl)
+        redis.call('ZADD', KEYS[3], now + completed_ttl, job_id)
+    elseif old_status == 'completed' then
+        redis.call('PERSIST', KEYS[1])
+        redis.call('ZREM', KEYS[3], job_id)
+    end
+    if KEYS[4] ~= '' and redis.call('GET', KEYS[4]) == job_id then
+        if new_status == 'completed' then
+            if completed_ttl > 0 then
+                redis.call('EXPIRE', KEYS[4], completed_ttl)
+            end
+        elseif new_status == 'failed' then
+            redis.call('DEL', KEYS[4])
+        else
+            redis.call('PERSIST', KEYS[4])
+        end
+    end
+end
+
+local fields = redis.call('HGETALL', KEYS[1])
+local job = {}
+for i = 1, #fields, 2 do
+    job[fields[i]] = fields[i + 1]
+end
+redis.call('PUBLISH', ARGV[1], cjson.encode(job))
+return fields
+"""
+
+# Creates a job and adds it to its indexes, unless a job with the same content
+# is pending, running or completed, in which case that job's id is returned.
+# KEYS[1] is the job key, KEYS[2..5] its tenant's indexes, KEYS[6] the content
+# index entry, KEYS[7] the index of completed jobs of the same type and tenant
+# and KEYS[8] the key of the job the content index entry named when the caller
+# read it. When a newer completed job supersedes older ones, only the latest
+# completed job is reused. KEYS[6..8] are empty strings to skip these checks.
+# ARGV holds the channel, the job id, its score, the job as JSON and the id of
+# the job the entry named, an empty string if none, followed by the job's
+# field/value pairs. Returns nil when the entry changed since the caller read
+# it, so the caller reads it again. The entry has no TTL until the job is done.
+_CREATE_JOB_SCRIPT = """
+if KEYS[6] ~= '' then
+    local existing = redis.call('GET', KEYS[6]) or ''
+    if existing ~= ARGV[5] then
+        return nil
+    end
+    if existing ~= '' then
+        local status = redis.call('HGET', KEYS[8], 'status')
+        if status == 'pending' or status == 'running' then
+            return existing
+        end
+        if status == 'completed' and (
+            KEYS[7] == '' or redis.call('ZREVRANGE', KEYS[7], 0, 0)[1] == existing
+        ) then
+            return existing
+        end
+    end
+end
+
+redis.call('HSET', KEYS[1], unpack(ARGV, 6))
+for i = 2, 5 do
+    redis.call('ZADD', KEYS[i], ARGV[3], ARGV[2])
+end
+if KEYS[6] ~= '' then
+    redis.call('SET', KEYS[6], ARGV[2])
+end
+redis.call('PUBLISH', ARGV[1], ARGV[4])
+return ARGV[2]
+"""
+
+# Removes jobs whose retention has expired from every index of a tenant. KEYS[1]
+# is the tenant's expiry index and the remaining keys the indexes an expired job
+# may be in. ARGV holds the current time and the maximum number of jobs to
+# remove.
+_PRUNE_EXPIRED_SCRIPT = """
+local expired = redis.call(
+    'ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2])
+)
+if #expired == 0 then
+    return 0
+end
+for i = 2, #KEYS do
+    redis.call('ZREM', KEYS[i], unpack(expired))
+end
+redis.call('ZREM', KEYS[1], unpack(expired))
+return #expired
+"""
+
+
+# The tenant, type and content hash of a job, which fix the keys it is indexed under.
+_JobScope = Tuple[str, ProcessingJobType, Optional[str]]
+
+
+def _encode(value: Any) -> str:
+    """Encodes a job field as a Redis hash value."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
 
 class _JobStatusManager:
-    """Manages storing and retrieving job status information in Redis."""
+    """
+    Manages storing and retrieving job status information in Redis.
+
+    Every job is stored as a hash with one field per job attribute, so updates
+    only write the fields that changed and concurrent writers updating
+    different fields never overwrite each other. Every new or updated job is
+    published on the job events channel.
+
+    Jobs are also indexed per tenant in sorted sets scored by creation time:
+    one for all jobs of the tenant, one per status, one per job type and one
+    per job type and status. Listing the latest jobs matching a filter reads a
+    single index, so it takes the same time however many jobs exist and never
+    reaches another tenant's jobs. Completed jobs expire after
+    JOB_COMPLETED_TTL_SECONDS and are pruned from the indexes lazily.
+    """
 
     _client: Redis = None  # The client will be attached at startup
+    _create_script = None
+    _update_script = None
+    _prune_script = None
     key_prefix = "processing_job"
+    index_prefix = f"{key_prefix}:index"
+    events_channel = settings.JOB_EVENTS_CHANNEL if settings else "processing_jobs:events"
+    completed_ttl = settings.JOB_COMPLETED_TTL_SECONDS if settings else 604800
+    default_tenant_id = settings.DEFAULT_TENANT_ID if settings else "default"
+    prune_batch_size = 1000
+    scope_cache_size = 10000
+
+    def __init__(self):
+        # The tenant, type and content hash of recently seen jobs, which never
+        # change, so the keys an update touches are known without reading the
+        # job first.
+        self._scopes: "OrderedDict[str, _JobScope]" = OrderedDict()
 
     def set_client(self, client: Redis):
-        """Attaches the active Redis client to the manager instance."""
+        """Attaches the active asyncio Redis client to the manager instance."""
         logger.info("Redis client has been attached to JobStatusManager.")
         self._client = client
+        self._create_script = client.register_script(_CREATE_JOB_SCRIPT)
+        self._update_script = client.register_script(_UPDATE_JOB_SCRIPT)
+        self._prune_script = client.register_script(_PRUNE_EXPIRED_SCRIPT)
 
     @property
     def client(self) -> Redis:
@@ -40,65 +226,536 @@ class _JobStatusManager:
         """Generate Redis key for a given job ID."""
         return f"{self.key_prefix}:{job_id}"
 
-    def get_job(self, job_id: str) -> Optional[ProcessingJob]:
-        """Retrieve job status from Redis."""
-        job_key = self._get_key(job_id)
-        job_data = self.client.get(job_key)
-        if job_data:
-            try:
-                job_dict = json.loads(job_data)
-                return ProcessingJob(**job_dict)
-            except json.JSONDecodeError as e:
-                logger.error(
-                    f"Error decoding job data from Redis for job_id {job_id}: {e}"
+    def _get_index_key(
+        self,
+        tenant_id: str,
+        status: Optional[JobStatus] = None,
+        job_type: Optional[ProcessingJobType] = None,
+    ) -> str:
+        """Generate the Redis key of a tenant's job index for a status and/or type."""
+        tenant_prefix = f"{self.index_prefix}:tenant:{tenant_id}"
+        if job_type and status:
+            return f"{tenant_prefix}:type:{job_type.value}:status:{status.value}"
+        if job_type:
+            return f"{tenant_prefix}:type:{job_type.value}"
+        if status:
+            return f"{tenant_prefix}:status:{status.value}"
+        return f"{tenant_prefix}:all"
+
+    def _get_content_key(
+        self, tenant_id: str, job_type: ProcessingJobType, content_hash: str
+    ) -> str:
+        """Generate the Redis key naming the job that ingests some content."""
+        return f"{self.key_prefix}:content:{job_type.value}:{tenant_id}:{content_hash}"
+
+    def _get_expiry_key(self, tenant_id: str) -> str:
+        """Generate the Redis key of the expiry times of a tenant's completed jobs."""
+        return f"{self.index_prefix}:tenant:{tenant_id}:expiry"
+
+    def _parse_job(self, job_id: str, job_data: Dict[str, str]) -> Optional[ProcessingJob]:
+        try:
+            return ProcessingJob.model_validate(job_data)
+        except ValueError as e:
+            logger.error(f"Error decoding job data from Redis for job_id {job_id}: {e}")
+            return None
+
+    def _remember_scope(self, job: ProcessingJob):
+        self._scopes[job.job_id] = (
+            job.tenant_id or self.default_tenant_id,
+            job.job_type,
+            job.content_hash,
+        )
+        self._scopes.move_to_end(job.job_id)
+        while len(self._scopes) > self.scope_cache_size:
+            self._scopes.popitem(last=False)
+
+    async def _get_scopes(self, job_ids: List[str]) -> Dict[str, Optional["_JobScope"]]:
+        """
+        Returns the tenant, type and content hash of jobs, None for jobs that
+        don't exist.
+        Jobs that aren't cached are read in one pipelined round-trip.
+        """
+        missing = [job_id for job_id in job_ids if job_id not in self._scopes]
+        if missing:
+            pipeline = self.client.pipeline(transaction=False)
+            for job_id in missing:
+                pipeline.hmget(
+                    self._get_key(job_id), ["tenant_id", "job_type", "content_hash"]
                 )
-                return None
+            for job_id, (tenant_id, job_type, content_hash) in zip(
+                missing, await pipeline.execute()
+            ):
+                if job_type is not None:
+                    # Jobs created before tenants belong to the default tenant.
+                    self._scopes[job_id] = (
+                        tenant_id or self.default_tenant_id,
+                        ProcessingJobType(job_type),
+                        content_hash,
+                    )
+            while len(self._scopes) > self.scope_cache_size:
+                self._scopes.popitem(last=False)
+
+        return {job_id: self._scopes.get(job_id) for job_id in job_ids}
+
+    def _build_update_call(
+        self,
+        job_id: str,
+        scope: Optional["_JobScope"],
+        updates: dict,
+    ) -> Tuple[List[str], List[str]]:
+        unknown_fields = set(updates) - set(ProcessingJob.model_fields)
+        if unknown_fields:
+            raise ValueError(f"Unknown job fields: {sorted(unknown_fields)}")
+
+        updates = {**updates, "updated_at": datetime.now(timezone.utc)}
+        to_set = [
+            item
+            for field, value in updates.items()
+            if value is not None
+            for item in (field, _encode(value))
+        ]
+        to_delete = [field for field, value in updates.items() if value is None]
+        if scope is None:
+            # The job doesn't exist, the script returns before touching any index.
+            return [self._get_key(job_id)], [self.events_channel, job_id]
+
+        tenant_id, job_type, content_hash = scope
+        keys = [
+            self._get_key(job_id),
+            self._get_index_key(tenant_id),
+            self._get_expiry_key(tenant_id),
+            (
+                self._get_content_key(tenant_id, job_type, content_hash)
+                if content_hash
+                else ""
+            ),
+            *[self._get_index_key(tenant_id, status=status) for status in JobStatus],
+            *[
+                self._get_index_key(tenant_id, status=status, job_type=job_type)
+                for status in JobStatus
+            ],
+        ]
+        args = [
+            self.events_channel,
+            job_id,
+            str(self.completed_ttl),
+            str(len(to_set) // 2),
+            *[status.value for status in JobStatus],
+            *to_set,
+            *to_delete,
+        ]
+        return keys, args
 
-        return None
+    async def get_job(self, job_id: str) -> Optional[ProcessingJob]:
+        """Retrieve job status from Redis."""
+        job_data = await self.client.hgetall(self._get_key(job_id))
+        if not job_data:
+            return None
+
+        return self._parse_job(job_id, job_data)
 
-    def create_job(
-        self, job_id: str, job_type: ProcessingJobType, filename: Optional[str] = None
+    async def create_job(
+        self,
+        job_id: str,
+        job_type: ProcessingJobType,
+        filename: Optional[str] = None,
+        content_hash: Optional[str] = None,
+        tenant_id: Optional[str] = None,
     ) -> ProcessingJob:
         """Creates a new job with an initial 'PENDING'/'QUEUED' state."""
+        job, _ = await self._create_job(
+            job_id, job_type, filename, content_hash, tenant_id
+        )
+        return job
+
+    async def create_or_attach_job(
+        self,
+        job_id: str,
+        job_type: ProcessingJobType,
+        content_hash: str,
+        filename: Optional[str] = None,
+        latest_only: bool = False,
+        tenant_id: Optional[str] = None,
+    ) -> Tuple[ProcessingJob, bool]:
+        """
+        Creates a new job unless a job of the same type for the same content is
+        pending, running or completed, atomically, so concurrent identical
+        uploads end up sharing a single job. Jobs of different tenants are
+        never shared.
+
+        Args:
+            job_id (str): The id of the job to create.
+            job_type (ProcessingJobType): The type of the job.
+            content_hash (str): The hash of the content the job ingests.
+            filename (Optional[str]): The name of the uploaded file.
+            latest_only (bool): Whether a completed job is only reused while it is
+                the latest completed job of its type, for types where every job
+                replaces what the previous ones ingested.
+            tenant_id (Optional[str]): The tenant the job ingests for.
 
-        initial_job = ProcessingJob(
+        Returns:
+            Tuple[ProcessingJob, bool]: The job and whether it was newly created.
+        """
+        return await self._create_job(
+            job_id,
+            job_type,
+            filename,
+            content_hash,
+            tenant_id,
+            deduplicate=True,
+            latest_only=latest_only,
+        )
+
+    async def create_batch_job(
+        self,
+        job_id: str,
+        documents: List[Tuple[str, str]],
+        tenant_id: Optional[str] = None,
+    ) -> Tuple[ProcessingJob, List[ProcessingJob]]:
+        """
+        Creates a batch job and one job per document of the batch, in one
+        pipelined round-trip. The batch job tracks how many documents were
+        ingested; document jobs are never queued, the batch job processes them.
+
+        Args:
+            job_id (str): The id of the batch job.
+            documents (List[Tuple[str, str]]): The job id and filename of every document.
+            tenant_id (Optional[str]): The tenant the batch ingests for.
+
+        Returns:
+            Tuple[ProcessingJob, List[ProcessingJob]]: The batch job and the document jobs.
+        """
+        batch_job = self._new_job(
+            job_id,
+            ProcessingJobType.BATCH_INGESTION,
+            tenant_id=tenant_id,
+            total_documents=len(documents),
+            completed_documents=0,
+            failed_documents=0,
+        )
+        document_jobs = [
+            self._new_job(
+                document_job_id,
+                ProcessingJobType.DOCUMENT_INGESTION,
+                filename=filename,
+                tenant_id=tenant_id,
+                parent_job_id=job_id,
+            )
+            for document_job_id, filename in documents
+        ]
+
+        pipeline = self.client.pipeline(transaction=False)
+        for job in (batch_job, *document_jobs):
+            self._remember_scope(job)
+            keys, args = self._build_create_args(job)
+            await self._create_script(keys=keys, args=args, client=pipeline)
+        await pipeline.execute()
+
+        logger.info(
+            f"Created batch job '{job_id}' with {len(document_jobs)} document jobs."
+        )
+        return batch_job, document_jobs
+
+    def _new_job(
+        self,
+        job_id: str,
+        job_type: ProcessingJobType,
+        tenant_id: Optional[str] = None,
+        **fields,
+    ) -> ProcessingJob:
+        return ProcessingJob(
             job_id=job_id,
             job_type=job_type,
             job_stage=JobStage.QUEUED,
             status=JobStatus.PENDING,
             details=f"Job '{job_id}' has been created and is waiting to be processed.",
+            tenant_id=tenant_id or self.default_tenant_id,
+            **fields,
+        )
+
+    def _build_create_args(
+        self,
+        job: ProcessingJob,
+        deduplicate: bool = False,
+        latest_only: bool = False,
+        existing_job_id: Optional[str] = None,
+    ) -> Tuple[List[str], List[Any]]:
+        job_type, tenant_id = job.job_type, job.tenant_id
+        keys = [
+            self._get_key(job.job_id),
+            self._get_index_key(tenant_id),
+            self._get_index_key(tenant_id, status=job.status),
+            self._get_index_key(tenant_id, job_type=job_type),
+            self._get_index_key(tenant_id, status=job.status, job_type=job_type),
+            (
+                self._get_content_key(tenant_id, job_type, job.content_hash)
+                if deduplicate
+                else ""
+            ),
+            (
+                self._get_index_key(
+                    tenant_id, status=JobStatus.COMPLETED, job_type=job_type
+                )
+                if deduplicate and latest_only
+                else ""
+            ),
+            self._get_key(existing_job_id) if existing_job_id else "",
+        ]
+        args = [
+            self.events_channel,
+            job.job_id,
+            job.created_at.timestamp(),
+            job.model_dump_json(),
+            existing_job_id or "",
+            *[
+                item
+                for field, value in job.model_dump().items()
+                if value is not None
+                for item in (field, _encode(value))
+            ],
+        ]
+        return keys, args
+
+    async def _create_job(
+        self,
+        job_id: str,
+        job_type: ProcessingJobType,
+        filename: Optional[str],
+        content_hash: Optional[str],
+        tenant_id: Optional[str] = None,
+        deduplicate: bool = False,
+        latest_only: bool = False,
+    ) -> Tuple[ProcessingJob, bool]:
+        initial_job = self._new_job(
+            job_id,
+            job_type,
             filename=filename,
+            content_hash=content_hash,
+            tenant_id=tenant_id,
         )
 
-        job_key = self._get_key(job_id)
-        self.client.set(job_key, initial_job.json())
+        created_job_id = None
+        while created_job_id is None:
+            existing_job_id = None
+            if deduplicate:
+                # The job the content entry names is passed to the script as a key.
+                existing_job_id = await self.client.get(
+                    self._get_content_key(initial_job.tenant_id, job_type, content_hash)
+                )
+            keys, args = self._build_create_args(
+                initial_job, deduplicate, latest_only, existing_job_id
+            )
+            created_job_id = await self._create_script(
+                keys=keys, args=args, client=self.client
+            )
+
+        if created_job_id != job_id:
+            existing_job = await self.get_job(created_job_id)
+            if existing_job:
+                logger.info(
+                    f"Job '{created_job_id}' already covers content {content_hash}."
+                )
+                return existing_job, False
+
+            # The existing job expired in between, nothing prevents a new one now.
+            return await self._create_job(
+                job_id,
+                job_type,
+                filename,
+                content_hash,
+                tenant_id,
+                deduplicate,
+                latest_only,
+            )
+
+        self._remember_scope(initial_job)
         logger.info(f"Created new job '{job_id}' of type '{job_type.value}'.")
-        return initial_job
+        return initial_job, True
 
-    def update_job(self, job_id: str, updates: dict) -> Optional[ProcessingJob]:
-        """Update job status in Redis."""
-        job = self.get_job(job_id)
-        if not job:
-            logger.warning(f"Job with ID {job_id} not found in Redis for update.")
+    async def update_job(self, job_id: str, updates: dict) -> Optional[ProcessingJob]:
+        """
+        Atomically applies a partial update to a job in a single round-trip,
+        plus one to read the tenant and type of a job this process hasn't seen.
+        Fields set to None are removed from the job.
+        """
+        scopes = await self._get_scopes([job_id])
+        try:
+            keys, args = self._build_update_call(job_id, scopes[job_id], updates)
+        except ValueError as e:
+            logger.error(f"Failed to update job '{job_id}' due to invalid data: {e}")
             return None
 
-        job_dict = job.model_dump()
-        job_dict.update(updates)
+        job_data = await self._update_script(keys=keys, args=args, client=self.client)
+        return self._handle_update_result(job_id, job_data)
+
+    async def update_jobs(
+        self, updates: Dict[str, dict]
+    ) -> Dict[str, Optional[ProcessingJob]]:
+        """
+        Applies partial updates to several jobs in one pipelined round-trip,
+        plus one to read the tenant and type of jobs this process hasn't seen.
+        Every job is updated atomically, as with `update_job`.
+
+        Args:
+            updates (Dict[str, dict]): The updates to apply, keyed by job ID.
+
+        Returns:
+            Dict[str, Optional[ProcessingJob]]: The updated jobs, None for jobs
+                that weren't found or got invalid data.
+        """
+        results = {job_id: None for job_id in updates}
+        scopes = await self._get_scopes(list(updates))
+        pipeline = self.client.pipeline(transaction=False)
+        queued = []
+        for job_id, job_updates in updates.items():
+            try:
+                keys, args = self._build_update_call(
+                    job_id, scopes[job_id], job_updates
+                )
+            except ValueError as e:
+                logger.error(f"Failed to update job '{job_id}' due to invalid data: {e}")
+                continue
+
+            await self._update_script(keys=keys, args=args, client=pipeline)
+            queued.append(job_id)
+
+        if queued:
+            for job_id, job_data in zip(queued, await pipeline.execute()):
+                results[job_id] = self._handle_update_result(job_id, job_data)
+
+        return results
 
-        job_dict["updated_at"] = datetime.now(timezone.utc)
+    async def prune_expired_jobs(self, tenant_id: str) -> int:
+        """
+        Removes completed jobs whose retention expired from a tenant's job indexes.
 
+        Args:
+            tenant_id (str): The tenant whose indexes are pruned.
+
+        Returns:
+            int: The number of jobs removed.
+        """
+        completed = JobStatus.COMPLETED
+        index_keys = [
+            self._get_index_key(tenant_id),
+            self._get_index_key(tenant_id, status=completed),
+            *[
+                self._get_index_key(tenant_id, job_type=job_type)
+                for job_type in ProcessingJobType
+            ],
+            *[
+                self._get_index_key(tenant_id, status=completed, job_type=job_type)
+                for job_type in ProcessingJobType
+            ],
+        ]
+        return await self._prune_script(
+            keys=[self._get_expiry_key(tenant_id), *index_keys],
+            args=[time.time(), self.prune_batch_size],
+            client=self.client,
+        )
+
+    def _encode_cursor(self, score: float, job_id: str) -> str:
+        return base64.urlsafe_b64encode(f"{score!r}:{job_id}".encode()).decode()
+
+    def _decode_cursor(self, cursor: str) -> Tuple[float, str]:
         try:
-            updated_job = ProcessingJob(**job_dict)
+            score, job_id = base64.urlsafe_b64decode(cursor).decode().split(":", 1)
+            return float(score), job_id
+        except ValueError as e:
+            raise ValueError(f"Invalid cursor '{cursor}'.") from e
+
+    async def list_jobs(
+        self,
+        tenant_id: str,
+        status: Optional[JobStatus] = None,
+        job_type: Optional[ProcessingJobType] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ProcessingJob], Optional[str]]:
+        """
+        Lists the jobs of a tenant from the newest to the oldest.
+
+        Args:
+            tenant_id (str): The tenant whose jobs are listed.
+            status (Optional[JobStatus]): Only list jobs with this status.
+            job_type (Optional[ProcessingJobType]): Only list jobs of this type.
+            limit (int): Maximum number of jobs to return.
+            cursor (Optional[str]): The cursor returned with the previous page.
+
+        Returns:
+            Tuple[List[ProcessingJob], Optional[str]]: The jobs of the page and
+                the cursor of the next page, None on the last page.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        await self.prune_expired_jobs(tenant_id)
+        index_key = self._get_index_key(tenant_id, status=status, job_type=job_type)
+
+        max_score, after_job_id = "+inf", None
+        if cursor:
+            max_score, after_job_id = self._decode_cursor(cursor)
+
+        # The page starts at the cursor's score, so jobs created at the same time
+        # as the cursor's job and already returned are skipped.
+        entries, offset = [], 0
+        while len(entries) <= limit:
+            page = await self.client.zrange(
+                index_key,
+                max_score,
+                "-inf",
+                desc=True,
+                byscore=True,
+                offset=offset,
+                num=limit + 1,
+                withscores=True,
+            )
+            offset += len(page)
+            entries.extend(
+                (job_id, score)
+                for job_id, score in page
+                if after_job_id is None
+                or score < max_score
+                or job_id < after_job_id
+            )
+            if len(page) <= limit:
+                break
+
+        entries = entries[: limit + 1]
+        pipeline = self.client.pipeline(transaction=False)
+        for job_id, _ in entries[:limit]:
+            pipeline.hgetall(self._get_key(job_id))
+
+        jobs = []
+        for (job_id, _), job_data in zip(entries, await pipeline.execute()):
+            # Jobs can expire between pruning and reading them.
+            if job_data:
+                job = self._parse_job(job_id, job_data)
+                if job:
+                    jobs.append(job)
 
-            job_key = self._get_key(job_id)
-            self.client.set(job_key, updated_job.json())
+        next_cursor = None
+        if len(entries) > limit:
+            last_job_id, last_score = entries[limit - 1]
+            next_cursor = self._encode_cursor(last_score, last_job_id)
+
+        return jobs, next_cursor
+
+    def _handle_update_result(
+        self, job_id: str, job_data: Optional[List[str]]
+    ) -> Optional[ProcessingJob]:
+        if job_data is None:
+            logger.warning(f"Job with ID {job_id} not found in Redis for update.")
+            return None
+
+        updated_job = self._parse_job(
+            job_id, dict(zip(job_data[::2], job_data[1::2]))
+        )
+        if updated_job:
             logger.info(
                 f"Updated job '{job_id}'. New status: {updated_job.status.value}, Stage: {updated_job.job_stage.value}"
             )
-            return updated_job
-        except Exception as e:
-            logger.error(f"Failed to update job '{job_id}' due to invalid data: {e}")
-            return None
+        return updated_job
 
 
 job_manager = _JobStatusManager()
@@ -0,0 +1,237 @@
+import json
+import logging
+
+from redis import Redis, ResponseError
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import settings
+from models import ProcessingJobType, QueuedJob
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+class _JobQueue:
+    """
+    A durable job queue on top of a Redis Stream with a consumer group.
+
+    Jobs stay in the group's pending list until a worker acknowledges them,
+    so a job claimed by a worker that dies is reclaimed by another one once
+    it has been idle for long enough.
+    """
+
+    _client: Redis = None  # The client will be attached at startup
+
+    def __init__(self, stream_key: str, group_name: str, max_length: int):
+        self.stream_key = stream_key
+        self.group_name = group_name
+        self.max_length = max_length
+        self.dead_letter_key = f"{stream_key}:dead"
+
+    def set_client(self, client: Redis):
+        """Attaches the active Redis client to the queue instance."""
+        logger.info("Redis client has been attached to JobQueue.")
+        self._client = client
+
+    @property
+    def client(self) -> Redis:
+        """Provides access to the client, ensuring it has been set."""
+        if self._client is None:
+            raise ConnectionError(
+                "Redis client has not been initialized. The app may be starting up or the connection failed."
+            )
+        return self._client
+
+    def ensure_group(self):
+        """Creates the stream and its consumer group if they don't exist yet."""
+        try:
+            self.client.xgroup_create(
+                name=self.stream_key, groupname=self.group_name, id="0", mkstream=True
+            )
+            logger.info(
+                f"Created consumer group '{self.group_name}' on '{self.stream_key}'."
+            )
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    def enqueue(
+        self, job_id: str, job_type: ProcessingJobType, payload: Dict[str, Any]
+    ) -> str:
+        """
+        Appends a job to the queue.
+
+        Args:
+            job_id (str): The job to process.
+            job_type (ProcessingJobType): Selects the handler that processes the job.
+            payload (Dict[str, Any]): JSON serializable arguments for the handler.
+
+        Returns:
+            str: The id of the queue message.
+        """
+        message_id = self.client.xadd(
+            self.stream_key,
+            {"job_id": job_id, "job_type": job_type.value, "payload": json.dumps(payload)},
+            maxlen=self.max_length,
+            approximate=True,
+        )
+        logger.info(f"Enqueued job '{job_id}' as message '{message_id}'.")
+        return message_id
+
+    def _parse_messages(
+        self, messages: List[Tuple[str, Dict[str, str]]]
+    ) -> List[QueuedJob]:
+        jobs = []
+        for message_id, fields in messages:
+            if not fields:
+                # The message was trimmed from the stream while still pending.
+                self.ack(message_id)
+                continue
+            try:
+                jobs.append(
+                    QueuedJob(
+                        message_id=message_id,
+                        job_id=fields["job_id"],
+                        job_type=ProcessingJobType(fields["job_type"]),
+                        payload=json.loads(fields.get("payload") or "{}"),
+                    )
+                )
+            except Exception as e:
+                logger.error(f"Dropping malformed queue message '{message_id}': {e}")
+                self.dead_letter(message_id, fields, reason=f"Malformed message: {e}")
+        return jobs
+
+    def claim(self, consumer: str, count: int, block_ms: int) -> List[QueuedJob]:
+        """
+        Claims new jobs for a consumer, blocking until some arrive or the timeout passes.
+
+        Args:
+            consumer (str): Unique name of the claiming worker.
+            count (int): Maximum number of jobs to claim.
+            block_ms (int): How long to wait for new jobs.
+
+        Returns:
+            List[QueuedJob]: The claimed jobs.
+        """
+        response = self.client.xreadgroup(
+            groupname=self.group_name,
+            consumername=consumer,
+            streams={self.stream_key: ">"},
+            count=count,
+            block=block_ms,
+        )
+        if not response:
+            return []
+
+        _, messages = response[0]
+        return self._parse_messages(messages)
+
+    def reclaim_stalled(
+        self, consumer: str, min_idle_ms: int, count: int, max_deliveries: int
+    ) -> Tuple[List[QueuedJob], List[QueuedJob]]:
+        """
+        Takes over jobs that another worker claimed but stopped working on.
+
+        Args:
+            consumer (str): Unique name of the claiming worker.
+            min_idle_ms (int): How long a job must have been idle to be reclaimed.
+            count (int): Maximum number of jobs to reclaim.
+            max_deliveries (int): Jobs delivered more often than this are given up on.
+
+        Returns:
+            Tuple[List[QueuedJob], List[QueuedJob]]: The reclaimed jobs to retry and
+            the jobs that exhausted their deliveries. The latter are dead-lettered and
+            acknowledged, the caller only has to record their failure.
+        """
+        _, messages, _ = self.client.xautoclaim(
+            name=self.stream_key,
+            groupname=self.group_name,
+            consumername=consumer,
+            min_idle_time=min_idle_ms,
+            start_id="0-0",
+            count=count,
+        )
+        jobs = self._parse_messages(messages)
+        if not jobs:
+            return [], []
+
+        pipeline = self.client.pipeline()
+        for job in jobs:
+            pipeline.xpending_range(
+                name=self.stream_key,
+                groupname=self.group_name,
+                min=job.message_id,
+                max=job.message_id,
+                count=1,
+            )
+        deliveries = {
+            entry["message_id"]: entry["times_delivered"]
+            for entries in pipeline.execute()
+            for entry in entries
+        }
+
+        retries, exhausted = [], []
+        for job in jobs:
+            job.deliveries = deliveries.get(job.message_id, job.deliveries)
+            if job.deliveries > max_deliveries:
+                self.dead_letter(
+                    job.message_id,
+                    job.model_dump(mode="json"),
+                    reason=f"Exceeded {max_deliveries} delivery attempts",
+                )
+                exhausted.append(job)
+            else:
+                retries.append(job)
+
+        if retries:
+            logger.warning(
+                f"Reclaimed {len(retries)} stalled job(s) for consumer '{consumer}'."
+            )
+        return retries, exhausted
+
+    def heartbeat(self, consumer: str, message_ids: List[str]):
+        """Resets the idle time of jobs still being processed so they aren't reclaimed."""
+        if not message_ids:
+            return
+
+        self.client.xclaim(
+            name=self.stream_key,
+            groupname=self.group_name,
+            consumername=consumer,
+            min_idle_time=0,
+            message_ids=message_ids,
+            justid=True,
+        )
+
+    def ack(self, message_id: str):
+        """Acknowledges a finished job and removes it from the stream."""
+        pipeline = self.client.pipeline()
+        pipeline.xack(self.stream_key, self.group_name, message_id)
+        pipeline.xdel(self.stream_key, message_id)
+        pipeline.execute()
+
+    def dead_letter(
+        self, message_id: str, fields: Dict[str, Any], reason: Optional[str] = None
+    ):
+        """Moves a message that can't be processed to the dead-letter stream."""
+        entry = {key: str(value) for key, value in fields.items()}
+        entry["original_message_id"] = message_id
+        entry["reason"] = reason or ""
+
+        self.client.xadd(
+            self.dead_letter_key, entry, maxlen=self.max_length, approximate=True
+        )
+        self.ack(message_id)
+        logger.error(f"Dead-lettered queue message '{message_id}': {reason}")
+
+
+job_queue = _JobQueue(
+    stream_key=settings.JOB_QUEUE_STREAM if settings else "processing_jobs:stream",
+    group_name=settings.JOB_QUEUE_GROUP if settings else "ingestion_workers",
+    max_length=settings.JOB_QUEUE_MAXLEN if settings else 100000,
+)
@@ -1,16 +1,55 @@
+import os
+import re
+import hashlib
+import zipfile
 import uvicorn
 import logging
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks
+from typing import List, Optional, Tuple
+from fastapi import (
+    FastAPI,
+    UploadFile,
+    File,
+    Header,
+    HTTPException,
+    Depends,
+    Query,
+    Response,
+)
+from fastapi.responses import StreamingResponse
 from starlette.concurrency import run_in_threadpool
 
-from config import settings, connect_to_redis, connect_to_qdrant
-from models import ProcessingJobType, ProcessingJobResponse
-from background_jobs import run_cv_ingestion_job
-from vector_db_manager import vector_db_manager
-from utils import generate_unique_id
+from config import (
+    settings,
+    connect_to_redis,
+    connect_to_async_redis,
+    connect_to_qdrant,
+)
+from models import (
+    JobStatus,
+    JobListResponse,
+    ProcessingJob,
+    ProcessingJobType,
+    ProcessingJobResponse,
+    BatchJobResponse,
+    EmbeddingCacheStats,
+    GitHubSyncRequest,
+    SearchRequest,
+    SearchResponse,
+)
+from services import (
+    embedding_cache,
+    inference_executor,
+    query_embedding_batcher,
+    search_documents,
+    search_result_cache,
+    reranker,
+)
+from vector_db_manager import vector_db_manager, collection_versions
+from utils import generate_unique_id, get_tenant_point_quota, get_upload_path
 
-from job_manager import job_manager
+from job_manager import job_manager, job_events
+from job_queue import job_queue
 
 logging.basicConfig(
     level=logging.INFO,
@@ -26,18 +65,28 @@ async def lifespan(app: FastAPI):
     try:
         logger.info("Startup: connecting to Redis...")
         redis = await run_in_threadpool(connect_to_redis)
+        binary_redis = await run_in_threadpool(connect_to_redis, False)
+        async_redis = await connect_to_async_redis()
     except Exception as exc:
         logger.exception("Startup: failed to connect to Redis. Aborting startup.")
         raise
 
     try:
-        job_manager.set_client(redis)
+        job_manager.set_client(async_redis)
+        job_events.set_client(async_redis)
+        job_queue.set_client(redis)
+        job_queue.ensure_group()
+        embedding_cache.set_client(binary_redis)
+        collection_versions.set_client(redis)
+        search_result_cache.set_client(async_redis)
     except Exception:
         logger.exception(
             "Failed to set redis client on job_manager. Closing redis and aborting."
         )
         try:
             redis.close()
+            binary_redis.close()
+            await async_redis.aclose()
         except Exception:
             logger.exception(
                 "Error while closing redis after failed job_manager.set_client()"
@@ -55,6 +104,8 @@ async def lifespan(app: FastAPI):
         # Cleanup Redis before re-raising so we don't leak resources
         try:
             redis.close()
+            binary_redis.close()
+            await async_redis.aclose()
         except Exception:
             logger.exception(
                 "Error while closing redis during shutdown after qdrant failure"
@@ -67,19 +118,211 @@ async def lifespan(app: FastAPI):
     except Exception:
         logger.exception("Failed to qdrant client to vector db.")
 
+    try:
+        logger.info("Startup: starting the inference executor...")
+        await inference_executor.start()
+    except Exception:
+        logger.exception("Startup: failed to start the inference executor.")
+        redis.close()
+        binary_redis.close()
+        await async_redis.aclose()
+        raise
+
+    query_embedding_batcher.start()
+    job_events.start()
+    if settings.RERANK_ENABLED:
+        reranker.start()
+
     logger.info("Startup: Redis connected and Qdrant reachable. Starting app.")
 
     try:
         yield
     finally:
         # --- Shutdown cleanup ---
+        await job_events.stop()
+        await query_embedding_batcher.stop()
+        await reranker.stop()
+        await inference_executor.stop()
+
         logger.info("Shutdown: closing redis client.")
         try:
             redis.close()
+            binary_redis.close()
+            await async_redis.aclose()
         except Exception:
             logger.exception("Error while closing redis on shutdown")
 
 
+async def _save_upload(
+    file: UploadFile, file_path: str, max_bytes: Optional[int] = None
+) -> Tuple[int, str]:
+    """
+    Streams an uploaded file to the shared upload directory in chunks, so at most
+    one chunk of it is held in memory, and hashes it along the way.
+
+    Returns:
+        Tuple[int, str]: The size in bytes and the SHA-256 of the file.
+
+    Raises:
+        HTTPException: 413 if the file is larger than `max_bytes`, which
+            defaults to UPLOAD_MAX_BYTES.
+    """
+    if max_bytes is None:
+        max_bytes = settings.UPLOAD_MAX_BYTES
+    content_hash = hashlib.sha256()
+    size = 0
+
+    upload_file = await run_in_threadpool(open, file_path, "wb")
+    try:
+        while chunk := await file.read(settings.UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > max_bytes:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"File is larger than {max_bytes} bytes.",
+                )
+            content_hash.update(chunk)
+            await run_in_threadpool(upload_file.write, chunk)
+    except BaseException:
+        await run_in_threadpool(upload_file.close)
+        await run_in_threadpool(os.remove, file_path)
+        raise
+
+    await run_in_threadpool(upload_file.close)
+    return size, content_hash.hexdigest()
+
+
+_ZIP_CONTENT_TYPES = {"application/zip", "application/x-zip-compressed"}
+
+
+def _extract_zip_documents(
+    archive_path: str, max_documents: int, max_bytes: int
+) -> List[Tuple[str, str, int]]:
+    """
+    Extracts the PDF documents of a zip archive to the shared upload directory.
+    Sizes are counted while decompressing, the sizes an archive declares are
+    never trusted.
+
+    Args:
+        archive_path (str): The uploaded archive.
+        max_documents (int): Documents the archive may still add to the batch.
+        max_bytes (int): Bytes the archive may still add to the batch.
+
+    Returns:
+        List[Tuple[str, str, int]]: The job id, path and archive member name of
+            every document.
+
+    Raises:
+        HTTPException: 400 for an invalid archive, 413 if it exceeds the limits.
+    """
+    documents = []
+    try:
+        with zipfile.ZipFile(archive_path) as archive:
+            for member in archive.infolist():
+                name = member.filename
+                if (
+                    member.is_dir()
+                    or name.startswith("__MACOSX/")
+                    or not name.lower().endswith(".pdf")
+                ):
+                    continue
+                if len(documents) >= max_documents:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"A batch holds at most {settings.BATCH_MAX_DOCUMENTS} documents.",
+                    )
+
+                document_job_id = generate_unique_id(prefix="doc")
+                file_path = get_upload_path(document_job_id, extension="pdf")
+                documents.append((document_job_id, file_path, name))
+                with archive.open(member) as source, open(file_path, "wb") as target:
+                    size = 0
+                    while chunk := source.read(settings.UPLOAD_CHUNK_SIZE):
+                        size += len(chunk)
+                        max_bytes -= len(chunk)
+                        if size > settings.UPLOAD_MAX_BYTES or max_bytes < 0:
+                            raise HTTPException(
+                                status_code=413,
+                                detail=f"'{name}' exceeds the size limits of a batch.",
+                            )
+                        target.write(chunk)
+    except zipfile.BadZipFile:
+        _remove_files([file_path for _, file_path, _ in documents])
+        raise HTTPException(status_code=400, detail="Invalid zip archive.")
+    except BaseException:
+        _remove_files([file_path for _, file_path, _ in documents])
+        raise
+
+    return documents
+
+
+def _remove_files(file_paths: List[str]):
+    for file_path in file_paths:
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+
+
+def _resolve_repository_path(repository_path: str) -> str:
+    """
+    Resolves a repository path under the repositories directory.
+
+    Raises:
+        HTTPException: 400 if the path leaves the directory, 404 if it doesn't exist.
+    """
+    root = os.path.realpath(settings.GITHUB_REPOS_DIR)
+    path = os.path.realpath(os.path.join(root, repository_path))
+    if os.path.commonpath([root, path]) != root or path == root:
+        raise HTTPException(status_code=400, detail="Invalid repository path.")
+    if not os.path.exists(path):
+        raise HTTPException(
+            status_code=404, detail=f"Repository '{repository_path}' not found."
+        )
+    return path
+
+
+_TENANT_ID = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.-]{0,63}")
+
+
+def get_tenant_id(
+    x_tenant_id: Optional[str] = Header(
+        None, description="Tenant the request is for, the default tenant if omitted"
+    ),
+) -> str:
+    """Resolves the tenant of a request from its X-Tenant-ID header."""
+    if x_tenant_id is None:
+        return settings.DEFAULT_TENANT_ID
+    if not _TENANT_ID.fullmatch(x_tenant_id):
+        raise HTTPException(status_code=400, detail="Invalid X-Tenant-ID header.")
+    return x_tenant_id
+
+
+async def _check_tenant_quota(tenant_id: str):
+    """
+    Raises:
+        HTTPException: 403 if the tenant already stores as many points as its quota.
+    """
+    quota = get_tenant_point_quota(tenant_id)
+    if not quota:
+        return
+
+    try:
+        stored = await run_in_threadpool(
+            vector_db_manager.count_points, {"tenant_id": tenant_id}
+        )
+    except Exception as e:
+        logger.error(f"Failed to count the chunks of tenant '{tenant_id}': {e}")
+        raise HTTPException(
+            status_code=503, detail="Uploads are currently unavailable."
+        )
+    if stored >= quota:
+        raise HTTPException(
+            status_code=403,
+            detail=f"Tenant '{tenant_id}' has reached its quota of {quota} chunks.",
+        )
+
+
 app = FastAPI(title="Personal GPT Context Engine", version="1.0.0", lifespan=lifespan)
 
 
@@ -90,8 +333,9 @@ app = FastAPI(title="Personal GPT Context Engine", version="1.0.0", lifespan=lif
     status_code=202,
 )
 async def upload_cv(
-    background_tasks: BackgroundTasks,
+    response: Response,
     file: UploadFile = File(..., description="Upload your CV in PDF format"),
+    tenant_id: str = Depends(get_tenant_id),
 ):
 
     if file.content_type != "application/pdf":
@@ -99,37 +343,488 @@ async def upload_cv(
             status_code=400, detail="Invalid file type. Please upload a PDF file."
         )
 
-    file_bytes = await file.read()
+    # The multipart parser spools large files to disk, size is known up front.
+    if file.size is not None and file.size > settings.UPLOAD_MAX_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File is larger than {settings.UPLOAD_MAX_BYTES} bytes.",
+        )
+
+    await _check_tenant_quota(tenant_id)
 
     # Create a unique job ID
     job_id = generate_unique_id(prefix="cv")
 
-    # Create a new job in Redis
-    job = job_manager.create_job(
-        job_id=job_id, job_type=ProcessingJobType.CV_INGESTION, filename=file.filename
-    )
+    # Persist the upload where the ingestion workers can read it
+    file_path = get_upload_path(job_id, extension="pdf")
+    size, content_hash = await _save_upload(file, file_path)
+    logger.info(f"Stored upload '{file.filename}' ({size} bytes, sha256 {content_hash}).")
 
-    # Add cv ingestion job to background
-    background_tasks.add_task(
-        run_cv_ingestion_job,
+    # Create a new job in Redis, unless the same CV is already being or has
+    # been ingested for this tenant. Every CV replaces the tenant's previous
+    # one, so a completed job is only reused while it is the latest one.
+    job, created = await job_manager.create_or_attach_job(
         job_id=job_id,
-        file_bytes=file_bytes,
+        job_type=ProcessingJobType.CV_INGESTION,
+        content_hash=content_hash,
         filename=file.filename,
+        latest_only=True,
+        tenant_id=tenant_id,
     )
+    if not created:
+        await run_in_threadpool(os.remove, file_path)
+        if job.status == JobStatus.COMPLETED:
+            response.status_code = 200
+            message = "This CV has already been ingested."
+        else:
+            message = "This CV is already being processed."
+        return ProcessingJobResponse(message=message, success=True, data=job)
+
+    # Hand the cv ingestion job over to the ingestion workers
+    try:
+        job_queue.enqueue(
+            job_id=job_id,
+            job_type=ProcessingJobType.CV_INGESTION,
+            payload={
+                "file_path": file_path,
+                "filename": file.filename,
+                "tenant_id": tenant_id,
+            },
+        )
+    except Exception as e:
+        logger.error(f"Failed to enqueue job '{job_id}': {e}", exc_info=True)
+        await job_manager.update_job(
+            job_id=job_id,
+            updates={
+                "status": JobStatus.FAILED,
+                "errorMsg": "Failed to queue the job for processing.",
+            },
+        )
+        await run_in_threadpool(os.remove, file_path)
+        raise HTTPException(
+            status_code=503, detail="Could not queue the CV for processing."
+        )
 
     # prepare a response
-    response = ProcessingJobResponse(
+    return ProcessingJobResponse(
         message="CV upload successful. Processing has started.",
         success=True,
         data=job,
     )
 
+
+@app.post(
+    "/api/v1/upload/batch",
+    summary="Upload many documents, or zip archives of them, for processing",
+    response_model=BatchJobResponse,
+    status_code=202,
+)
+async def upload_batch(
+    files: List[UploadFile] = File(
+        ..., description="PDF documents, or zip archives of PDF documents"
+    ),
+    tenant_id: str = Depends(get_tenant_id),
+):
+
+    await _check_tenant_quota(tenant_id)
+
+    job_id = generate_unique_id(prefix="batch")
+    # The job id, path and name of every document.
+    documents: List[Tuple[str, str, str]] = []
+    remaining_bytes = settings.BATCH_MAX_BYTES
+    try:
+        for index, file in enumerate(files):
+            if remaining_bytes <= 0:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"A batch holds at most {settings.BATCH_MAX_BYTES} bytes.",
+                )
+            remaining_documents = settings.BATCH_MAX_DOCUMENTS - len(documents)
+            is_zip = file.content_type in _ZIP_CONTENT_TYPES or (
+                file.filename or ""
+            ).lower().endswith(".zip")
+
+            if is_zip:
+                archive_path = get_upload_path(f"{job_id}_{index}", extension="zip")
+                await _save_upload(file, archive_path, max_bytes=remaining_bytes)
+                try:
+                    extracted = await run_in_threadpool(
+                        _extract_zip_documents,
+                        archive_path,
+                        remaining_documents,
+                        remaining_bytes,
+                    )
+                finally:
+                    await run_in_threadpool(os.remove, archive_path)
+                documents.extend(extracted)
+                remaining_bytes -= sum(
+                    os.path.getsize(file_path) for _, file_path, _ in extracted
+                )
+                continue
+
+            if file.content_type != "application/pdf":
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Invalid file type of '{file.filename}'. Please upload PDF or zip files.",
+                )
+            if remaining_documents <= 0:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"A batch holds at most {settings.BATCH_MAX_DOCUMENTS} documents.",
+                )
+
+            document_job_id = generate_unique_id(prefix="doc")
+            file_path = get_upload_path(document_job_id, extension="pdf")
+            size, _ = await _save_upload(
+                file,
+                file_path,
+                max_bytes=min(settings.UPLOAD_MAX_BYTES, remaining_bytes),
+            )
+            documents.append((document_job_id, file_path, file.filename))
+            remaining_bytes -= size
+
+        if not documents:
+            raise HTTPException(
+                status_code=400, detail="The upload holds no PDF documents."
+            )
+        # Documents are identified by name, a second one would replace the first.
+        names = [name for _, _, name in documents]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Document names must be unique, got several {duplicates}.",
+            )
+    except BaseException:
+        await run_in_threadpool(
+            _remove_files, [file_path for _, file_path, _ in documents]
+        )
+        raise
+
+    job, document_jobs = await job_manager.create_batch_job(
+        job_id=job_id,
+        documents=[(document_job_id, name) for document_job_id, _, name in documents],
+        tenant_id=tenant_id,
+    )
+
+    # The batch is processed as a single job, so its documents share batches.
+    try:
+        job_queue.enqueue(
+            job_id=job_id,
+            job_type=ProcessingJobType.BATCH_INGESTION,
+            payload={
+                "documents": [
+                    {
+                        "job_id": document_job_id,
+                        "file_path": file_path,
+                        "filename": name,
+                    }
+                    for document_job_id, file_path, name in documents
+                ],
+                "tenant_id": tenant_id,
+            },
+        )
+    except Exception as e:
+        logger.error(f"Failed to enqueue job '{job_id}': {e}", exc_info=True)
+        failure = {
+            "status": JobStatus.FAILED,
+            "errorMsg": "Failed to queue the job for processing.",
+        }
+        await job_manager.update_jobs(
+            {
+                job_id: failure,
+                **{document_job.job_id: failure for document_job in document_jobs},
+            }
+        )
+        await run_in_threadpool(
+            _remove_files, [file_path for _, file_path, _ in documents]
+        )
+        raise HTTPException(
+            status_code=503, detail="Could not queue the documents for processing."
+        )
+
+    return BatchJobResponse(
+        message=f"{len(documents)} documents uploaded. Processing has started.",
+        success=True,
+        data=job,
+        documents=document_jobs,
+    )
+
+
+@app.post(
+    "/api/v1/upload/linkedin",
+    summary="Upload a LinkedIn data export for processing",
+    response_model=ProcessingJobResponse,
+    status_code=202,
+)
+async def upload_linkedin_export(
+    response: Response,
+    file: UploadFile = File(..., description="Your LinkedIn data export zip archive"),
+    tenant_id: str = Depends(get_tenant_id),
+):
+
+    if file.content_type not in _ZIP_CONTENT_TYPES and not (
+        file.filename or ""
+    ).lower().endswith(".zip"):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid file type. Please upload the zip archive of the export.",
+        )
+
+    await _check_tenant_quota(tenant_id)
+
+    job_id = generate_unique_id(prefix="linkedin")
+    file_path = get_upload_path(job_id, extension="zip")
+    size, content_hash = await _save_upload(
+        file, file_path, max_bytes=settings.LINKEDIN_MAX_BYTES
+    )
+    logger.info(
+        f"Stored LinkedIn export '{file.filename}' ({size} bytes, sha256 {content_hash})."
+    )
+
+    # Every export replaces the tenant's previous one, like CVs.
+    job, created = await job_manager.create_or_attach_job(
+        job_id=job_id,
+        job_type=ProcessingJobType.LINKEDIN_PROFILE_INGESTION,
+        content_hash=content_hash,
+        filename=file.filename,
+        latest_only=True,
+        tenant_id=tenant_id,
+    )
+    if not created:
+        await run_in_threadpool(os.remove, file_path)
+        if job.status == JobStatus.COMPLETED:
+            response.status_code = 200
+            message = "This LinkedIn export has already been ingested."
+        else:
+            message = "This LinkedIn export is already being processed."
+        return ProcessingJobResponse(message=message, success=True, data=job)
+
+    try:
+        job_queue.enqueue(
+            job_id=job_id,
+            job_type=ProcessingJobType.LINKEDIN_PROFILE_INGESTION,
+            payload={
+                "file_path": file_path,
+                "filename": file.filename,
+                "tenant_id": tenant_id,
+            },
+        )
+    except Exception as e:
+        logger.error(f"Failed to enqueue job '{job_id}': {e}", exc_info=True)
+        await job_manager.update_job(
+            job_id=job_id,
+            updates={
+                "status": JobStatus.FAILED,
+                "errorMsg": "Failed to queue the job for processing.",
+            },
+        )
+        await run_in_threadpool(os.remove, file_path)
+        raise HTTPException(
+            status_code=503,
+            detail="Could not queue the LinkedIn export for processing.",
+        )
+
+    return ProcessingJobResponse(
+        message="LinkedIn export upload successful. Processing has started.",
+        success=True,
+        data=job,
+    )
+
+
+@app.post(
+    "/api/v1/github/sync",
+    summary="Sync a git repository, a clone or a bundle, into the stored context",
+    response_model=ProcessingJobResponse,
+    status_code=202,
+)
+async def sync_github_repository(
+    request: GitHubSyncRequest, tenant_id: str = Depends(get_tenant_id)
+):
+
+    repository_path = await run_in_threadpool(
+        _resolve_repository_path, request.repository_path
+    )
+    repository = request.name or os.path.splitext(os.path.basename(repository_path))[0]
+
+    await _check_tenant_quota(tenant_id)
+
+    job_id = generate_unique_id(prefix="github")
+    job = await job_manager.create_job(
+        job_id=job_id,
+        job_type=ProcessingJobType.GITHUB_REPO_INGESTION,
+        filename=repository,
+        tenant_id=tenant_id,
+    )
+
+    # Syncs are incremental, only files changed since the last one are ingested.
+    try:
+        job_queue.enqueue(
+            job_id=job_id,
+            job_type=ProcessingJobType.GITHUB_REPO_INGESTION,
+            payload={
+                "repository_path": repository_path,
+                "repository": repository,
+                "ref": request.ref,
+                "tenant_id": tenant_id,
+            },
+        )
+    except Exception as e:
+        logger.error(f"Failed to enqueue job '{job_id}': {e}", exc_info=True)
+        await job_manager.update_job(
+            job_id=job_id,
+            updates={
+                "status": JobStatus.FAILED,
+                "errorMsg": "Failed to queue the job for processing.",
+            },
+        )
+        raise HTTPException(
+            status_code=503, detail="Could not queue the repository for syncing."
+        )
+
+    return ProcessingJobResponse(
+        message=f"Repository '{repository}' queued. Syncing has started.",
+        success=True,
+        data=job,
+    )
+
+
+@app.post(
+    "/api/v1/search",
+    summary="Semantic search over the stored context",
+    response_model=SearchResponse,
+)
+async def search(request: SearchRequest, tenant_id: str = Depends(get_tenant_id)):
+
+    # Filters on fields without an index would scan every point of the tenant.
+    unknown = sorted(set(request.filters or {}) - vector_db_manager.filterable_fields)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot filter on {unknown}, filterable fields are "
+            f"{sorted(vector_db_manager.filterable_fields)}.",
+        )
+
+    try:
+        results = await search_documents(
+            query=request.query,
+            limit=request.limit,
+            hybrid=request.hybrid,
+            tenant_id=tenant_id,
+            metadata_filter=request.filters,
+            rerank=request.rerank,
+            rerank_budget_ms=request.rerank_budget_ms,
+        )
+    except Exception as e:
+        logger.error(f"Search failed for query '{request.query}': {e}", exc_info=True)
+        raise HTTPException(status_code=503, detail="Search is currently unavailable.")
+
+    response = SearchResponse(
+        message=f"Found {len(results)} matching chunks.",
+        success=True,
+        data=results,
+    )
+
     return response
 
 
-@app.get("/api/v1/jobs", summary="Fetch all job summary status")
-async def subscribe_to_job_status():
-    return
+@app.get(
+    "/api/v1/embedding-cache/stats",
+    summary="Hit and miss counters of the embedding cache",
+    response_model=EmbeddingCacheStats,
+)
+async def get_embedding_cache_stats():
+
+    stats = await run_in_threadpool(embedding_cache.get_stats)
+    lookups = stats["hits"] + stats["misses"]
+
+    return EmbeddingCacheStats(
+        hits=stats["hits"],
+        misses=stats["misses"],
+        hit_rate=stats["hits"] / lookups if lookups else 0.0,
+    )
+
+
+@app.get(
+    "/api/v1/jobs/list",
+    summary="List jobs, newest first, with optional filters",
+    response_model=JobListResponse,
+)
+async def list_jobs(
+    status: Optional[JobStatus] = Query(None, description="Only list jobs with this status"),
+    job_type: Optional[ProcessingJobType] = Query(
+        None, description="Only list jobs of this type"
+    ),
+    limit: int = Query(50, ge=1, le=200, description="Maximum number of jobs"),
+    cursor: Optional[str] = Query(None, description="Cursor of the page to fetch"),
+    tenant_id: str = Depends(get_tenant_id),
+):
+
+    try:
+        jobs, next_cursor = await job_manager.list_jobs(
+            tenant_id=tenant_id,
+            status=status,
+            job_type=job_type,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return JobListResponse(
+        message=f"Found {len(jobs)} jobs.",
+        success=True,
+        data=jobs,
+        next_cursor=next_cursor,
+    )
+
+
+async def _get_tenant_job(job_id: str, tenant_id: str) -> Optional[ProcessingJob]:
+    """Returns a job, None if it doesn't exist or belongs to another tenant."""
+    job = await job_manager.get_job(job_id)
+    # Jobs created before tenants existed belong to the default tenant.
+    if job is None or (job.tenant_id or settings.DEFAULT_TENANT_ID) != tenant_id:
+        return None
+    return job
+
+
+def _format_job_event(job: ProcessingJob) -> str:
+    """Formats a job update as a Server-Sent Event."""
+    return f"event: job\nid: {job.job_id}\ndata: {job.model_dump_json()}\n\n"
+
+
+@app.get("/api/v1/jobs", summary="Stream job status updates as Server-Sent Events")
+async def subscribe_to_job_status(
+    job_id: Optional[str] = Query(None, description="Only stream updates of this job"),
+    tenant_id: str = Depends(get_tenant_id),
+):
+
+    if job_id is not None and await _get_tenant_job(job_id, tenant_id) is None:
+        # Another tenant's job is reported as missing, not as forbidden.
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found.")
+
+    async def event_stream():
+        # Subscribe before reading the current state so no update is missed.
+        async with job_events.subscribe(
+            tenant_id=tenant_id, job_id=job_id
+        ) as subscription:
+            if job_id is not None:
+                job = await _get_tenant_job(job_id, tenant_id)
+                if job:
+                    yield _format_job_event(job)
+
+            while True:
+                job = await subscription.get(
+                    timeout=settings.JOB_EVENTS_KEEPALIVE_SECONDS
+                )
+                # A comment line keeps proxies from closing an idle stream.
+                yield _format_job_event(job) if job else ": keep-alive\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 def main():
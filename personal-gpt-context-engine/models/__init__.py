@@ -4,5 +4,10 @@ from .jobs import (
     ProcessingJob,
     JobStage,
     ProcessingJobResponse,
+    BatchJobResponse,
+    JobListResponse,
     EmbeddingType,
+    QueuedJob,
 )
+from .search import SearchRequest, SearchResult, SearchResponse, EmbeddingCacheStats
+from .github import GitHubSyncRequest
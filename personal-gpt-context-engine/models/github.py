@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field
+
+from typing import Optional
+
+
+class GitHubSyncRequest(BaseModel):
+    """
+    Request model for syncing a git repository into the stored context.
+    """
+
+    repository_path: str = Field(
+        ...,
+        min_length=1,
+        description="Clone directory or bundle file, relative to GITHUB_REPOS_DIR",
+    )
+    ref: str = Field(
+        "HEAD",
+        min_length=1,
+        max_length=255,
+        pattern=r"^[^-\s][^\s]*$",
+        description="Branch, tag or commit to sync",
+    )
+    name: Optional[str] = Field(
+        None,
+        min_length=1,
+        max_length=255,
+        description="Name the repository is stored under, defaults to its directory name",
+    )
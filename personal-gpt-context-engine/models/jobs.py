@@ -2,7 +2,7 @@ from pydantic import BaseModel, Field
 from enum import Enum
 from datetime import datetime, timezone
 
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 
 class EmbeddingType(str, Enum):
@@ -44,6 +44,8 @@ class ProcessingJobType(str, Enum):
     CV_INGESTION = "CV_INGESTION"
     GITHUB_REPO_INGESTION = "GITHUB_REPO_INGESTION"
     LINKEDIN_PROFILE_INGESTION = "LINKEDIN_PROFILE_INGESTION"
+    BATCH_INGESTION = "BATCH_INGESTION"
+    DOCUMENT_INGESTION = "DOCUMENT_INGESTION"
 
 
 class ProcessingJob(BaseModel):
@@ -58,6 +60,21 @@ class ProcessingJob(BaseModel):
     details: str = Field(..., description="Details about the job")
     errorMsg: Optional[str] = Field(None, description="Error message if the job failed")
     filename: Optional[str] = None
+    content_hash: Optional[str] = Field(
+        None, description="SHA-256 of the uploaded file"
+    )
+    tenant_id: Optional[str] = Field(None, description="Tenant the job ingests for")
+    parent_job_id: Optional[str] = Field(
+        None, description="The batch job this document job belongs to"
+    )
+    total_documents: Optional[int] = Field(None, description="Documents of a batch job")
+    completed_documents: Optional[int] = Field(
+        None, description="Documents of a batch job that were ingested"
+    )
+    failed_documents: Optional[int] = Field(
+        None, description="Documents of a batch job that failed"
+    )
+    commit: Optional[str] = Field(None, description="Commit a repository job synced")
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
         description="Timestamp when the job was created",
@@ -76,3 +93,41 @@ class ProcessingJobResponse(BaseModel):
     data: ProcessingJob = Field(..., description="Processing job details")
     message: str = Field(..., description="Response message")
     success: bool = Field(..., description="Indicates if the request was successful")
+
+
+class BatchJobResponse(BaseModel):
+    """
+    Response model for a batch upload: the batch job and one job per document.
+    """
+
+    data: ProcessingJob = Field(..., description="The batch job")
+    documents: List[ProcessingJob] = Field(..., description="The document jobs")
+    message: str = Field(..., description="Response message")
+    success: bool = Field(..., description="Indicates if the request was successful")
+
+
+class JobListResponse(BaseModel):
+    """
+    Response model for a page of processing jobs.
+    """
+
+    data: List[ProcessingJob] = Field(..., description="Jobs, newest first")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor of the next page, null on the last page"
+    )
+    message: str = Field(..., description="Response message")
+    success: bool = Field(..., description="Indicates if the request was successful")
+
+
+class QueuedJob(BaseModel):
+    """
+    A job message claimed from the processing job queue.
+    """
+
+    message_id: str = Field(..., description="Identifier of the queue message")
+    job_id: str = Field(..., description="Identifier of the queued job")
+    job_type: ProcessingJobType = Field(..., description="Type of the processing job")
+    payload: Dict[str, Any] = Field(
+        default_factory=dict, description="Arguments for the job handler"
+    )
+    deliveries: int = Field(1, description="Number of times the job was delivered")
@@ -0,0 +1,77 @@
+from pydantic import BaseModel, Field
+
+from typing import Any, Dict, List, Optional, Union
+
+
+class SearchRequest(BaseModel):
+    """
+    Request model for a semantic search over the stored context.
+    """
+
+    query: str = Field(..., min_length=1, description="Natural language query")
+    limit: Optional[int] = Field(
+        None, ge=1, le=50, description="Maximum number of results to return"
+    )
+    hybrid: Optional[bool] = Field(
+        None,
+        description="Fuse dense and keyword (BM25) results, defaults to SEARCH_HYBRID",
+    )
+    rerank: Optional[bool] = Field(
+        None,
+        description="Re-rank the results with a cross-encoder, defaults to RERANK_ENABLED",
+    )
+    rerank_budget_ms: Optional[int] = Field(
+        None,
+        ge=1,
+        le=10000,
+        description=(
+            "Milliseconds after which results are returned un-reranked, "
+            "defaults to RERANK_BUDGET_MS"
+        ),
+    )
+    filters: Optional[Dict[str, Union[int, str, List[Union[int, str]]]]] = Field(
+        None,
+        description=(
+            'Only return chunks whose metadata matches, e.g. {"company": "Acme", '
+            '"years": 2021}; a list matches any of its values'
+        ),
+    )
+
+
+class SearchResult(BaseModel):
+    """
+    A single chunk returned by a semantic search.
+    """
+
+    id: str = Field(..., description="Identifier of the stored point")
+    score: float = Field(
+        ...,
+        description=(
+            "Similarity score of the chunk, its fused rank score in a hybrid search, "
+            "or its cross-encoder score when re-ranked"
+        ),
+    )
+    text_chunk: str = Field(..., description="The stored text chunk")
+    metadata: Dict[str, Any] = Field(
+        default_factory=dict, description="Metadata stored alongside the chunk"
+    )
+
+
+class SearchResponse(BaseModel):
+    """
+    Response model for a semantic search.
+    """
+
+    data: List[SearchResult] = Field(..., description="Matching chunks")
+    message: str = Field(..., description="Response message")
+    success: bool = Field(..., description="Indicates if the request was successful")
+
+
+class EmbeddingCacheStats(BaseModel):
+    """
+    Hit and miss counters of the chunk embedding cache.
+    """
+
+    hits: int = Field(..., description="Chunks whose embedding was found in the cache")
+    misses: int = Field(..., description="Chunks that had to be embedded")
+    hit_rate: float = Field(..., description="Fraction of lookups that were hits")
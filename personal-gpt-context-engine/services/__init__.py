@@ -1,2 +1,28 @@
-from .resume_parser import extract_text_from_pdf
-from .vectorization import process_and_store_text, load_embedding_model
+from .resume_parser import (
+    extract_text_from_pdf,
+    iter_pdf_pages,
+    warm_up_page_pool,
+    shutdown_page_pool,
+)
+from .vectorization import (
+    process_and_store_text,
+    IngestionPipeline,
+    PipelineDocument,
+    embed_documents,
+    embedding_cache,
+    load_embedding_model,
+    inference_executor,
+    query_embedding_batcher,
+    get_text_chunker,
+    get_code_splitter,
+    get_language,
+)
+from .github import (
+    GitError,
+    GitRepository,
+    RepositoryFile,
+    is_binary,
+    is_ingestible,
+)
+from .linkedin import LinkedInRecord, read_linkedin_export
+from .retrieval import search_documents, search_result_cache, reranker
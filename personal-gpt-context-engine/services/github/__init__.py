@@ -0,0 +1,7 @@
+from .repository import (
+    GitError,
+    GitRepository,
+    RepositoryFile,
+    is_binary,
+    is_ingestible,
+)
@@ -0,0 +1,270 @@
+import os
+import asyncio
+import logging
+import posixpath
+import shutil
+import tempfile
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, NamedTuple, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+# Directories holding dependencies, build output or tooling state rather than
+# the code of the repository itself.
+VENDORED_DIRECTORIES = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".idea",
+        ".vscode",
+        ".venv",
+        "venv",
+        "env",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".tox",
+        "site-packages",
+        "node_modules",
+        "bower_components",
+        "jspm_packages",
+        "vendor",
+        "third_party",
+        "third-party",
+        "Pods",
+        "Carthage",
+        "dist",
+        "build",
+        "target",
+        "out",
+        ".next",
+        ".nuxt",
+        "coverage",
+    }
+)
+
+BINARY_EXTENSIONS = frozenset(
+    {
+        ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".icns", ".webp", ".svg",
+        ".psd", ".tif", ".tiff", ".heic", ".mp3", ".mp4", ".wav", ".ogg", ".flac",
+        ".mov", ".avi", ".mkv", ".webm", ".pdf", ".doc", ".docx", ".xls", ".xlsx",
+        ".ppt", ".pptx", ".zip", ".tar", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".rar",
+        ".jar", ".war", ".whl", ".egg", ".so", ".dll", ".dylib", ".exe", ".bin",
+        ".o", ".a", ".lib", ".class", ".pyc", ".pyo", ".wasm", ".ttf", ".otf",
+        ".woff", ".woff2", ".eot", ".db", ".sqlite", ".sqlite3", ".parquet",
+        ".npy", ".npz", ".pkl", ".pt", ".onnx", ".safetensors", ".h5", ".map",
+    }
+)  # fmt: skip
+
+# Generated files that are large, change often and say little about the code.
+LOCK_FILES = frozenset(
+    {
+        "package-lock.json",
+        "yarn.lock",
+        "pnpm-lock.yaml",
+        "poetry.lock",
+        "uv.lock",
+        "Pipfile.lock",
+        "Cargo.lock",
+        "Gemfile.lock",
+        "composer.lock",
+        "go.sum",
+    }
+)
+
+
+class GitError(Exception):
+    """A git command failed."""
+
+
+class RepositoryFile(NamedTuple):
+    """A file of a commit and the hash of its content."""
+
+    path: str
+    blob: str
+    size: int
+
+
+def is_ingestible(file: RepositoryFile, max_bytes: int) -> bool:
+    """
+    Whether a file is worth ingesting, judged from its path and size only:
+    binaries, vendored directories, lock files, minified and oversized files
+    are skipped.
+    """
+    directories, name = posixpath.split(file.path)
+    if any(part in VENDORED_DIRECTORIES for part in directories.split("/")):
+        return False
+    extension = posixpath.splitext(name)[1].lower()
+    if extension in BINARY_EXTENSIONS or name in LOCK_FILES:
+        return False
+    if name.endswith((".min.js", ".min.css")):
+        return False
+    return 0 < file.size <= max_bytes
+
+
+def is_binary(content: bytes) -> bool:
+    """Whether content looks binary, like git itself decides: a NUL byte early on."""
+    return b"\0" in content[:8000]
+
+
+async def _git(*args: str, cwd: Optional[str] = None) -> bytes:
+    process = await asyncio.create_subprocess_exec(
+        "git",
+        *args,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        raise GitError(
+            f"git {args[0]} failed: {stderr.decode('utf-8', 'replace').strip()}"
+        )
+    return stdout
+
+
+class BlobReader:
+    """
+    Reads blobs through a pool of long-running `git cat-file --batch`
+    processes, so many files are read in parallel without starting a process
+    per file.
+    """
+
+    def __init__(self, git_dir: str, workers: int):
+        self.git_dir = git_dir
+        self.workers = max(1, workers)
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._processes: List[asyncio.subprocess.Process] = []
+
+    async def start(self):
+        for _ in range(self.workers):
+            self._idle.put_nowait(await self._spawn())
+
+    async def _spawn(self) -> asyncio.subprocess.Process:
+        process = await asyncio.create_subprocess_exec(
+            "git",
+            "cat-file",
+            "--batch",
+            cwd=self.git_dir,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        self._processes.append(process)
+        return process
+
+    async def close(self):
+        for process in self._processes:
+            if process.returncode is None:
+                process.stdin.close()
+                try:
+                    await asyncio.wait_for(process.wait(), timeout=5)
+                except asyncio.TimeoutError:
+                    process.kill()
+        self._processes.clear()
+
+    async def read(self, blob: str) -> bytes:
+        """
+        Reads the content of a blob.
+
+        Raises:
+            GitError: If the blob doesn't exist.
+        """
+        process = await self._idle.get()
+        try:
+            process.stdin.write(f"{blob}\n".encode())
+            await process.stdin.drain()
+            header = (await process.stdout.readline()).split()
+            if len(header) != 3:
+                raise GitError(f"Blob {blob} is missing from the repository.")
+            # The content is followed by a newline.
+            content = await process.stdout.readexactly(int(header[2]) + 1)
+        except BaseException:
+            # The process may be left in the middle of a response, replace it.
+            process.kill()
+            self._idle.put_nowait(await self._spawn())
+            raise
+
+        self._idle.put_nowait(process)
+        return content[:-1]
+
+
+class GitRepository:
+    """
+    A git repository, read from its object database rather than a working tree,
+    so a commit is read exactly as it was committed.
+    """
+
+    def __init__(self, git_dir: str):
+        self.git_dir = git_dir
+
+    @classmethod
+    @asynccontextmanager
+    async def open(cls, path: str) -> AsyncIterator["GitRepository"]:
+        """
+        Opens a clone, bare or not, or a bundle, which is cloned into a
+        temporary directory for the duration of the context.
+
+        Args:
+            path (str): The clone directory or bundle file.
+        """
+        if os.path.isfile(path):
+            clone_dir = await run_in_threadpool(tempfile.mkdtemp, prefix="bundle-")
+            try:
+                await _git("clone", "--bare", "--quiet", "--", path, clone_dir)
+                yield cls(clone_dir)
+            finally:
+                await run_in_threadpool(shutil.rmtree, clone_dir, True)
+            return
+
+        git_dir = (await _git("rev-parse", "--absolute-git-dir", cwd=path)).decode()
+        yield cls(git_dir.strip())
+
+    async def resolve(self, ref: str = "HEAD") -> str:
+        """Resolves a branch, tag or commit to the hash of its commit."""
+        commit = await _git(
+            "rev-parse", "--verify", "--end-of-options", f"{ref}^{{commit}}",
+            cwd=self.git_dir,
+        )  # fmt: skip
+        return commit.decode().strip()
+
+    async def list_files(self, commit: str) -> List[RepositoryFile]:
+        """
+        Lists the files of a commit with the hash and size of their content.
+        Submodules and symbolic links are left out.
+        """
+        output = await _git(
+            "ls-tree", "-r", "-z", "--long", "--full-tree", commit, cwd=self.git_dir
+        )
+        files = []
+        for entry in output.split(b"\0"):
+            if not entry:
+                continue
+            info, path = entry.split(b"\t", 1)
+            mode, object_type, blob, size = info.split()
+            if object_type != b"blob" or mode == b"120000":
+                continue
+            files.append(
+                RepositoryFile(
+                    path.decode("utf-8", "replace"), blob.decode(), int(size)
+                )
+            )
+        return files
+
+    @asynccontextmanager
+    async def blob_reader(self, workers: int) -> AsyncIterator[BlobReader]:
+        """Runs a pool of `workers` blob reading processes for the context."""
+        reader = BlobReader(self.git_dir, workers)
+        try:
+            await reader.start()
+            yield reader
+        finally:
+            await reader.close()
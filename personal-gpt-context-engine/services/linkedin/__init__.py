@@ -0,0 +1 @@
+from .export import LinkedInRecord, read_linkedin_export
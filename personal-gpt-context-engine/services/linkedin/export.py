@@ -0,0 +1,230 @@
+import io
+import re
+import csv
+import json
+import logging
+import itertools
+import posixpath
+import zipfile
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from utils import generate_deterministic_id
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+_YEAR = re.compile(r"\b(19|20)\d{2}\b")
+
+
+class LinkedInRecord(NamedTuple):
+    """
+    A single entry of a LinkedIn export, such as a position or a skill.
+
+    `metadata` holds the typed fields retrieval filters on, and a `record_key`
+    that changes whenever the fields of the entry in the export do.
+    """
+
+    record_type: str
+    text: str
+    metadata: Dict[str, Any]
+
+
+def _year(value: Optional[str]) -> Optional[int]:
+    match = _YEAR.search(value or "")
+    return int(match.group(0)) if match else None
+
+
+def _period(row: Dict[str, str], open_ended: bool = False) -> Dict[str, Any]:
+    """
+    The start, end and every year in between of a dated entry. An `open_ended`
+    entry without an end, such as a position held, is current and lasts until
+    this year.
+    """
+    started_on = row.get("Started On") or ""
+    finished_on = row.get("Finished On") or ""
+    start_year = _year(started_on)
+    end_year = _year(finished_on)
+    ended_on = finished_on or ("Present" if open_ended else "?")
+    fields = {
+        "start_year": start_year,
+        "end_year": end_year,
+        "period": f"{started_on or '?'} - {ended_on}",
+    }
+    last_year = end_year
+    if open_ended:
+        fields["current"] = start_year is not None and not finished_on
+        if fields["current"]:
+            last_year = datetime.now(timezone.utc).year
+    if start_year is not None:
+        fields["years"] = list(range(start_year, max(start_year, last_year or 0) + 1))
+    return fields
+
+
+def _position(row: Dict[str, str]) -> Optional[LinkedInRecord]:
+    company, title = row.get("Company Name"), row.get("Title")
+    if not company and not title:
+        return None
+    period = _period(row, open_ended=True)
+    lines = [
+        f"Position: {title or 'Unknown title'} at {company or 'unknown company'}",
+        f"Period: {period.pop('period')}",
+    ]
+    if row.get("Location"):
+        lines.append(f"Location: {row['Location']}")
+    if row.get("Description"):
+        lines.append(row["Description"])
+    return LinkedInRecord(
+        "position",
+        "\n".join(lines),
+        {"company": company, "title": title, "location": row.get("Location"), **period},
+    )
+
+
+def _skill(row: Dict[str, str]) -> Optional[LinkedInRecord]:
+    name = row.get("Name")
+    if not name:
+        return None
+    return LinkedInRecord("skill", f"Skill: {name}", {"skill": name})
+
+
+def _project(row: Dict[str, str]) -> Optional[LinkedInRecord]:
+    title = row.get("Title")
+    if not title:
+        return None
+    period = _period(row)
+    lines = [f"Project: {title}", f"Period: {period.pop('period')}"]
+    if row.get("Url"):
+        lines.append(f"URL: {row['Url']}")
+    if row.get("Description"):
+        lines.append(row["Description"])
+    return LinkedInRecord(
+        "project", "\n".join(lines), {"title": title, "url": row.get("Url"), **period}
+    )
+
+
+# The files of an export that are read, by name without extension, with the
+# column that starts their header row and the function building their records.
+_RECORD_FILES: Dict[str, tuple] = {
+    "positions": ("Company Name", _position),
+    "skills": ("Name", _skill),
+    "projects": ("Title", _project),
+}
+
+
+def _csv_rows(member: io.BufferedIOBase, header: str) -> Iterator[Dict[str, str]]:
+    lines = io.TextIOWrapper(member, encoding="utf-8-sig", errors="replace")
+    # Some export files start with notes before the header row.
+    lines = itertools.dropwhile(lambda line: header not in line, lines)
+    for row in csv.DictReader(lines):
+        yield {key.strip(): (value or "").strip() for key, value in row.items() if key}
+
+
+def _json_rows(member: io.BufferedIOBase) -> Iterator[Dict[str, str]]:
+    data = json.load(member)
+    rows = next(iter(data.values()), []) if isinstance(data, dict) else data
+    for row in rows if isinstance(rows, list) else []:
+        if isinstance(row, dict):
+            yield {
+                str(key).strip(): str(value).strip()
+                for key, value in row.items()
+                if value is not None
+            }
+
+
+# Fields derived from the dates of an entry, and for current positions from the
+# day the export is read, so the record key holds the raw dates instead.
+_PERIOD_FIELDS = {"start_year", "end_year", "current", "years"}
+_DATE_COLUMNS = ("Started On", "Finished On")
+
+
+def _record_key(record_type: str, fields: Dict[str, Any]) -> str:
+    return generate_deterministic_id(
+        record_type, *[f"{key}={value}" for key, value in sorted(fields.items())]
+    )
+
+
+def read_linkedin_export(
+    archive_path: str, max_records: int, max_file_bytes: int
+) -> List[LinkedInRecord]:
+    """
+    Reads the positions, skills and projects of a LinkedIn data export.
+
+    The archive is streamed: only the files holding records are decompressed,
+    row by row, and everything else it holds (messages, connections, media)
+    is never read.
+
+    Args:
+        archive_path (str): Path of the export zip archive.
+        max_records (int): Records read at most, the rest is skipped.
+        max_file_bytes (int): Uncompressed size above which a file is skipped.
+
+    Returns:
+        List[LinkedInRecord]: The records, without the empty and duplicate ones.
+
+    Raises:
+        zipfile.BadZipFile: If the file isn't a zip archive.
+    """
+    records: List[LinkedInRecord] = []
+    record_keys = set()
+    with zipfile.ZipFile(archive_path) as archive:
+        for info in archive.infolist():
+            stem, extension = posixpath.splitext(posixpath.basename(info.filename))
+            extension = extension.lower()
+            record_file = _RECORD_FILES.get(stem.lower())
+            if info.is_dir() or not record_file or extension not in (".csv", ".json"):
+                continue
+            if info.file_size > max_file_bytes:
+                logger.warning(
+                    f"Skipping '{info.filename}' of the LinkedIn export, "
+                    f"{info.file_size} bytes is over the limit."
+                )
+                continue
+
+            header, build_record = record_file
+            with archive.open(info) as member:
+                rows = (
+                    _json_rows(member)
+                    if extension == ".json"
+                    else _csv_rows(member, header)
+                )
+                for row in rows:
+                    if len(records) >= max_records:
+                        logger.warning(
+                            f"The LinkedIn export holds more than {max_records} records, "
+                            f"skipping the rest."
+                        )
+                        return records
+                    record = build_record(row)
+                    if record is None:
+                        continue
+                    # Empty fields aren't stored, so they never match a filter.
+                    fields = {
+                        key: value
+                        for key, value in record.metadata.items()
+                        if value not in (None, "", [])
+                    }
+                    source = {
+                        key: value
+                        for key, value in fields.items()
+                        if key not in _PERIOD_FIELDS
+                    }
+                    source.update(
+                        (column, row[column])
+                        for column in _DATE_COLUMNS
+                        if row.get(column)
+                    )
+                    record_key = _record_key(record.record_type, source)
+                    # An entry listed twice, e.g. in both a csv and a json file.
+                    if record_key in record_keys:
+                        continue
+                    record_keys.add(record_key)
+                    fields["record_key"] = record_key
+                    fields["record_type"] = record.record_type
+                    records.append(record._replace(metadata=fields))
+
+    return records
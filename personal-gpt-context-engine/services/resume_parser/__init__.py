@@ -1 +1,6 @@
-from .parser import extract_text_from_pdf
\ No newline at end of file
+from .parser import (
+    extract_text_from_pdf,
+    iter_pdf_pages,
+    warm_up_page_pool,
+    shutdown_page_pool,
+)
@@ -1,8 +1,14 @@
 import asyncio
-import fitz
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
-from typing import Optional
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Tuple, Union
+
+from config import settings
+
+if TYPE_CHECKING:
+    import fitz
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -10,18 +16,28 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def _parse_pdf_sync(pdf_bytes: bytes) -> str:
+def _open_pdf(pdf_source: Union[bytes, str]) -> "fitz.Document":
+    """Opens a PDF from its content in bytes or from a file path."""
+    # PyMuPDF is imported on first use, only processes parsing PDFs need it.
+    import fitz
+
+    if isinstance(pdf_source, bytes):
+        return fitz.open(stream=pdf_source, filetype="pdf")
+    return fitz.open(pdf_source, filetype="pdf")
+
+
+def _parse_pdf_sync(pdf_source: Union[bytes, str]) -> str:
     """
-    Synchronously parse PDF bytes to extract text.
+    Synchronously parse a PDF to extract text.
     Designed to be run in a separate thread to avoid blocking the event loop.
     Arguments:
-        pdf_bytes (bytes): The PDF file content in bytes.
+        pdf_source (Union[bytes, str]): The PDF file content in bytes or its file path.
     Returns:
         str: Extracted text from the PDF.
     """
     text_content = []
     try:
-        pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
+        pdf_document = _open_pdf(pdf_source)
         logger.info(f"Opened PDF document with {pdf_document.page_count} pages.")
 
         for page in pdf_document:
@@ -40,17 +56,189 @@ def _parse_pdf_sync(pdf_bytes: bytes) -> str:
             pdf_document.close()
 
 
-async def extract_text_from_pdf(pdf_bytes: bytes) -> Optional[str]:
+def _count_pages_sync(pdf_path: str) -> int:
+    """Synchronously count the pages of the PDF stored at `pdf_path`."""
+    with _open_pdf(pdf_path) as pdf_document:
+        return pdf_document.page_count
+
+
+def _extract_page_range_sync(
+    pdf_path: str, start: int, end: int
+) -> List[Tuple[int, str]]:
+    """
+    Synchronously extract the text of pages [start, end) of a PDF.
+    Designed to be run in a worker process that opens the document on its own.
+    Arguments:
+        pdf_path (str): Path of the PDF file.
+        start (int): Index of the first page to extract.
+        end (int): Index after the last page to extract.
+    Returns:
+        List[Tuple[int, str]]: The page index and stripped text of every page.
+    """
+    with _open_pdf(pdf_path) as pdf_document:
+        return [
+            (page_number, pdf_document[page_number].get_text().strip())
+            for page_number in range(start, min(end, pdf_document.page_count))
+        ]
+
+
+_page_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_page_pool() -> ProcessPoolExecutor:
+    """Lazily creates the process pool shared by all page-parallel extractions."""
+    global _page_pool
+
+    if _page_pool is None:
+        _page_pool = ProcessPoolExecutor(
+            max_workers=settings.PDF_EXTRACTION_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        logger.info(
+            f"Started PDF extraction pool with {settings.PDF_EXTRACTION_WORKERS} workers."
+        )
+    return _page_pool
+
+
+def _ping() -> bool:
+    return True
+
+
+async def warm_up_page_pool():
+    """Starts every page extraction worker ahead of the first large document."""
+    pool = _get_page_pool()
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(
+        *[
+            loop.run_in_executor(pool, _ping)
+            for _ in range(settings.PDF_EXTRACTION_WORKERS)
+        ]
+    )
+
+
+def _recycle_page_pool(pool: ProcessPoolExecutor):
+    """
+    Kills the workers of a pool whose task timed out and drops it, so the
+    next extraction starts a fresh one. A worker stuck on a page can't be
+    cancelled, it would otherwise stay busy for good.
+    """
+    global _page_pool
+
+    if _page_pool is pool:
+        _page_pool = None
+    # Extractions still running on the pool fail with BrokenProcessPool.
+    for process in list((pool._processes or {}).values()):
+        process.kill()
+    pool.shutdown(wait=False, cancel_futures=True)
+    logger.warning("Recycled the PDF extraction pool after a timeout.")
+
+
+def shutdown_page_pool():
+    """Shuts down the page extraction pool if it was started."""
+    global _page_pool
+
+    if _page_pool is not None:
+        _page_pool.shutdown(wait=True, cancel_futures=True)
+        _page_pool = None
+
+
+async def iter_pdf_pages(
+    pdf_path: str,
+    workers: Optional[int] = None,
+    page_timeout: Optional[float] = None,
+) -> AsyncIterator[Tuple[int, str]]:
+    """
+    Yields the text of every page of a PDF, in page order, as soon as it is extracted.
+
+    Documents with at least PDF_PARALLEL_MIN_PAGES pages are split into ranges of
+    PDF_PAGES_PER_TASK pages that are extracted on a process pool, each worker
+    opening the file on its own. Smaller documents are extracted in a thread.
+    A range that takes longer than `page_timeout` seconds per page fails the
+    document, rather than yielding it without those pages, and the pool is
+    recycled so the stuck worker doesn't stay busy.
+
+    Arguments:
+        pdf_path (str): Path of the PDF file.
+        workers (Optional[int]): Number of ranges extracted concurrently.
+        page_timeout (Optional[float]): Time budget per page in seconds.
+    Yields:
+        Tuple[int, str]: The page index and its stripped text.
+    Raises:
+        TimeoutError: If a range of pages took longer than its time budget.
+    """
+    loop = asyncio.get_running_loop()
+    workers = workers or settings.PDF_EXTRACTION_WORKERS
+    page_timeout = page_timeout or settings.PDF_PAGE_TIMEOUT_SECONDS
+    pages_per_task = settings.PDF_PAGES_PER_TASK
+
+    page_count = await loop.run_in_executor(None, _count_pages_sync, pdf_path)
+    logger.info(f"Opened PDF document with {page_count} pages.")
+
+    if page_count < settings.PDF_PARALLEL_MIN_PAGES or workers <= 1:
+        pages = await loop.run_in_executor(
+            None, _extract_page_range_sync, pdf_path, 0, page_count
+        )
+        for page in pages:
+            yield page
+        return
+
+    pool = _get_page_pool()
+    ranges = [
+        (start, min(start + pages_per_task, page_count))
+        for start in range(0, page_count, pages_per_task)
+    ]
+    in_flight = {}
+    next_range = 0
+
+    try:
+        for start, end in ranges:
+            # Keep every worker busy while the caller consumes earlier pages.
+            while next_range < len(ranges) and len(in_flight) < workers * 2:
+                range_start, range_end = ranges[next_range]
+                in_flight[range_start] = loop.run_in_executor(
+                    pool, _extract_page_range_sync, pdf_path, range_start, range_end
+                )
+                next_range += 1
+
+            try:
+                pages = await asyncio.wait_for(
+                    in_flight.pop(start), timeout=page_timeout * (end - start)
+                )
+            except asyncio.TimeoutError:
+                _recycle_page_pool(pool)
+                raise TimeoutError(
+                    f"Timed out extracting pages {start}-{end - 1} of '{pdf_path}'."
+                )
+
+            for page in pages:
+                yield page
+    finally:
+        for future in in_flight.values():
+            future.cancel()
+
+    logger.info("Completed text extraction from PDF.")
+
+
+async def extract_text_from_pdf(pdf_source: Union[bytes, str]) -> Optional[str]:
     """
     Asynchronous public interface for the PDF parsing pipeline.
-    It runs the synchronous parsing function in a non-blocking thread.
+    It runs the synchronous parsing function in a non-blocking thread, or
+    extracts pages in parallel when given the path of a large document.
     """
     logger.info("Starting asynchronous PDF text extraction pipeline.")
 
     try:
+        if isinstance(pdf_source, str):
+            text_content = [
+                content
+                async for _, content in iter_pdf_pages(pdf_source)
+                if content != ""
+            ]
+            return "".join(text_content)
+
         loop = asyncio.get_running_loop()
         extracted_text = await loop.run_in_executor(
-            None, _parse_pdf_sync, pdf_bytes  # Use the default ThreadPoolExecutor
+            None, _parse_pdf_sync, pdf_source  # Use the default ThreadPoolExecutor
         )
         return extracted_text
     except Exception as e:
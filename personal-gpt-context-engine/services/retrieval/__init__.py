@@ -0,0 +1,3 @@
+from .search import search_documents
+from .result_cache import search_result_cache, normalize_query
+from .reranker import reranker, maximal_marginal_relevance
@@ -0,0 +1,224 @@
+import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+from config import settings
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+def _dense_vector(point: Any) -> Optional[List[float]]:
+    vector = point.vector
+    # Collections with named vectors return them keyed by name.
+    if isinstance(vector, dict):
+        vector = vector.get("")
+    return vector
+
+
+def maximal_marginal_relevance(
+    relevance: np.ndarray, embeddings: np.ndarray, limit: int, diversity: float
+) -> List[int]:
+    """
+    Picks `limit` items one at a time, each the most relevant one after
+    subtracting its similarity to the items already picked, so near-duplicates
+    (e.g. overlapping chunks of one document) don't crowd out other results.
+
+    Args:
+        relevance (np.ndarray): The relevance of every item, scaled to [0, 1].
+        embeddings (np.ndarray): The embedding of every item, one row each.
+        limit (int): Number of items to pick.
+        diversity (float): Weight of dissimilarity against relevance, 0 for
+            relevance only.
+
+    Returns:
+        List[int]: The indexes of the picked items, in order.
+    """
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    embeddings = embeddings / np.clip(norms, 1e-12, None)
+    similarity = embeddings @ embeddings.T
+
+    selected: List[int] = []
+    max_similarity = np.zeros(len(relevance), dtype=np.float32)
+    for _ in range(min(limit, len(relevance))):
+        scores = (1 - diversity) * relevance - diversity * max_similarity
+        scores[selected] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        max_similarity = np.maximum(max_similarity, similarity[best])
+    return selected
+
+
+class _Reranker:
+    """
+    Re-scores search candidates with a cross-encoder, which reads the query
+    and a chunk together and judges relevance far better than the distance
+    between their embeddings, then diversifies them with MMR.
+
+    The model runs on a dedicated thread, so re-ranking never waits behind
+    ingestion batches on the inference executor. Every request has a latency
+    budget; when the model can't answer within it, or is already busy with
+    requests that gave up, the caller falls back to the un-reranked results.
+    """
+
+    def __init__(
+        self, model_name: str, batch_size: int, diversity: float, max_pending: int = 2
+    ):
+        self.model_name = model_name
+        self.batch_size = max(1, batch_size)
+        self.diversity = diversity
+        self.max_pending = max(1, max_pending)
+        self._model = None
+        self._model_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._warm_up_task: Optional[asyncio.Task] = None
+        self._pending = 0
+
+    @property
+    def is_active(self) -> bool:
+        return self._executor is not None
+
+    def _load_model(self):
+        if self._model is not None:
+            return self._model
+
+        with self._model_lock:
+            if self._model is None:
+                from sentence_transformers import CrossEncoder
+
+                logger.info(f"Loading the re-ranking model '{self.model_name}'...")
+                self._model = CrossEncoder(self.model_name)
+                logger.info(f"Re-ranking model '{self.model_name}' loaded.")
+        return self._model
+
+    def _score(self, query: str, texts: List[str]) -> np.ndarray:
+        model = self._load_model()
+        scores = model.predict(
+            [(query, text) for text in texts],
+            batch_size=self.batch_size,
+            show_progress_bar=False,
+        )
+        return np.asarray(scores, dtype=np.float32)
+
+    async def _warm_up(self):
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._load_model
+            )
+        except Exception:
+            # The first request will load the model again and report the failure.
+            logger.exception("Failed to load the re-ranking model.")
+
+    def start(self):
+        """Starts the re-ranking thread and loads the model in the background."""
+        if self._executor is not None:
+            return
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rerank")
+        self._warm_up_task = asyncio.create_task(self._warm_up())
+        logger.info(f"Reranker started with model '{self.model_name}'.")
+
+    async def stop(self):
+        """Stops the re-ranking thread."""
+        if self._executor is None:
+            return
+
+        if self._warm_up_task is not None:
+            self._warm_up_task.cancel()
+            self._warm_up_task = None
+        executor, self._executor = self._executor, None
+        await asyncio.get_running_loop().run_in_executor(
+            None, lambda: executor.shutdown(wait=True, cancel_futures=True)
+        )
+        logger.info("Reranker stopped.")
+
+    async def rerank(
+        self, query: str, points: List[Any], limit: int, timeout: float
+    ) -> Optional[List[Tuple[Any, float]]]:
+        """
+        Re-ranks search candidates.
+
+        Args:
+            query (str): The query text.
+            points (List[Any]): The candidates, with their `text_chunk` payload
+                and, for MMR, their dense vector.
+            limit (int): Number of results to return.
+            timeout (float): Seconds left in the latency budget of the request.
+
+        Returns:
+            Optional[List[Tuple[Any, float]]]: The best `limit` points with
+                their cross-encoder score, None if they couldn't be re-ranked
+                in time.
+        """
+        if not self.is_active or not points:
+            return None
+        if timeout <= 0 or self._pending >= self.max_pending:
+            logger.warning(
+                "Skipping re-ranking, no budget left or the reranker is busy."
+            )
+            return None
+
+        texts = [(point.payload or {}).get("text_chunk", "") for point in points]
+        started = time.perf_counter()
+        future = asyncio.get_running_loop().run_in_executor(
+            self._executor, self._score, query, texts
+        )
+        # A timed out batch still runs to completion on the thread; it counts
+        # as pending until then, so requests stop queueing behind it.
+        self._pending += 1
+        future.add_done_callback(self._release)
+        try:
+            scores = await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Re-ranking {len(points)} candidates exceeded the "
+                f"{timeout * 1000:.0f}ms left, returning un-reranked results."
+            )
+            return None
+        except Exception as e:
+            logger.error(f"Re-ranking failed, returning un-reranked results: {e}")
+            return None
+
+        vectors = [_dense_vector(point) for point in points]
+        if self.diversity > 0 and all(vector is not None for vector in vectors):
+            spread = scores.max() - scores.min()
+            relevance = (
+                (scores - scores.min()) / spread if spread else np.ones_like(scores)
+            )
+            order = maximal_marginal_relevance(
+                relevance,
+                np.asarray(vectors, dtype=np.float32),
+                limit,
+                self.diversity,
+            )
+        else:
+            order = np.argsort(-scores)[:limit].tolist()
+
+        logger.info(
+            f"Re-ranked {len(points)} candidates in "
+            f"{(time.perf_counter() - started) * 1000:.0f}ms."
+        )
+        return [(points[index], float(scores[index])) for index in order]
+
+    def _release(self, future: asyncio.Future):
+        self._pending -= 1
+        if not future.cancelled() and future.exception() is not None:
+            logger.debug(f"Re-ranking batch failed: {future.exception()}")
+
+
+reranker = _Reranker(
+    model_name=(
+        settings.RERANK_MODEL if settings else "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    ),
+    batch_size=settings.RERANK_BATCH_SIZE if settings else 32,
+    diversity=settings.RERANK_MMR_DIVERSITY if settings else 0.3,
+)
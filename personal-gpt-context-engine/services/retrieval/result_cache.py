@@ -0,0 +1,142 @@
+import re
+import json
+import hashlib
+import logging
+import unicodedata
+from typing import Any, List, Optional, Tuple
+
+from redis.asyncio import Redis
+
+from config import settings
+from models import SearchResult
+from vector_db_manager import collection_versions
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+_TRAILING_PUNCTUATION = re.compile(r"[\s?!.]+$")
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalizes a query so that questions differing only in case, spacing or
+    trailing punctuation share a cache entry.
+    """
+    query = unicodedata.normalize("NFKC", query).casefold()
+    return _TRAILING_PUNCTUATION.sub("", " ".join(query.split()))
+
+
+class _SearchResultCache:
+    """
+    Cache of search results in Redis, keyed by the normalized query and the
+    search parameters, per tenant.
+
+    Every write to a tenant's points bumps its version (see
+    `collection_versions`), and an entry holds the version its results were
+    computed at, so entries computed before a write are never read again and
+    are replaced or expire on their own. Results are stored with the version
+    read before searching, so a search racing a write can't cache stale
+    results under the new version.
+
+    The cache is best effort: when Redis is unavailable every lookup is a miss
+    and nothing is stored.
+    """
+
+    _client: Redis = None  # The async text client attached at startup
+    key_prefix = "search_cache"
+
+    def __init__(self, enabled: bool, ttl_seconds: int):
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+
+    def set_client(self, client: Redis):
+        """Attaches the active async Redis client to the cache."""
+        logger.info("Redis client has been attached to SearchResultCache.")
+        self._client = client
+
+    @property
+    def is_active(self) -> bool:
+        return self.enabled and self._client is not None
+
+    def _get_key(self, tenant_id: str, query: str, **parameters: Any) -> str:
+        key = json.dumps([normalize_query(query), parameters], sort_keys=True)
+        query_hash = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return f"{self.key_prefix}:{tenant_id}:{query_hash}"
+
+    async def get(
+        self, tenant_id: str, query: str, **parameters: Any
+    ) -> Tuple[Optional[str], Optional[List[SearchResult]]]:
+        """
+        Looks up the cached results of a query.
+
+        Args:
+            tenant_id (str): The tenant searched.
+            query (str): The query text, normalized for the lookup.
+            **parameters: The other search parameters, JSON serializable.
+
+        Returns:
+            Tuple[Optional[str], Optional[List[SearchResult]]]: The current
+                collection version to store the results at, None when the cache
+                is inactive, and the cached results, None on a miss.
+        """
+        if not self.is_active:
+            return None, None
+
+        try:
+            # The versions and the entry are read in one round-trip.
+            pipeline = self._client.pipeline(transaction=False)
+            pipeline.get(collection_versions.global_key)
+            pipeline.get(collection_versions.get_key(tenant_id))
+            pipeline.get(self._get_key(tenant_id, query, **parameters))
+            global_version, tenant_version, entry = await pipeline.execute()
+        except Exception as e:
+            logger.warning(f"Search cache lookup failed, treating as a miss: {e}")
+            return None, None
+
+        version = f"{global_version or 0}.{tenant_version or 0}"
+        if entry is None:
+            return version, None
+        entry = json.loads(entry)
+        if entry["version"] != version:
+            return version, None
+        return version, [SearchResult(**result) for result in entry["results"]]
+
+    async def set(
+        self,
+        tenant_id: str,
+        version: Optional[str],
+        query: str,
+        results: List[SearchResult],
+        **parameters: Any,
+    ):
+        """
+        Stores the results of a query with the collection version returned by
+        the lookup that missed.
+        """
+        if not self.is_active or version is None:
+            return
+
+        entry = json.dumps(
+            {
+                "version": version,
+                "results": [result.model_dump() for result in results],
+            }
+        )
+        try:
+            await self._client.set(
+                self._get_key(tenant_id, query, **parameters),
+                entry,
+                ex=self.ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to store search results in the cache: {e}")
+
+
+search_result_cache = _SearchResultCache(
+    enabled=settings.SEARCH_CACHE_ENABLED if settings else False,
+    ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS if settings else 3600,
+)
@@ -0,0 +1,116 @@
+import time
+import logging
+from typing import Any, Dict, List, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from config import settings
+from models import SearchResult
+from services.vectorization import query_embedding_batcher, sparse_query_vector
+from services.vectorization.embedding_model import MODEL_ID
+from .reranker import reranker
+from .result_cache import search_result_cache
+from vector_db_manager import vector_db_manager
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+async def search_documents(
+    query: str,
+    limit: Optional[int] = None,
+    hybrid: Optional[bool] = None,
+    tenant_id: Optional[str] = None,
+    metadata_filter: Optional[Dict[str, Any]] = None,
+    rerank: Optional[bool] = None,
+    rerank_budget_ms: Optional[int] = None,
+) -> List[SearchResult]:
+    """
+    Embeds a retrieval query and returns the closest stored chunks.
+
+    A hybrid search also matches the query terms against the BM25 vectors of
+    the chunks, which finds exact keywords such as technology names that the
+    embedding alone may rank low.
+
+    A re-ranked search fetches more candidates and re-scores them with a
+    cross-encoder, unless that would take longer than the latency budget of
+    the request, in which case the results aren't re-ranked.
+
+    Results are cached per tenant until its points change, so a repeated
+    question skips both the embedding and the vector database.
+
+    Args:
+        query (str): The natural language query.
+        limit (Optional[int]): Maximum number of results, defaults to the configured limit.
+        hybrid (Optional[bool]): Fuse dense and keyword results, defaults to SEARCH_HYBRID.
+        tenant_id (Optional[str]): The tenant whose chunks are searched, defaults
+            to the default tenant.
+        metadata_filter (Optional[Dict[str, Any]]): Metadata the chunks must
+            match, such as the company of a position.
+        rerank (Optional[bool]): Re-rank the results, defaults to RERANK_ENABLED.
+        rerank_budget_ms (Optional[int]): Milliseconds the whole search may take
+            for its results to be re-ranked, defaults to RERANK_BUDGET_MS.
+
+    Returns:
+        List[SearchResult]: The matching chunks ordered by relevance.
+    """
+    limit = limit or settings.SEARCH_DEFAULT_LIMIT
+    hybrid = settings.SEARCH_HYBRID if hybrid is None else hybrid
+    tenant_id = tenant_id or settings.DEFAULT_TENANT_ID
+    rerank = (settings.RERANK_ENABLED if rerank is None else rerank) and (
+        reranker.is_active
+    )
+    deadline = (
+        time.perf_counter() + (rerank_budget_ms or settings.RERANK_BUDGET_MS) / 1000
+    )
+
+    parameters = {
+        "limit": limit,
+        "hybrid": hybrid,
+        "filter": metadata_filter,
+        "model": MODEL_ID,
+        "rerank": rerank,
+    }
+    version, cached = await search_result_cache.get(tenant_id, query, **parameters)
+    if cached is not None:
+        logger.info(f"Search returned {len(cached)} cached results.")
+        return cached
+
+    query_vector = await query_embedding_batcher.embed(query)
+    points = await run_in_threadpool(
+        vector_db_manager.search,
+        query_vector,
+        max(limit, settings.RERANK_CANDIDATES) if rerank else limit,
+        {**(metadata_filter or {}), "tenant_id": tenant_id},
+        sparse_query=sparse_query_vector(query) if hybrid else None,
+        with_vectors=rerank,
+    )
+
+    scored = [(point, point.score) for point in points[:limit]]
+    if rerank:
+        reranked = await reranker.rerank(
+            query, points, limit, timeout=deadline - time.perf_counter()
+        )
+        if reranked is None:
+            # Results that missed the budget aren't cached, the next search may
+            # be re-ranked in time.
+            version = None
+        else:
+            scored = reranked
+
+    logger.info(f"Search returned {len(scored)} results.")
+    results = [
+        SearchResult(
+            id=str(point.id),
+            score=score,
+            text_chunk=(point.payload or {}).get("text_chunk", ""),
+            metadata=(point.payload or {}).get("metadata", {}),
+        )
+        for point, score in scored
+    ]
+    await search_result_cache.set(tenant_id, version, query, results, **parameters)
+    return results
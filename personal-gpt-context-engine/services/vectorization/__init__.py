@@ -1,2 +1,13 @@
-from .embeddings import process_and_store_text
+from .ingestion import (
+    process_and_store_text,
+    embed_documents,
+    IngestionPipeline,
+    PipelineDocument,
+)
+from .embedding_cache import embedding_cache
 from .embedding_model import load_embedding_model
+from .inference_executor import inference_executor
+from .query_batcher import query_embedding_batcher
+from .sparse import sparse_document_vectors, sparse_query_vector
+from .chunker import get_text_chunker
+from .code_splitters import get_code_splitter, get_language
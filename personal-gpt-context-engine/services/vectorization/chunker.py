@@ -0,0 +1,252 @@
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Tuple
+
+from config import settings
+from .embedding_backends import get_model_file, read_model_config
+from .embedding_model import MODEL_NAME
+
+if TYPE_CHECKING:
+    from tokenizers import Tokenizer
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+_LINE = re.compile(r"[^\n]+")
+# A sentence ends at a full stop, question or exclamation mark followed by
+# whitespace and what looks like the start of the next sentence.
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+(?=[\"'(\[]?[A-Z0-9])")
+
+
+class _Unit(NamedTuple):
+    """A span of the text that is never split further, and its token count."""
+
+    start: int
+    end: int
+    tokens: int
+
+
+class TokenChunker:
+    """
+    Splits text into chunks of at most `max_tokens` tokens of the embedding model.
+
+    Text is cut into lines and sentences, which are packed into chunks up to the
+    token budget; a sentence longer than the budget is cut at token boundaries.
+    Consecutive chunks share up to `overlap_tokens` tokens of whole sentences.
+
+    Token counts are cached per sentence, so text that is split again, like the
+    tail of a page carried over to the next one or an unchanged CV ingested
+    again, isn't tokenized twice.
+    """
+
+    def __init__(
+        self,
+        tokenizer: "Tokenizer",
+        max_tokens: int,
+        overlap_tokens: int,
+        model_max_tokens: int,
+        cache_size: int = 10000,
+    ):
+        if not 0 <= overlap_tokens < max_tokens:
+            raise ValueError(
+                f"Chunk overlap must be between 0 and {max_tokens - 1} tokens, "
+                f"got {overlap_tokens}."
+            )
+
+        self.tokenizer = tokenizer
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+        self.model_max_tokens = model_max_tokens
+        self.cache_size = cache_size
+        # Token count of every cached sentence, and the token offsets of those
+        # that have to be cut.
+        self._cache: OrderedDict[str, Tuple[int, Optional[List[Tuple[int, int]]]]] = (
+            OrderedDict()
+        )
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @classmethod
+    def from_model(
+        cls,
+        model_name: str,
+        max_tokens: int,
+        overlap_tokens: int,
+        cache_size: int = 10000,
+    ) -> "TokenChunker":
+        """
+        Builds a chunker counting tokens with the fast tokenizer of a model.
+        The budget is capped to what the model reads, special tokens included.
+        """
+        from tokenizers import Tokenizer
+
+        tokenizer = Tokenizer.from_file(get_model_file(model_name, "tokenizer.json"))
+        tokenizer.no_truncation()
+        tokenizer.no_padding()
+
+        model_max_tokens = (
+            read_model_config(model_name, "sentence_bert_config.json") or {}
+        ).get("max_seq_length", 512)
+        special_tokens = (
+            tokenizer.post_processor.num_special_tokens_to_add(False)
+            if tokenizer.post_processor
+            else 0
+        )
+        if max_tokens > model_max_tokens - special_tokens:
+            logger.warning(
+                f"Chunks of {max_tokens} tokens would be truncated by '{model_name}', "
+                f"using {model_max_tokens - special_tokens} instead."
+            )
+            max_tokens = model_max_tokens - special_tokens
+
+        return cls(
+            tokenizer,
+            max_tokens=max_tokens,
+            overlap_tokens=min(overlap_tokens, max_tokens - 1),
+            model_max_tokens=model_max_tokens,
+            cache_size=cache_size,
+        )
+
+    def count_tokens(self, text: str) -> int:
+        """Number of tokens the model sees for a text, special tokens included."""
+        return len(self.tokenizer.encode(text, add_special_tokens=True).ids)
+
+    def _sentences(self, text: str) -> List[Tuple[int, int]]:
+        spans = []
+        for line in _LINE.finditer(text):
+            start = line.start()
+            for boundary in _SENTENCE_BOUNDARY.finditer(line.group()):
+                spans.append((start, line.start() + boundary.start()))
+                start = line.start() + boundary.end()
+            spans.append((start, line.end()))
+
+        sentences = []
+        for start, end in spans:
+            span = text[start:end]
+            stripped = span.strip()
+            if stripped:
+                offset = start + len(span) - len(span.lstrip())
+                sentences.append((offset, offset + len(stripped)))
+        return sentences
+
+    def _tokenize(
+        self, sentences: List[str]
+    ) -> List[Tuple[int, Optional[List[Tuple[int, int]]]]]:
+        found = {}
+        for sentence in sentences:
+            if sentence in self._cache and sentence not in found:
+                self._cache.move_to_end(sentence)
+                found[sentence] = self._cache[sentence]
+        self.cache_hits += len(found)
+
+        missing = [s for s in dict.fromkeys(sentences) if s not in found]
+        self.cache_misses += len(missing)
+        if missing:
+            encodings = self.tokenizer.encode_batch(missing, add_special_tokens=False)
+            for sentence, encoding in zip(missing, encodings):
+                tokens = len(encoding.ids)
+                # Offsets are only kept for the sentences that have to be cut.
+                offsets = encoding.offsets if tokens > self.max_tokens else None
+                found[sentence] = self._cache[sentence] = (tokens, offsets)
+
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return [found[sentence] for sentence in sentences]
+
+    def _units(self, text: str) -> List[_Unit]:
+        sentences = self._sentences(text)
+        counts = self._tokenize([text[start:end] for start, end in sentences])
+
+        units = []
+        for (start, end), (tokens, offsets) in zip(sentences, counts):
+            if offsets is None:
+                units.append(_Unit(start, end, tokens))
+                continue
+
+            for first in range(0, tokens, self.max_tokens):
+                last = min(first + self.max_tokens, tokens) - 1
+                units.append(
+                    _Unit(
+                        start + offsets[first][0],
+                        start + offsets[last][1],
+                        last - first + 1,
+                    )
+                )
+        return units
+
+    def split_text(self, text: str) -> List[str]:
+        """
+        Splits a text into chunks.
+
+        Args:
+            text (str): The text to split.
+
+        Returns:
+            List[str]: The chunks, in the order they appear in the text.
+        """
+        chunks: List[List[_Unit]] = []
+        current: List[_Unit] = []
+        current_tokens = 0
+
+        for unit in self._units(text):
+            if current and current_tokens + unit.tokens > self.max_tokens:
+                chunks.append(current)
+
+                carried, carried_tokens = [], 0
+                for previous in reversed(current):
+                    if carried_tokens + previous.tokens > self.overlap_tokens:
+                        break
+                    carried.insert(0, previous)
+                    carried_tokens += previous.tokens
+                if len(carried) == len(current):
+                    # The whole chunk would be repeated in the next one.
+                    carried, carried_tokens = [], 0
+                while carried and carried_tokens + unit.tokens > self.max_tokens:
+                    carried_tokens -= carried.pop(0).tokens
+
+                current, current_tokens = carried, carried_tokens
+
+            current.append(unit)
+            current_tokens += unit.tokens
+
+        if current:
+            chunks.append(current)
+
+        return [text[chunk[0].start : chunk[-1].end] for chunk in chunks]
+
+
+_text_chunker: Optional[TokenChunker] = None
+_text_chunker_lock = threading.Lock()
+
+
+def get_text_chunker() -> TokenChunker:
+    """
+    Returns the chunker shared by all ingestions of this process, so the
+    tokenizer is loaded and its cache filled only once.
+    """
+    global _text_chunker
+
+    if _text_chunker is not None:
+        return _text_chunker
+
+    with _text_chunker_lock:
+        if _text_chunker is None:
+            _text_chunker = TokenChunker.from_model(
+                MODEL_NAME,
+                max_tokens=settings.CHUNK_MAX_TOKENS,
+                overlap_tokens=settings.CHUNK_OVERLAP_TOKENS,
+                cache_size=settings.CHUNK_TOKEN_CACHE_SIZE,
+            )
+            logger.info(
+                f"Chunking '{MODEL_NAME}' tokens: {_text_chunker.max_tokens} per chunk, "
+                f"{_text_chunker.overlap_tokens} overlap."
+            )
+
+    return _text_chunker
@@ -0,0 +1,102 @@
+import posixpath
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from .chunker import get_text_chunker
+
+if TYPE_CHECKING:
+    from langchain_text_splitters import TextSplitter
+
+# Languages with a splitter that cuts at their syntax: classes, functions,
+# blocks and, for markup, headings. Keyed by file extension.
+_LANGUAGES = {
+    ".c": "c",
+    ".h": "c",
+    ".cc": "cpp",
+    ".cpp": "cpp",
+    ".cxx": "cpp",
+    ".hpp": "cpp",
+    ".cs": "csharp",
+    ".ex": "elixir",
+    ".exs": "elixir",
+    ".go": "go",
+    ".hs": "haskell",
+    ".html": "html",
+    ".htm": "html",
+    ".java": "java",
+    ".js": "js",
+    ".jsx": "js",
+    ".mjs": "js",
+    ".cjs": "js",
+    ".kt": "kotlin",
+    ".kts": "kotlin",
+    ".tex": "latex",
+    ".lua": "lua",
+    ".md": "markdown",
+    ".markdown": "markdown",
+    ".mdx": "markdown",
+    ".pl": "perl",
+    ".pm": "perl",
+    ".php": "php",
+    ".ps1": "powershell",
+    ".proto": "proto",
+    ".py": "python",
+    ".pyi": "python",
+    ".r": "r",
+    ".rst": "rst",
+    ".rb": "ruby",
+    ".rs": "rust",
+    ".scala": "scala",
+    ".sol": "sol",
+    ".swift": "swift",
+    ".ts": "ts",
+    ".tsx": "ts",
+}
+
+_splitters: Dict[str, "TextSplitter"] = {}
+_splitters_lock = threading.Lock()
+
+
+def get_language(path: str) -> Optional[str]:
+    """The language of a source file from its extension, None if it has no splitter."""
+    return _LANGUAGES.get(posixpath.splitext(path)[1].lower())
+
+
+def _get_splitter(language: str) -> "TextSplitter":
+    if language in _splitters:
+        return _splitters[language]
+
+    with _splitters_lock:
+        if language not in _splitters:
+            from langchain_text_splitters import (
+                Language,
+                RecursiveCharacterTextSplitter,
+            )
+
+            # Chunks are measured in tokens of the embedding model, like prose.
+            chunker = get_text_chunker()
+            _splitters[language] = RecursiveCharacterTextSplitter.from_language(
+                Language(language),
+                chunk_size=chunker.max_tokens,
+                chunk_overlap=chunker.overlap_tokens,
+                length_function=chunker.count_tokens,
+            )
+
+    return _splitters[language]
+
+
+def get_code_splitter(path: str) -> Callable[[str], List[str]]:
+    """
+    Returns the function splitting a repository file into chunks: a splitter
+    aware of the syntax of its language, or the text chunker for other files.
+
+    Args:
+        path (str): The path of the file in the repository.
+
+    Returns:
+        Callable[[str], List[str]]: Splits the content of the file.
+    """
+    language = get_language(path)
+    if language is None:
+        return get_text_chunker().split_text
+    return _get_splitter(language).split_text
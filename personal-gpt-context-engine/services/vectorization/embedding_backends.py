@@ -0,0 +1,282 @@
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+def get_model_file(model_name: str, filename: str) -> Optional[str]:
+    """
+    Returns the local path of a file of a model, downloading it if needed.
+
+    Args:
+        model_name (str): Hugging Face Hub id or local directory of the model.
+        filename (str): Path of the file within the model, e.g. 'tokenizer.json'.
+
+    Returns:
+        Optional[str]: The local path, or None if the model has no such file.
+    """
+    if os.path.isdir(model_name):
+        path = os.path.join(model_name, filename)
+        return path if os.path.exists(path) else None
+
+    from huggingface_hub import hf_hub_download
+    from huggingface_hub.errors import EntryNotFoundError
+
+    try:
+        return hf_hub_download(model_name, filename)
+    except EntryNotFoundError:
+        return None
+
+
+def read_model_config(model_name: str, filename: str) -> Optional[Dict]:
+    """Reads a JSON file of a model, None if the model has no such file."""
+    path = get_model_file(model_name, filename)
+    if path is None:
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class EmbeddingBackend(ABC):
+    """
+    Turns texts into embeddings with a sentence embedding model.
+
+    A backend is created unloaded; `load` reads the model into memory and
+    must be called once before `encode` or `dimension` are used.
+    """
+
+    name = "base"
+
+    def __init__(
+        self, model_name: str, threads: int = 0, cache_dir: str = ".model_cache"
+    ):
+        self.model_name = model_name
+        # Every inference worker holds a model; don't let each of them use all cores.
+        self.threads = threads
+        self.cache_dir = cache_dir
+
+    @abstractmethod
+    def load(self):
+        """Reads the model into memory."""
+
+    @property
+    @abstractmethod
+    def dimension(self) -> int:
+        """Size of the embeddings produced by the model."""
+
+    @abstractmethod
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Embeds a batch of texts.
+
+        Args:
+            texts (List[str]): The texts to embed.
+
+        Returns:
+            np.ndarray: A (len(texts), dimension) float32 matrix.
+        """
+
+
+class TorchEmbeddingBackend(EmbeddingBackend):
+    """Runs the model with PyTorch through sentence-transformers, the reference backend."""
+
+    name = "torch"
+
+    def __init__(self, model_name: str, **options):
+        super().__init__(model_name, **options)
+        self._model = None
+
+    def load(self):
+        # Imported here so the other backends never pay for importing torch.
+        from sentence_transformers import SentenceTransformer
+
+        if self.threads:
+            import torch
+
+            torch.set_num_threads(self.threads)
+        self._model = SentenceTransformer(self.model_name)
+
+    @property
+    def dimension(self) -> int:
+        return self._model.get_sentence_embedding_dimension()
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        return self._model.encode(
+            texts, show_progress_bar=False, convert_to_numpy=True
+        ).astype(np.float32, copy=False)
+
+
+class OnnxEmbeddingBackend(EmbeddingBackend):
+    """
+    Runs the ONNX export of the model on ONNX Runtime, without torch.
+
+    The model is read from a local directory or from the Hugging Face Hub, laid
+    out as sentence-transformers publishes it: `onnx/model.onnx`, `tokenizer.json`,
+    and the pooling and normalization modules that follow the transformer.
+    """
+
+    name = "onnx"
+
+    ONNX_FILE = "onnx/model.onnx"
+
+    def __init__(self, model_name: str, **options):
+        super().__init__(model_name, **options)
+        self._session = None
+        self._tokenizer = None
+        self._input_names: List[str] = []
+        self._pooling = "mean"
+        self._normalize = False
+
+    def _onnx_model_path(self) -> str:
+        path = get_model_file(self.model_name, self.ONNX_FILE)
+        if path is None:
+            raise FileNotFoundError(
+                f"Model '{self.model_name}' has no ONNX export at '{self.ONNX_FILE}'."
+            )
+        return path
+
+    def load(self):
+        import onnxruntime
+        from tokenizers import Tokenizer
+
+        pooling = read_model_config(self.model_name, "1_Pooling/config.json") or {}
+        if pooling.get("pooling_mode_cls_token"):
+            self._pooling = "cls"
+        modules = read_model_config(self.model_name, "modules.json") or []
+        self._normalize = any(
+            module.get("type", "").endswith(".Normalize") for module in modules
+        )
+        max_length = (
+            read_model_config(self.model_name, "sentence_bert_config.json") or {}
+        ).get("max_seq_length", 512)
+
+        self._tokenizer = Tokenizer.from_file(
+            get_model_file(self.model_name, "tokenizer.json")
+        )
+        self._tokenizer.enable_truncation(max_length=max_length)
+        if self._tokenizer.padding is None:
+            self._tokenizer.enable_padding()
+
+        options = onnxruntime.SessionOptions()
+        if self.threads:
+            options.intra_op_num_threads = self.threads
+        self._session = onnxruntime.InferenceSession(
+            self._onnx_model_path(), options, providers=["CPUExecutionProvider"]
+        )
+        self._input_names = [
+            model_input.name for model_input in self._session.get_inputs()
+        ]
+
+    @property
+    def dimension(self) -> int:
+        return self._session.get_outputs()[0].shape[-1]
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+
+        encodings = self._tokenizer.encode_batch(texts)
+        inputs = {
+            "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+            "attention_mask": np.array(
+                [e.attention_mask for e in encodings], dtype=np.int64
+            ),
+            "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64),
+        }
+        token_embeddings = self._session.run(
+            None, {name: inputs[name] for name in self._input_names}
+        )[0]
+
+        if self._pooling == "cls":
+            embeddings = token_embeddings[:, 0]
+        else:
+            mask = inputs["attention_mask"][:, :, None].astype(np.float32)
+            embeddings = (token_embeddings * mask).sum(axis=1) / np.clip(
+                mask.sum(axis=1), 1e-9, None
+            )
+
+        if self._normalize:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.clip(norms, 1e-12, None)
+
+        return embeddings.astype(np.float32, copy=False)
+
+
+class QuantizedOnnxEmbeddingBackend(OnnxEmbeddingBackend):
+    """
+    Runs a dynamically quantized int8 copy of the ONNX export.
+
+    Weights are quantized to int8 once and the result is kept in `cache_dir`,
+    activations are quantized on the fly. Embeddings drift slightly from the
+    float model; `benchmarks.embedding_parity` reports by how much.
+    """
+
+    name = "onnx-int8"
+
+    def _onnx_model_path(self) -> str:
+        quantized_path = os.path.join(
+            self.cache_dir,
+            self.model_name.strip("/").replace("/", "--"),
+            "model_int8.onnx",
+        )
+        if os.path.exists(quantized_path):
+            return quantized_path
+
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        logger.info(
+            f"Quantizing '{self.model_name}' to int8 into '{quantized_path}'..."
+        )
+        os.makedirs(os.path.dirname(quantized_path), exist_ok=True)
+        # Several inference workers may quantize at once; the last rename wins.
+        partial_path = f"{quantized_path}.{os.getpid()}.partial"
+        try:
+            quantize_dynamic(
+                super()._onnx_model_path(), partial_path, weight_type=QuantType.QInt8
+            )
+            os.replace(partial_path, quantized_path)
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+
+        return quantized_path
+
+
+_BACKENDS = {
+    TorchEmbeddingBackend.name: TorchEmbeddingBackend,
+    OnnxEmbeddingBackend.name: OnnxEmbeddingBackend,
+    QuantizedOnnxEmbeddingBackend.name: QuantizedOnnxEmbeddingBackend,
+}
+
+
+def create_embedding_backend(
+    kind: str, model_name: str, threads: int = 0, cache_dir: str = ".model_cache"
+) -> EmbeddingBackend:
+    """
+    Builds an embedding backend.
+
+    Args:
+        kind (str): The backend type, one of 'torch', 'onnx' or 'onnx-int8'.
+        model_name (str): Hugging Face Hub id or local directory of the model.
+        threads (int): Inference threads of the backend, 0 for its default.
+        cache_dir (str): Directory keeping derived models, e.g. quantized copies.
+
+    Returns:
+        EmbeddingBackend: The unloaded backend.
+    """
+    if kind not in _BACKENDS:
+        raise ValueError(
+            f"Unknown embedding backend '{kind}'. Expected one of {list(_BACKENDS)}."
+        )
+
+    return _BACKENDS[kind](model_name, threads=threads, cache_dir=cache_dir)
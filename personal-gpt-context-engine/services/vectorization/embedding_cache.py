@@ -0,0 +1,159 @@
+import hashlib
+import logging
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+from redis import Redis
+
+from config import settings
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+class _EmbeddingCache:
+    """
+    Content-addressed cache of chunk embeddings stored in Redis.
+
+    Entries are keyed by the model name, the stored dtype and dimension, and
+    the SHA-256 of the chunk text, and hold the raw vector bytes. Every hit
+    refreshes the entry's TTL, so entries that keep being re-uploaded stay
+    cached while unused ones expire; with `maxmemory-policy volatile-lru` Redis
+    also evicts the least recently used entries first under memory pressure.
+
+    The cache is best effort: when Redis is unavailable every lookup is a miss
+    and nothing is stored.
+    """
+
+    _client: Redis = None  # A binary (decode_responses=False) client set at startup
+    key_prefix = "embedding_cache"
+
+    def __init__(self, enabled: bool, dtype: str, dimension: int, ttl_seconds: int):
+        self.enabled = enabled
+        self.dtype = np.dtype(dtype)
+        self.dimension = dimension
+        self.ttl_seconds = ttl_seconds
+        self.stats_key = f"{self.key_prefix}:stats"
+        self.hits = 0
+        self.misses = 0
+
+    def set_client(self, client: Redis):
+        """Attaches the active binary Redis client to the cache."""
+        logger.info("Redis client has been attached to EmbeddingCache.")
+        self._client = client
+
+    @property
+    def is_active(self) -> bool:
+        return self.enabled and self._client is not None
+
+    def _get_key(self, model_name: str, text: str) -> str:
+        """Generate Redis key for a chunk embedded by a given model."""
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        # Entries written with another dtype or dimension are never read back.
+        layout = f"{self.dtype.name}x{self.dimension}"
+        return f"{self.key_prefix}:{model_name}:{layout}:{text_hash}"
+
+    def get_many(
+        self, model_name: str, texts: Sequence[str]
+    ) -> List[Optional[np.ndarray]]:
+        """
+        Looks up cached embeddings for a list of chunks.
+
+        Args:
+            model_name (str): The model the embeddings were generated with.
+            texts (Sequence[str]): The chunk texts.
+
+        Returns:
+            List[Optional[np.ndarray]]: A read-only view of the stored embedding per
+                chunk, None on a miss.
+        """
+        if not self.is_active or not texts:
+            return [None] * len(texts)
+
+        try:
+            pipeline = self._client.pipeline(transaction=False)
+            for text in texts:
+                pipeline.getex(self._get_key(model_name, text), ex=self.ttl_seconds)
+            blobs = pipeline.execute()
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed, treating as misses: {e}")
+            return [None] * len(texts)
+
+        # A blob of another size can't be an embedding of this layout, it is
+        # treated as a miss and overwritten.
+        size = self.dtype.itemsize * self.dimension
+        embeddings = [
+            (
+                np.frombuffer(blob, dtype=self.dtype)
+                if blob and len(blob) == size
+                else None
+            )
+            for blob in blobs
+        ]
+
+        hits = sum(embedding is not None for embedding in embeddings)
+        self._record(hits=hits, misses=len(texts) - hits)
+        return embeddings
+
+    def set_many(
+        self,
+        model_name: str,
+        texts: Sequence[str],
+        embeddings: Union[np.ndarray, Sequence[Sequence[float]]],
+    ):
+        """
+        Stores embeddings for a list of chunks.
+
+        Args:
+            model_name (str): The model the embeddings were generated with.
+            texts (Sequence[str]): The chunk texts.
+            embeddings (Union[np.ndarray, Sequence[Sequence[float]]]): The
+                embedding of every chunk.
+        """
+        if not self.is_active or not texts:
+            return
+
+        try:
+            pipeline = self._client.pipeline(transaction=False)
+            for text, embedding in zip(texts, embeddings):
+                blob = np.asarray(embedding, dtype=self.dtype).tobytes()
+                pipeline.set(
+                    self._get_key(model_name, text), blob, ex=self.ttl_seconds
+                )
+            pipeline.execute()
+        except Exception as e:
+            logger.warning(f"Failed to store embeddings in the cache: {e}")
+
+    def _record(self, hits: int, misses: int):
+        self.hits += hits
+        self.misses += misses
+        try:
+            pipeline = self._client.pipeline(transaction=False)
+            pipeline.hincrby(self.stats_key, "hits", hits)
+            pipeline.hincrby(self.stats_key, "misses", misses)
+            pipeline.execute()
+        except Exception as e:
+            logger.warning(f"Failed to record embedding cache stats: {e}")
+
+    def get_stats(self) -> Dict[str, int]:
+        """Returns the hit and miss counters aggregated over all processes."""
+        if not self.is_active:
+            return {"hits": self.hits, "misses": self.misses}
+
+        stats = self._client.hgetall(self.stats_key)
+        return {
+            "hits": int(stats.get(b"hits", 0)),
+            "misses": int(stats.get(b"misses", 0)),
+        }
+
+
+embedding_cache = _EmbeddingCache(
+    enabled=settings.EMBEDDING_CACHE_ENABLED if settings else False,
+    dtype=settings.EMBEDDING_CACHE_DTYPE if settings else "float32",
+    dimension=settings.EMBEDDING_DIMENSION if settings else 384,
+    ttl_seconds=settings.EMBEDDING_CACHE_TTL_SECONDS if settings else 604800,
+)
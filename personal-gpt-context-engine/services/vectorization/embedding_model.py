@@ -1,7 +1,9 @@
 import logging
+import threading
 from typing import Optional
 
-from sentence_transformers import SentenceTransformer
+from config import settings
+from .embedding_backends import EmbeddingBackend, create_embedding_backend
 
 logging.basicConfig(
     level=logging.INFO,
@@ -10,33 +12,66 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-MODEL_NAME = "BAAI/bge-small-en-v1.5"
+MODEL_NAME = settings.EMBEDDING_MODEL if settings else "BAAI/bge-small-en-v1.5"
+BACKEND_NAME = settings.EMBEDDING_BACKEND if settings else "torch"
 
-_embedding_model: Optional[SentenceTransformer] = None
+# Identifies the embedding space, e.g. for the embedding cache. Quantized
+# backends produce slightly different vectors than the reference model.
+MODEL_ID = f"{MODEL_NAME}@{BACKEND_NAME}"
 
+# bge models expect retrieval queries (but not documents) to carry this instruction.
+QUERY_INSTRUCTION = (
+    settings.EMBEDDING_QUERY_INSTRUCTION
+    if settings
+    else "Represent this sentence for searching relevant passages: "
+)
+
+_embedding_model: Optional[EmbeddingBackend] = None
+_embedding_model_lock = threading.Lock()
 
-def load_embedding_model():
+
+def load_embedding_model() -> EmbeddingBackend:
     """
-    Loads the Sentence Transformer model into memory.
+    Loads the embedding model into memory on the configured backend.
     This function is called once during application startup.
     """
     global _embedding_model
 
-    if _embedding_model is None:
-        logger.info(
-            f"Model is not loaded. Initializing '{MODEL_NAME}' in current process..."
-        )
-        try:
-            # This line will run once per worker process.
-            _embedding_model = SentenceTransformer(MODEL_NAME)
-            logger.info(f"Model '{MODEL_NAME}' loaded successfully.")
-        except Exception as e:
-            logger.critical(
-                f"FATAL: Failed to load the embedding model '{MODEL_NAME}'. Error: {e}",
-                exc_info=True,
+    if _embedding_model is not None:
+        return _embedding_model
+
+    # Inference threads may race to load the model; only one of them should.
+    with _embedding_model_lock:
+        if _embedding_model is None:
+            logger.info(
+                f"Model is not loaded. Initializing '{MODEL_NAME}' on the "
+                f"'{BACKEND_NAME}' backend in current process..."
             )
-            # Raising an exception here will cause the request to fail,
-            # which is the correct behavior.
-            raise
+            try:
+                # This line will run once per worker process.
+                backend = create_embedding_backend(
+                    BACKEND_NAME,
+                    MODEL_NAME,
+                    threads=settings.EMBEDDING_THREADS if settings else 0,
+                    cache_dir=(
+                        settings.EMBEDDING_MODEL_DIR if settings else ".model_cache"
+                    ),
+                )
+                backend.load()
+                if settings and backend.dimension != settings.EMBEDDING_DIMENSION:
+                    raise ValueError(
+                        f"Model '{MODEL_NAME}' produces {backend.dimension}-dimensional "
+                        f"embeddings but EMBEDDING_DIMENSION is {settings.EMBEDDING_DIMENSION}."
+                    )
+                _embedding_model = backend
+                logger.info(f"Model '{MODEL_NAME}' loaded successfully.")
+            except Exception as e:
+                logger.critical(
+                    f"FATAL: Failed to load the embedding model '{MODEL_NAME}'. Error: {e}",
+                    exc_info=True,
+                )
+                # Raising an exception here will cause the request to fail,
+                # which is the correct behavior.
+                raise
 
     return _embedding_model
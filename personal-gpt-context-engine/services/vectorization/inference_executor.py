@@ -0,0 +1,237 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional
+
+import numpy as np
+
+from config import settings
+from models import EmbeddingType
+from .embedding_model import load_embedding_model
+from .embeddings import generate_embeddings
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+WARM_UP_MODES = ("eager", "background", "off")
+
+
+def _warm_up_worker() -> bool:
+    """Loads the embedding model in the current worker so the first request doesn't pay for it."""
+    load_embedding_model()
+    return True
+
+
+class InferenceExecutor(ABC):
+    """
+    Runs `generate_embeddings` away from the event loop.
+
+    Work is split into batches of at most `batch_size` texts and at most
+    `max_pending` batches may be submitted at once. Callers beyond that limit
+    wait for a free slot, which keeps memory bounded and applies backpressure
+    to the ingestion jobs producing the work.
+
+    The model is loaded in every worker according to `warm_up`: before `start`
+    returns ('eager'), in the background while work is already accepted
+    ('background'), or by the first batch a worker runs ('off').
+    """
+
+    name = "base"
+
+    def __init__(
+        self, workers: int, max_pending: int, batch_size: int, warm_up: str = "eager"
+    ):
+        if warm_up not in WARM_UP_MODES:
+            raise ValueError(
+                f"Unknown warm-up mode '{warm_up}'. Expected one of {list(WARM_UP_MODES)}."
+            )
+
+        self.workers = max(1, workers)
+        self.max_pending = max(1, max_pending)
+        self.batch_size = max(1, batch_size)
+        self.warm_up = warm_up
+        self._executor: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._warm_up_task: Optional[asyncio.Task] = None
+        self._pending = 0
+
+    @abstractmethod
+    def _create_executor(self) -> Executor:
+        """Creates the pool the batches run on."""
+
+    async def _warm_up_workers(self):
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *[
+                loop.run_in_executor(self._executor, _warm_up_worker)
+                for _ in range(self.workers)
+            ]
+        )
+        logger.info(
+            f"Inference executor '{self.name}' warmed up {self.workers} workers "
+            f"in {time.perf_counter() - started:.2f}s."
+        )
+
+    async def _warm_up_in_background(self):
+        try:
+            await self._warm_up_workers()
+        except Exception:
+            # The first batch will load the model again and report the failure.
+            logger.exception(f"Inference executor '{self.name}' failed to warm up.")
+
+    async def start(self):
+        """Creates the worker pool and warms up its workers as `warm_up` says."""
+        if self._executor is not None:
+            return
+
+        self._executor = self._create_executor()
+        self._slots = asyncio.Semaphore(self.max_pending)
+
+        if self.warm_up == "eager":
+            await self._warm_up_workers()
+        elif self.warm_up == "background":
+            self._warm_up_task = asyncio.create_task(self._warm_up_in_background())
+
+        logger.info(
+            f"Inference executor '{self.name}' started with {self.workers} workers "
+            f"(warm_up={self.warm_up}, max_pending={self.max_pending}, "
+            f"batch_size={self.batch_size})."
+        )
+
+    async def stop(self):
+        """Shuts down the worker pool."""
+        if self._executor is None:
+            return
+
+        if self._warm_up_task is not None:
+            self._warm_up_task.cancel()
+            try:
+                await self._warm_up_task
+            except asyncio.CancelledError:
+                pass
+            self._warm_up_task = None
+
+        executor, self._executor = self._executor, None
+        await asyncio.get_running_loop().run_in_executor(
+            None, lambda: executor.shutdown(wait=True, cancel_futures=True)
+        )
+        logger.info(f"Inference executor '{self.name}' stopped.")
+
+    @property
+    def pending(self) -> int:
+        """Number of batches submitted or waiting for a free slot."""
+        return self._pending
+
+    async def _run_batch(
+        self, texts: List[str], task_type: EmbeddingType
+    ) -> Optional[np.ndarray]:
+        self._pending += 1
+        try:
+            async with self._slots:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._executor, generate_embeddings, texts, task_type
+                )
+        finally:
+            self._pending -= 1
+
+    async def embed(
+        self, texts: List[str], task_type: EmbeddingType
+    ) -> Optional[np.ndarray]:
+        """
+        Generates embeddings on the worker pool. Process workers send every batch
+        back as a single pickled array buffer.
+
+        Args:
+            texts (List[str]): The texts to embed.
+            task_type (EmbeddingType): Whether the texts are documents or queries.
+
+        Returns:
+            Optional[np.ndarray]: One embedding row per text, or None on failure.
+        """
+        if self._executor is None:
+            raise RuntimeError("Inference executor has not been started.")
+
+        if not texts:
+            return np.empty((0, 0), dtype=settings.EMBEDDING_DTYPE)
+
+        batches = [
+            texts[i : i + self.batch_size]
+            for i in range(0, len(texts), self.batch_size)
+        ]
+        results = await asyncio.gather(
+            *[self._run_batch(batch, task_type) for batch in batches]
+        )
+
+        if any(batch_embeddings is None for batch_embeddings in results):
+            # generate_embeddings reports failures with None.
+            return None
+
+        return results[0] if len(results) == 1 else np.concatenate(results)
+
+
+class ThreadInferenceExecutor(InferenceExecutor):
+    """Runs inference on a dedicated thread pool sharing the process-wide model."""
+
+    name = "thread"
+
+    def _create_executor(self) -> Executor:
+        return ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="inference"
+        )
+
+
+class ProcessPoolInferenceExecutor(InferenceExecutor):
+    """Runs inference in separate worker processes, each holding its own model."""
+
+    name = "process"
+
+    def _create_executor(self) -> Executor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            # Forking a process that already imported torch is unsafe.
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_up_worker if self.warm_up != "off" else None,
+        )
+
+
+_EXECUTORS = {
+    ThreadInferenceExecutor.name: ThreadInferenceExecutor,
+    ProcessPoolInferenceExecutor.name: ProcessPoolInferenceExecutor,
+}
+
+
+def create_inference_executor(kind: str) -> InferenceExecutor:
+    """
+    Builds the inference executor configured for this process.
+
+    Args:
+        kind (str): The executor type, one of 'process' or 'thread'.
+
+    Returns:
+        InferenceExecutor: The unstarted executor.
+    """
+    if kind not in _EXECUTORS:
+        raise ValueError(
+            f"Unknown inference executor '{kind}'. Expected one of {list(_EXECUTORS)}."
+        )
+
+    return _EXECUTORS[kind](
+        workers=settings.INFERENCE_WORKERS,
+        max_pending=settings.INFERENCE_MAX_PENDING,
+        batch_size=settings.INFERENCE_BATCH_SIZE,
+        warm_up=settings.INFERENCE_WARM_UP,
+    )
+
+
+inference_executor = (
+    create_inference_executor(settings.INFERENCE_EXECUTOR) if settings else None
+)
@@ -0,0 +1,617 @@
+import time
+import asyncio
+import hashlib
+import logging
+from collections import Counter
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import numpy as np
+from pydantic import BaseModel, Field
+from qdrant_client import models
+from starlette.concurrency import run_in_threadpool
+
+from config import settings
+from models import EmbeddingType
+from .chunker import get_text_chunker
+from .embedding_cache import embedding_cache
+from .embedding_model import MODEL_ID
+from .inference_executor import inference_executor
+from .sparse import sparse_document_vectors
+from utils import generate_deterministic_id
+from vector_db_manager import vector_db_manager
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+# Marks the end of the items flowing through a pipeline queue.
+_END = object()
+
+
+async def embed_documents(texts: List[str]) -> Optional[np.ndarray]:
+    """
+    Generates document embeddings, reusing cached embeddings of unchanged chunks.
+    Only chunks missing from the embedding cache are sent to the inference executor.
+
+    Args:
+        texts (List[str]): The chunks to embed.
+
+    Returns:
+        Optional[np.ndarray]: One embedding row per chunk, or None on failure.
+    """
+    cached = await run_in_threadpool(embedding_cache.get_many, MODEL_ID, texts)
+    missing = [i for i, embedding in enumerate(cached) if embedding is None]
+    logger.info(
+        f"Embedding cache: {len(texts) - len(missing)} hits, {len(missing)} misses."
+    )
+
+    generated = None
+    if missing:
+        missing_texts = [texts[i] for i in missing]
+        generated = await inference_executor.embed(
+            missing_texts, task_type=EmbeddingType.RETRIEVAL_DOCUMENT
+        )
+        if generated is None:
+            return None
+
+        await run_in_threadpool(
+            embedding_cache.set_many, MODEL_ID, missing_texts, generated
+        )
+        if len(missing) == len(texts):
+            return generated
+
+    dimension = len(generated[0]) if generated is not None else len(cached[0])
+    embeddings = np.empty((len(texts), dimension), dtype=settings.EMBEDDING_DTYPE)
+    for i, embedding in enumerate(cached):
+        if embedding is not None:
+            embeddings[i] = embedding
+    if generated is not None:
+        embeddings[missing] = generated
+
+    return embeddings
+
+
+class ChunkIdAssigner:
+    """
+    Derives a stable point id for every chunk from its source and its content.
+    Repeated identical chunks are told apart by their occurrence number, so a
+    chunk keeps its id when unrelated chunks are added or removed around it.
+    """
+
+    def __init__(self, metadata: Dict[str, any]):
+        self.source_key = [f"{key}={value}" for key, value in sorted(metadata.items())]
+        self.occurrences = Counter()
+
+    def assign(self, chunk: str) -> str:
+        """Returns the point id of the next chunk of the document."""
+        chunk_hash = hashlib.sha256(chunk.encode("utf-8")).hexdigest()
+        self.occurrences[chunk_hash] += 1
+        return generate_deterministic_id(
+            *self.source_key, chunk_hash, str(self.occurrences[chunk_hash])
+        )
+
+
+class StageStats(BaseModel):
+    """
+    Throughput of a single pipeline stage.
+    """
+
+    name: str = Field(..., description="Name of the stage")
+    items: int = Field(0, description="Number of items the stage produced")
+    busy_seconds: float = Field(0.0, description="Time the stage spent working")
+
+    @property
+    def throughput(self) -> float:
+        """Items produced per second of work."""
+        return self.items / self.busy_seconds if self.busy_seconds else 0.0
+
+
+class PipelineResult(BaseModel):
+    """
+    Outcome of an ingestion pipeline run for a single document.
+    """
+
+    chunks: int = Field(0, description="Chunks in the ingested document")
+    new_chunks: int = Field(0, description="Chunks that were embedded and upserted")
+    moved_chunks: int = Field(0, description="Unchanged chunks whose index changed")
+    vanished_chunks: int = Field(0, description="Stored chunks that were deleted")
+    elapsed_seconds: float = Field(0.0, description="End to end duration")
+    error: Optional[str] = Field(
+        None, description="Why the document failed, when ingested in a batch"
+    )
+    stages: List[StageStats] = Field(default_factory=list)
+
+
+class PipelineDocument(NamedTuple):
+    """
+    A document to ingest in a batch, and the metadata that identifies it.
+    `split_text` replaces the chunker of the pipeline, e.g. for source code.
+    `existing` holds the chunk index of its stored points, keyed by point id,
+    when the caller looked them up for many documents at once; otherwise the
+    pipeline looks them up for every document.
+    """
+
+    metadata: Dict[str, any]
+    segments: AsyncIterator[str]
+    on_extraction_complete: Optional[Callable[[], Awaitable[None]]] = None
+    split_text: Optional[Callable[[str], List[str]]] = None
+    existing: Optional[Dict[str, int]] = None
+
+
+class _Document:
+    """A document flowing through a pipeline, and its diff with the stored points."""
+
+    def __init__(
+        self,
+        metadata: Dict[str, any],
+        segments: AsyncIterator[str],
+        on_extraction_complete: Optional[Callable[[], Awaitable[None]]],
+        split_text: Callable[[str], List[str]],
+        existing: Optional[Dict[str, int]] = None,
+    ):
+        self.metadata = metadata
+        self.segments = segments
+        self.on_extraction_complete = on_extraction_complete
+        self.split_text = split_text
+        self.existing_known = existing is not None
+        self.existing: Dict[str, int] = existing or {}
+        self.seen: set = set()
+        self.moved: Dict[str, int] = {}
+        self.upserted: List[str] = []
+        self.chunks = 0
+        self.new_chunks = 0
+        self.error: Optional[Exception] = None
+
+
+class IngestionPipeline:
+    """
+    Ingests documents as four concurrent stages connected by bounded queues:
+
+        extract -> chunk -> embed -> upsert
+
+    Each stage starts working on the first items while earlier stages are still
+    producing, so a large document takes about as long as its slowest stage
+    rather than the sum of all of them. A document is diffed against the points
+    already stored for its source: only new chunks are embedded and upserted,
+    moved chunks get their index updated and vanished chunks are deleted once all
+    new points are written. A document that fails has its new points deleted
+    again, so its stored points stay as they were.
+
+    In a batch, documents are extracted and chunked side by side and their chunks
+    share the embed and upsert stages, so small documents still fill large
+    embedding batches and upserts.
+
+    Every point belongs to a tenant, the default one unless the metadata names
+    another, and a document is only diffed against its own tenant's points.
+    """
+
+    def __init__(
+        self,
+        metadata: Dict[str, any],
+        queue_size: Optional[int] = None,
+        embed_batch_size: Optional[int] = None,
+        upsert_batch_size: Optional[int] = None,
+        embed_workers: Optional[int] = None,
+        document_concurrency: Optional[int] = None,
+    ):
+        self.metadata = {"tenant_id": settings.DEFAULT_TENANT_ID, **metadata}
+        self.queue_size = queue_size or settings.PIPELINE_QUEUE_SIZE
+        self.embed_batch_size = embed_batch_size or settings.PIPELINE_EMBED_BATCH_SIZE
+        self.upsert_batch_size = (
+            upsert_batch_size or settings.PIPELINE_UPSERT_BATCH_SIZE
+        )
+        self.embed_workers = embed_workers or settings.INFERENCE_WORKERS
+        self.document_concurrency = (
+            document_concurrency or settings.BATCH_DOCUMENT_CONCURRENCY
+        )
+        self.text_splitter = get_text_chunker()
+
+        self.stats = {
+            name: StageStats(name=name)
+            for name in ("extract", "chunk", "embed", "upsert")
+        }
+
+    async def _extract(self, document: _Document, output: asyncio.Queue):
+        stats = self.stats["extract"]
+        while True:
+            started = time.perf_counter()
+            try:
+                segment = await anext(document.segments)
+            except StopAsyncIteration:
+                break
+            finally:
+                stats.busy_seconds += time.perf_counter() - started
+
+            if segment:
+                stats.items += 1
+                await output.put(segment)
+
+        await output.put(_END)
+
+        if document.on_extraction_complete:
+            await document.on_extraction_complete()
+
+    def _emit_chunks(
+        self, document: _Document, chunks: List[str], id_assigner: ChunkIdAssigner
+    ) -> List[Tuple[_Document, int, str, str]]:
+        items = []
+        for chunk in chunks:
+            point_id = id_assigner.assign(chunk)
+            document.seen.add(point_id)
+            items.append((document, document.chunks, point_id, chunk))
+            document.chunks += 1
+        self.stats["chunk"].items += len(items)
+        return items
+
+    async def _chunk(
+        self, document: _Document, source: asyncio.Queue, output: asyncio.Queue
+    ):
+        stats = self.stats["chunk"]
+        id_assigner = ChunkIdAssigner(document.metadata)
+        buffer = ""
+
+        while (segment := await source.get()) is not _END:
+            started = time.perf_counter()
+            buffer = f"{buffer}\n{segment}" if buffer else segment
+            chunks = document.split_text(buffer)
+            # The last chunk may continue on the next segment, so it is split
+            # again together with it. It still overlaps the chunk before it,
+            # which keeps the overlap across segment boundaries.
+            buffer = chunks.pop() if chunks else ""
+            items = self._emit_chunks(document, chunks, id_assigner)
+            stats.busy_seconds += time.perf_counter() - started
+
+            for item in items:
+                await output.put(item)
+
+        if buffer:
+            started = time.perf_counter()
+            items = self._emit_chunks(
+                document, document.split_text(buffer), id_assigner
+            )
+            stats.busy_seconds += time.perf_counter() - started
+            for item in items:
+                await output.put(item)
+
+    async def _chunk_document(
+        self,
+        document: _Document,
+        output: asyncio.Queue,
+        limiter: asyncio.Semaphore,
+        isolate_failures: bool,
+    ):
+        async with limiter:
+            segment_queue = asyncio.Queue(maxsize=self.queue_size)
+            try:
+                async with asyncio.TaskGroup() as stages:
+                    stages.create_task(self._extract(document, segment_queue))
+                    stages.create_task(self._chunk(document, segment_queue, output))
+            except ExceptionGroup as group:
+                if not isolate_failures:
+                    raise group.exceptions[0]
+                # The chunks emitted before the failure are rolled back once the
+                # stages finish, and the document isn't diffed.
+                document.error = group.exceptions[0]
+                logger.error(
+                    f"Failed to extract {document.metadata}: {document.error}",
+                    exc_info=document.error,
+                )
+
+    async def _chunk_documents(
+        self,
+        documents: List[_Document],
+        output: asyncio.Queue,
+        isolate_failures: bool,
+    ):
+        limiter = asyncio.Semaphore(self.document_concurrency)
+        async with asyncio.TaskGroup() as documents_group:
+            for document in documents:
+                documents_group.create_task(
+                    self._chunk_document(document, output, limiter, isolate_failures)
+                )
+
+        for _ in range(self.embed_workers):
+            await output.put(_END)
+
+    async def _embed_batch(
+        self, batch: List[Tuple[_Document, int, str, str]], output: asyncio.Queue
+    ):
+        stats = self.stats["embed"]
+        new_items = []
+        for document, chunk_index, point_id, chunk in batch:
+            if document.error is not None:
+                continue
+            if point_id not in document.existing:
+                new_items.append((document, chunk_index, point_id, chunk))
+            elif document.existing[point_id] != chunk_index:
+                document.moved[point_id] = chunk_index
+
+        if not new_items:
+            return
+
+        started = time.perf_counter()
+        embeddings = await embed_documents([chunk for _, _, _, chunk in new_items])
+        stats.busy_seconds += time.perf_counter() - started
+        if embeddings is None:
+            raise RuntimeError("Embedding generation failed.")
+
+        sparse_vectors = sparse_document_vectors(
+            [chunk for _, _, _, chunk in new_items]
+        )
+
+        stats.items += len(new_items)
+        # Every point carries a view of its row, the batch matrix is never copied.
+        for item, embedding, sparse_vector in zip(
+            new_items, embeddings, sparse_vectors
+        ):
+            await output.put((*item, embedding, sparse_vector))
+
+    async def _embed(self, source: asyncio.Queue, output: asyncio.Queue):
+        batch = []
+        while (item := await source.get()) is not _END:
+            batch.append(item)
+            if len(batch) >= self.embed_batch_size:
+                await self._embed_batch(batch, output)
+                batch = []
+
+        if batch:
+            await self._embed_batch(batch, output)
+
+        await output.put(_END)
+
+    async def _upsert_batch(
+        self,
+        batch: List[Tuple[_Document, int, str, str, np.ndarray, models.SparseVector]],
+        barrier: bool,
+    ):
+        stats = self.stats["upsert"]
+        started = time.perf_counter()
+        # Recorded first, so an interrupted write is rolled back too.
+        for document, _, point_id, _, _, _ in batch:
+            document.upserted.append(point_id)
+        await run_in_threadpool(
+            vector_db_manager.upsert_points,
+            [chunk for _, _, _, chunk, _, _ in batch],
+            [embedding for _, _, _, _, embedding, _ in batch],
+            [document.metadata for document, _, _, _, _, _ in batch],
+            [point_id for _, _, point_id, _, _, _ in batch],
+            [chunk_index for _, chunk_index, _, _, _, _ in batch],
+            barrier=barrier,
+            sparse_vectors=[sparse_vector for _, _, _, _, _, sparse_vector in batch],
+        )
+        stats.busy_seconds += time.perf_counter() - started
+        stats.items += len(batch)
+        for document, _, _, _, _, _ in batch:
+            document.new_chunks += 1
+
+    async def _upsert(self, source: asyncio.Queue):
+        batch = []
+        finished_producers = 0
+        while finished_producers < self.embed_workers:
+            item = await source.get()
+            if item is _END:
+                finished_producers += 1
+                continue
+
+            batch.append(item)
+            # One point is held back so the final batch, which carries the
+            # consistency barrier, is never empty.
+            if len(batch) > self.upsert_batch_size:
+                await self._upsert_batch(batch[:-1], barrier=False)
+                batch = batch[-1:]
+
+        if batch:
+            await self._upsert_batch(batch, barrier=True)
+
+    async def _roll_back(
+        self, documents: List[_Document], keep: Set[str] = frozenset()
+    ):
+        """Deletes the points upserted for documents that didn't finish."""
+        point_ids = sorted({i for doc in documents for i in doc.upserted} - keep)
+        if not point_ids:
+            return
+
+        try:
+            await run_in_threadpool(
+                vector_db_manager.delete_points_by_ids,
+                point_ids,
+                {doc.metadata.get("tenant_id") for doc in documents},
+            )
+        except Exception as e:
+            logger.error(f"Failed to roll back {len(point_ids)} upserted points: {e}")
+            return
+
+        logger.info(f"Rolled back {len(point_ids)} points of failed documents.")
+        for document in documents:
+            document.new_chunks = 0
+
+    async def _run(
+        self, documents: List[_Document], isolate_failures: bool
+    ) -> List[PipelineResult]:
+        started = time.perf_counter()
+        unknown = [document for document in documents if not document.existing_known]
+        existing = await asyncio.gather(
+            *[
+                run_in_threadpool(
+                    vector_db_manager.get_chunk_indexes_by_metadata, document.metadata
+                )
+                for document in unknown
+            ]
+        )
+        for document, document_existing in zip(unknown, existing):
+            document.existing = document_existing
+
+        chunk_queue = asyncio.Queue(maxsize=self.queue_size)
+        point_queue = asyncio.Queue(maxsize=self.queue_size)
+
+        # A failing stage cancels all others and its error propagates.
+        try:
+            async with asyncio.TaskGroup() as stages:
+                stages.create_task(
+                    self._chunk_documents(documents, chunk_queue, isolate_failures)
+                )
+                for _ in range(self.embed_workers):
+                    stages.create_task(self._embed(chunk_queue, point_queue))
+                stages.create_task(self._upsert(point_queue))
+        except ExceptionGroup as group:
+            await self._roll_back(documents)
+            raise group.exceptions[0]
+
+        # The moves and deletions of all documents are applied together.
+        synced = [doc for doc in documents if doc.seen and doc.error is None]
+        failed = [doc for doc in documents if doc.error is not None]
+        if failed:
+            # Points of synced documents with the same content are kept.
+            await self._roll_back(failed, keep={i for doc in synced for i in doc.seen})
+        vanished = {id(doc): list(set(doc.existing) - doc.seen) for doc in synced}
+        if synced:
+            tenant_ids = {doc.metadata.get("tenant_id") for doc in synced}
+            await run_in_threadpool(
+                vector_db_manager.set_chunk_indexes,
+                {
+                    point_id: index
+                    for doc in synced
+                    for point_id, index in doc.moved.items()
+                },
+                tenant_ids,
+            )
+            await run_in_threadpool(
+                vector_db_manager.delete_points_by_ids,
+                [point_id for point_ids in vanished.values() for point_id in point_ids],
+                tenant_ids,
+            )
+
+        elapsed_seconds = time.perf_counter() - started
+        for stage in self.stats.values():
+            logger.info(
+                f"Stage '{stage.name}': {stage.items} items in {stage.busy_seconds:.2f}s "
+                f"busy ({stage.throughput:.1f} items/s)."
+            )
+
+        results = []
+        for document in documents:
+            result = PipelineResult(
+                chunks=len(document.seen),
+                new_chunks=document.new_chunks,
+                moved_chunks=len(document.moved),
+                vanished_chunks=len(vanished.get(id(document), [])),
+                elapsed_seconds=elapsed_seconds,
+                error=str(document.error) if document.error else None,
+                stages=list(self.stats.values()),
+            )
+            logger.info(
+                f"Pipeline for {document.metadata} finished in {result.elapsed_seconds:.2f}s: "
+                f"{result.chunks} chunks, {result.new_chunks} new, {result.moved_chunks} moved, "
+                f"{result.vanished_chunks} vanished."
+            )
+            results.append(result)
+        return results
+
+    async def run(
+        self,
+        segments: AsyncIterator[str],
+        on_extraction_complete: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> PipelineResult:
+        """
+        Runs the pipeline over the text segments (e.g. pages) of a document.
+
+        Args:
+            segments (AsyncIterator[str]): The document text, in order.
+            on_extraction_complete: Awaited once the last segment has been read.
+
+        Returns:
+            PipelineResult: Chunk counts and the throughput of every stage.
+        """
+        document = _Document(
+            self.metadata,
+            segments,
+            on_extraction_complete,
+            self.text_splitter.split_text,
+        )
+        results = await self._run([document], isolate_failures=False)
+        return results[0]
+
+    async def run_batch(
+        self, documents: List[PipelineDocument]
+    ) -> List[PipelineResult]:
+        """
+        Runs the pipeline over several documents, pooling their chunks.
+
+        A document that fails to be extracted doesn't stop the others; its
+        result carries the error and its new points are rolled back.
+        Embedding or upsert failures fail the batch.
+
+        Args:
+            documents (List[PipelineDocument]): The documents to ingest. Their
+                metadata is added to the metadata of the pipeline.
+
+        Returns:
+            List[PipelineResult]: The result of every document, in order.
+        """
+        return await self._run(
+            [
+                _Document(
+                    {**self.metadata, **document.metadata},
+                    document.segments,
+                    document.on_extraction_complete,
+                    document.split_text or self.text_splitter.split_text,
+                    document.existing,
+                )
+                for document in documents
+            ],
+            isolate_failures=True,
+        )
+
+
+async def _single_segment(text: str) -> AsyncIterator[str]:
+    yield text
+
+
+async def process_and_store_text(
+    text: str, source_id: str, metadata: Optional[Dict[str, any]] = None
+) -> bool:
+    """
+    The main orchestrator function for ingesting an already extracted text.
+    It chunks text, generates embeddings for new chunks, and syncs them into the
+    vector database through the ingestion pipeline.
+
+    Args:
+        text (str): The raw text to be processed (e.g., from a CV).
+        source_id (str): A unique identifier for the document source.
+        metadata (Optional[Dict[str, any]]): Metadata stored with every chunk.
+
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    logger.info(f"Starting ingestion pipeline for source_id: '{source_id}'")
+    try:
+        pipeline = IngestionPipeline(metadata=metadata or {"source": "cv"})
+        result = await pipeline.run(_single_segment(text))
+
+        if not result.chunks:
+            logger.warning(
+                f"No text chunks were created for source_id: '{source_id}'. Halting process."
+            )
+            return False
+
+        logger.info(f"Successfully processed and stored text for source '{source_id}'.")
+        return True
+    except Exception as e:
+        logger.error(
+            f"An error occurred during the vectorization pipeline for source '{source_id}': {e}",
+            exc_info=True,
+        )
+        return False
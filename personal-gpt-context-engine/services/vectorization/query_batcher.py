@@ -0,0 +1,136 @@
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from config import settings
+from models import EmbeddingType
+from .inference_executor import inference_executor
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+class QueryEmbeddingBatcher:
+    """
+    Coalesces concurrent retrieval queries into micro-batches so that many
+    requests share a single `model.encode` call on the inference executor.
+
+    A batch is flushed once it reaches `max_batch_size` queries or once the
+    first query in it has waited `max_wait_ms`, whichever comes first. While a
+    batch is being encoded, new queries keep accumulating for the next one.
+    """
+
+    def __init__(self, max_batch_size: int, max_wait_ms: int):
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0, max_wait_ms) / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Starts the batching loop on the running event loop."""
+        if self._worker is not None:
+            return
+
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+        logger.info(
+            f"Query embedding batcher started (max_batch_size={self.max_batch_size}, "
+            f"max_wait={self.max_wait * 1000:.0f}ms)."
+        )
+
+    async def stop(self):
+        """Stops the batching loop and fails any queries still waiting."""
+        if self._worker is None:
+            return
+
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(
+                    RuntimeError("Query embedding batcher is shutting down.")
+                )
+
+        self._worker = None
+        self._queue = None
+        logger.info("Query embedding batcher stopped.")
+
+    async def embed(self, text: str) -> np.ndarray:
+        """
+        Embeds a single retrieval query as part of the next micro-batch.
+
+        Args:
+            text (str): The query text.
+
+        Returns:
+            np.ndarray: The query embedding vector.
+        """
+        if self._worker is None:
+            raise RuntimeError("Query embedding batcher has not been started.")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def _collect_batch(self) -> List[Tuple[str, asyncio.Future]]:
+        """Waits for the first query, then gathers more until size or time runs out."""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        # Anything that is already queued rides along for free.
+        while len(batch) < self.max_batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect_batch()
+            batch = [(text, future) for text, future in batch if not future.done()]
+            if not batch:
+                continue
+
+            texts = [text for text, _ in batch]
+            try:
+                embeddings = await inference_executor.embed(
+                    texts, EmbeddingType.RETRIEVAL_QUERY
+                )
+                if embeddings is None:
+                    raise RuntimeError("Failed to generate query embeddings.")
+            except Exception as e:
+                logger.error(f"Query embedding batch of {len(texts)} failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
+
+
+query_embedding_batcher = QueryEmbeddingBatcher(
+    max_batch_size=settings.QUERY_BATCH_MAX_SIZE if settings else 32,
+    max_wait_ms=settings.QUERY_BATCH_MAX_WAIT_MS if settings else 10,
+)
@@ -0,0 +1,76 @@
+import re
+import zlib
+from collections import Counter
+from typing import List
+
+from qdrant_client import models
+
+# Terms keep the characters of technology names: c++, c#, node.js, ci-cd.
+_TERM = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[.\-][a-z0-9+#]+)*")
+
+_STOPWORDS = frozenset("""
+    a an and are as at be been but by for from has have he her his i in into is it
+    its me my of on or our she so such than that the their them then there these
+    they this to was we were what when where which who will with you your
+    """.split())
+
+# BM25 term frequency saturation and document length normalization. The
+# inverse document frequency is applied by Qdrant through the IDF modifier of
+# the sparse vector, so the collection statistics are always up to date.
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Chunks are packed to a token budget, so their length in terms varies little.
+BM25_AVERAGE_TERMS = 120
+
+
+def tokenize(text: str) -> List[str]:
+    """Splits a text into the lowercased, stopword-free terms that are indexed."""
+    return [term for term in _TERM.findall(text.lower()) if term not in _STOPWORDS]
+
+
+def _term_index(term: str) -> int:
+    # Terms are hashed into the sparse vector dimensions, so no vocabulary has
+    # to be kept in sync between ingestion workers and the API.
+    return zlib.crc32(term.encode("utf-8"))
+
+
+def sparse_document_vectors(texts: List[str]) -> List[models.SparseVector]:
+    """
+    Builds the BM25 term weights of stored chunks.
+
+    Args:
+        texts (List[str]): The chunks.
+
+    Returns:
+        List[models.SparseVector]: One sparse vector per chunk.
+    """
+    vectors = []
+    for text in texts:
+        terms = tokenize(text)
+        normalization = BM25_K1 * (
+            1 - BM25_B + BM25_B * len(terms) / BM25_AVERAGE_TERMS
+        )
+        weights = {}
+        for term, frequency in Counter(terms).items():
+            index = _term_index(term)
+            weights[index] = weights.get(index, 0.0) + (
+                frequency * (BM25_K1 + 1) / (frequency + normalization)
+            )
+        vectors.append(
+            models.SparseVector(indices=list(weights), values=list(weights.values()))
+        )
+    return vectors
+
+
+def sparse_query_vector(query: str) -> models.SparseVector:
+    """
+    Builds the sparse vector of a query, every distinct term weighing one.
+
+    Args:
+        query (str): The query.
+
+    Returns:
+        models.SparseVector: The query terms.
+    """
+    indices = sorted({_term_index(term) for term in tokenize(query)})
+    return models.SparseVector(indices=indices, values=[1.0] * len(indices))
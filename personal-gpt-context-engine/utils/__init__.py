@@ -1 +1,6 @@
-from .utils import generate_unique_id
\ No newline at end of file
+from .utils import (
+    generate_unique_id,
+    generate_deterministic_id,
+    get_tenant_point_quota,
+    get_upload_path,
+)
@@ -1,8 +1,31 @@
+import os
 import uuid
 from typing import Optional
 
+from config import settings
 
-def generate_unique_id(prefix: Optional[str]) -> str:
+# Namespace for name-based (UUID5) identifiers generated by this engine.
+_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "personal-gpt-context-engine")
+
+
+def generate_unique_id(prefix: Optional[str] = None) -> str:
     """Generate a unique identifier using UUID4."""
     base_uuid = str(uuid.uuid4())
     return f"{prefix}:{base_uuid}" if prefix else base_uuid
+
+
+def generate_deterministic_id(*parts: str) -> str:
+    """Generate a UUID5 that is always the same for the same parts."""
+    return str(uuid.uuid5(_ID_NAMESPACE, "\x1f".join(parts)))
+
+
+def get_tenant_point_quota(tenant_id: str) -> int:
+    """The number of points a tenant may store, 0 if it is unlimited."""
+    return settings.TENANT_POINT_QUOTAS.get(tenant_id, settings.TENANT_MAX_POINTS)
+
+
+def get_upload_path(job_id: str, extension: str) -> str:
+    """Build the path under the shared upload directory where a job's file is stored."""
+    os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+    filename = job_id.replace(":", "_")
+    return os.path.join(settings.UPLOAD_DIR, f"{filename}.{extension}")
@@ -1 +1,2 @@
 from .manager import vector_db_manager
+from .collection_versions import collection_versions
@@ -0,0 +1,67 @@
+import logging
+from typing import Iterable, Optional
+
+from redis import Redis
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+class _CollectionVersions:
+    """
+    Counters in Redis that change whenever the stored points of a tenant do,
+    so anything derived from them, such as cached search results, can be keyed
+    by the version it was computed at and never outlive a write.
+
+    A write that can't be attributed to tenants bumps the global version,
+    which every tenant's version includes.
+    """
+
+    _client: Redis = None  # A text (decode_responses=True) client attached at startup
+    key_prefix = "collection_version"
+
+    def set_client(self, client: Redis):
+        """Attaches the active Redis client."""
+        logger.info("Redis client has been attached to CollectionVersions.")
+        self._client = client
+
+    @property
+    def global_key(self) -> str:
+        return f"{self.key_prefix}:global"
+
+    def get_key(self, tenant_id: str) -> str:
+        """Redis key of the version of a tenant's points."""
+        return f"{self.key_prefix}:tenant:{tenant_id}"
+
+    def bump(self, tenant_ids: Optional[Iterable[Optional[str]]] = None):
+        """
+        Bumps the version of the given tenants, or of all of them if it isn't
+        known whose points changed.
+
+        Args:
+            tenant_ids (Optional[Iterable[Optional[str]]]): The tenants whose
+                points changed, None (or a None tenant) for all tenants.
+        """
+        if self._client is None:
+            return
+
+        tenant_ids = None if tenant_ids is None else set(tenant_ids)
+        keys = (
+            [self.global_key]
+            if tenant_ids is None or None in tenant_ids
+            else [self.get_key(tenant_id) for tenant_id in sorted(tenant_ids)]
+        )
+        try:
+            pipeline = self._client.pipeline(transaction=False)
+            for key in keys:
+                pipeline.incr(key)
+            pipeline.execute()
+        except Exception as e:
+            logger.error(f"Failed to bump the collection version of {keys}: {e}")
+
+
+collection_versions = _CollectionVersions()
@@ -1,10 +1,16 @@
 import logging
-from typing import List, Optional, Dict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
-from qdrant_client import QdrantClient, models
+import numpy as np
+from qdrant_client import QdrantClient, grpc, models
+from qdrant_client.conversions.conversion import RestToGrpc, payload_to_grpc
+from qdrant_client.local.qdrant_local import QdrantLocal
 
+from config import settings
 from utils import generate_unique_id
-from services import load_embedding_model
+from .collection_versions import collection_versions
 
 logging.basicConfig(
     level=logging.INFO,
@@ -15,8 +21,32 @@ logger = logging.getLogger(__name__)
 
 
 class VectorDBManager:
-    _client: Optional[QdrantClient]
+    _client: Optional[QdrantClient] = None
     _collection_name: str = "personal_gpt_collection"
+    # The dense embedding is the unnamed default vector of every point.
+    _dense_vector_name: str = ""
+    _sparse_vector_name: str = "bm25"
+    _has_sparse_vectors: bool = True
+    # Payload fields that deletes, scrolls and searches filter on. Without an
+    # index, Qdrant scans every point of the collection to match them. Points
+    # of a tenant are stored together, so a query only reads its tenant's data.
+    _tenant_key: str = "tenant_id"
+    _payload_indexes: Dict[str, models.PayloadSchemaParams] = {
+        f"metadata.{_tenant_key}": models.KeywordIndexParams(
+            type=models.KeywordIndexType.KEYWORD, is_tenant=True
+        ),
+        "metadata.source": models.PayloadSchemaType.KEYWORD,
+        "metadata.filename": models.PayloadSchemaType.KEYWORD,
+        "metadata.repository": models.PayloadSchemaType.KEYWORD,
+        "metadata.path": models.PayloadSchemaType.KEYWORD,
+        "metadata.language": models.PayloadSchemaType.KEYWORD,
+        "metadata.record_type": models.PayloadSchemaType.KEYWORD,
+        "metadata.record_key": models.PayloadSchemaType.KEYWORD,
+        "metadata.company": models.PayloadSchemaType.KEYWORD,
+        "metadata.skill": models.PayloadSchemaType.KEYWORD,
+        "metadata.years": models.PayloadSchemaType.INTEGER,
+        "metadata.chunk_index": models.PayloadSchemaType.INTEGER,
+    }
 
     def set_client(self, client: QdrantClient):
         """Injects the live, connected Qdrant client at application startup."""
@@ -32,35 +62,263 @@ class VectorDBManager:
             )
         return self._client
 
+    @property
+    def has_sparse_vectors(self) -> bool:
+        """Whether the collection stores the sparse lexical vector used by hybrid search."""
+        return self._has_sparse_vectors
+
+    @property
+    def filterable_fields(self) -> Set[str]:
+        """Metadata fields searches may filter on: the indexed ones, but the tenant."""
+        return {
+            key.removeprefix("metadata.")
+            for key in self._payload_indexes
+            if key != f"metadata.{self._tenant_key}"
+        }
+
+    def _get_tenants(
+        self, metadata: Iterable[Dict[str, any]]
+    ) -> Optional[Set[Optional[str]]]:
+        """The tenants of points from their metadata or filters, None if unknown."""
+        tenants = set()
+        for point_metadata in metadata:
+            tenant = point_metadata.get(self._tenant_key)
+            if tenant is None:
+                return None
+            tenants.update(tenant if isinstance(tenant, list) else [tenant])
+        return tenants
+
+    def _hnsw_config(self) -> models.HnswConfigDiff:
+        # payload_m builds an additional graph per tenant, so filtered searches
+        # walk a graph of the tenant's points only.
+        return models.HnswConfigDiff(
+            m=settings.QDRANT_HNSW_M,
+            ef_construct=settings.QDRANT_HNSW_EF_CONSTRUCT,
+            payload_m=settings.QDRANT_HNSW_PAYLOAD_M,
+        )
+
+    def _optimizers_config(self) -> models.OptimizersConfigDiff:
+        return models.OptimizersConfigDiff(
+            indexing_threshold=settings.QDRANT_INDEXING_THRESHOLD_KB,
+            default_segment_number=settings.QDRANT_DEFAULT_SEGMENT_NUMBER,
+        )
+
+    def _quantization_config(self) -> Optional[models.ScalarQuantization]:
+        if not settings.QDRANT_QUANTIZATION:
+            return None
+        return models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8,
+                quantile=settings.QDRANT_QUANTIZATION_QUANTILE,
+                always_ram=True,
+            )
+        )
+
+    def _search_params(self) -> Optional[models.SearchParams]:
+        """
+        With quantization, candidates are found with the int8 vectors and
+        rescored with the original ones, read from disk, to keep the ranking
+        accurate.
+        """
+        if not settings.QDRANT_QUANTIZATION:
+            return None
+        return models.SearchParams(
+            quantization=models.QuantizationSearchParams(
+                rescore=True, oversampling=settings.QDRANT_QUANTIZATION_OVERSAMPLING
+            )
+        )
+
     def ensure_collection_exists(self):
         """
-        Checks if the collection exists and creates it if it doesn't.
+        Checks if the collection exists and creates it if it doesn't, then
+        migrates it to the configured schema: payload indexes, HNSW and
+        optimizer parameters, and quantization. Every step is a no-op on a
+        collection that is already up to date, so this runs at every startup.
+        The vector size comes from EMBEDDING_DIMENSION, so the embedding model
+        doesn't have to be loaded for this.
+
+        Points have a dense vector and a named sparse vector of BM25 term
+        weights; Qdrant applies the inverse document frequencies at query time.
+        With quantization, the original dense vectors are kept on disk and only
+        their int8 copies in memory.
         """
+        embedding_dim = settings.EMBEDDING_DIMENSION
+        quantization_config = self._quantization_config()
         try:
-            self.client.get_collection(collection_name=self._collection_name)
-            logger.info(f"Collection '{self._collection_name}' already exists.")
+            collection = self.client.get_collection(
+                collection_name=self._collection_name
+            )
         except Exception:  # Catching potential errors if collection not found
             logger.info(
                 f"Collection '{self._collection_name}' not found. Creating it now."
             )
-            embedding_dim = load_embedding_model().get_sentence_embedding_dimension()
             self.client.recreate_collection(
                 collection_name=self._collection_name,
                 vectors_config=models.VectorParams(
-                    size=embedding_dim, distance=models.Distance.COSINE
+                    size=embedding_dim,
+                    distance=models.Distance.COSINE,
+                    on_disk=quantization_config is not None,
                 ),
+                sparse_vectors_config={
+                    self._sparse_vector_name: models.SparseVectorParams(
+                        modifier=models.Modifier.IDF
+                    )
+                },
+                hnsw_config=self._hnsw_config(),
+                optimizers_config=self._optimizers_config(),
+                quantization_config=quantization_config,
             )
+            self._has_sparse_vectors = True
+            self._ensure_payload_indexes({})
             logger.info(f"Successfully created collection '{self._collection_name}'.")
+            return
+
+        logger.info(f"Collection '{self._collection_name}' already exists.")
+        self._migrate_collection(collection)
+        self._ensure_payload_indexes(collection.payload_schema or {})
+        self._assign_default_tenant()
+        sparse_vectors = collection.config.params.sparse_vectors or {}
+        self._has_sparse_vectors = self._sparse_vector_name in sparse_vectors
+        if not self._has_sparse_vectors:
+            logger.warning(
+                f"Collection '{self._collection_name}' has no '{self._sparse_vector_name}' "
+                "sparse vector; searches are dense only until it is recreated."
+            )
+
+        vectors = collection.config.params.vectors
+        if isinstance(vectors, models.VectorParams) and vectors.size != embedding_dim:
+            logger.error(
+                f"Collection '{self._collection_name}' stores {vectors.size}-dimensional "
+                f"vectors but EMBEDDING_DIMENSION is {embedding_dim}."
+            )
+
+    def _migrate_collection(self, collection: models.CollectionInfo):
+        """
+        Applies the configured HNSW, optimizer and quantization parameters to
+        an existing collection when they differ. Qdrant rebuilds the affected
+        segments in the background; the collection stays searchable meanwhile.
+        """
+        config = collection.config
+        changes = {}
+
+        hnsw = self._hnsw_config()
+        if (
+            config.hnsw_config.m,
+            config.hnsw_config.ef_construct,
+            config.hnsw_config.payload_m,
+        ) != (hnsw.m, hnsw.ef_construct, hnsw.payload_m):
+            changes["hnsw_config"] = hnsw
+
+        optimizers = self._optimizers_config()
+        if (
+            config.optimizer_config.indexing_threshold,
+            config.optimizer_config.default_segment_number,
+        ) != (optimizers.indexing_threshold, optimizers.default_segment_number):
+            changes["optimizers_config"] = optimizers
+
+        quantization = self._quantization_config()
+        if config.quantization_config != quantization:
+            changes["quantization_config"] = quantization or models.Disabled.DISABLED
+            changes["vectors_config"] = {
+                self._dense_vector_name: models.VectorParamsDiff(
+                    on_disk=quantization is not None
+                )
+            }
+
+        if not changes:
+            return
+
+        logger.info(
+            f"Updating {', '.join(changes)} of collection '{self._collection_name}'."
+        )
+        self.client.update_collection(collection_name=self._collection_name, **changes)
+
+    def _ensure_payload_indexes(self, payload_schema: Dict[str, Any]):
+        """
+        Creates the payload indexes the collection is missing.
+
+        Args:
+            payload_schema (Dict[str, Any]): The indexes the collection already has.
+        """
+        for field_name, field_schema in self._payload_indexes.items():
+            if field_name in payload_schema:
+                continue
+            index_type = getattr(field_schema, "type", field_schema).value
+            logger.info(f"Creating {index_type} payload index on '{field_name}'.")
+            self.client.create_payload_index(
+                collection_name=self._collection_name,
+                field_name=field_name,
+                field_schema=field_schema,
+                wait=True,
+            )
+
+    def _assign_default_tenant(self):
+        """
+        Moves the points stored before the collection was partitioned by
+        tenant to the default tenant, so they stay searchable. This is a
+        one-off migration: once every point has a tenant, nothing is written
+        and cached results stay valid.
+        """
+        untagged = models.Filter(
+            must=[
+                models.IsEmptyCondition(
+                    is_empty=models.PayloadField(key=f"metadata.{self._tenant_key}")
+                )
+            ]
+        )
+        count = self.client.count(
+            collection_name=self._collection_name, count_filter=untagged, exact=True
+        ).count
+        if not count:
+            return
+
+        default_tenant = settings.DEFAULT_TENANT_ID
+        self.client.set_payload(
+            collection_name=self._collection_name,
+            payload={self._tenant_key: default_tenant},
+            key="metadata",
+            points=untagged,
+            wait=True,
+        )
+        collection_versions.bump([default_tenant])
+        logger.info(f"Assigned {count} points without a tenant to '{default_tenant}'.")
+
+    def count_points(self, metadata_filter: Dict[str, any]) -> int:
+        """
+        Counts the points matching a metadata filter, e.g. those of a tenant.
+
+        Args:
+            metadata_filter (Dict[str, any]): The metadata identifying the points.
+
+        Returns:
+            int: The number of matching points.
+        """
+        return self.client.count(
+            collection_name=self._collection_name,
+            count_filter=self._build_filter_from_metadata(
+                metadata_filter=metadata_filter
+            ),
+            exact=True,
+        ).count
 
     def _build_filter_from_metadata(
         self, metadata_filter: Dict[str, any]
     ) -> models.Filter:
         """
         A helper to dynamically build a Qdrant filter from a metadata dictionary.
+        Keys refer to fields of the `metadata` object stored in every payload.
+        A list of values matches any of them.
         """
         return models.Filter(
             must=[
-                models.FieldCondition(key=key, match=models.MatchValue(value=value))
+                models.FieldCondition(
+                    key=f"metadata.{key}",
+                    match=(
+                        models.MatchAny(any=value)
+                        if isinstance(value, list)
+                        else models.MatchValue(value=value)
+                    ),
+                )
                 for key, value in metadata_filter.items()
             ]
         )
@@ -84,49 +342,454 @@ class VectorDBManager:
             points_selector=models.FilterSelector(filter=db_filter),
             wait=True,
         )
+        collection_versions.bump(self._get_tenants([metadata_filter]))
         logger.info("Deletion of old points complete.")
 
+    def delete_points_by_ids(
+        self,
+        point_ids: List[str],
+        tenant_ids: Optional[Iterable[Optional[str]]] = None,
+    ):
+        """
+        Deletes the points with the given ids.
+
+        Args:
+            point_ids (List[str]): The ids of the points to delete.
+            tenant_ids (Optional[Iterable[Optional[str]]]): The tenants the
+                points belong to, all tenants if omitted.
+        """
+        if not point_ids:
+            return
+
+        logger.info(f"Deleting {len(point_ids)} points by id.")
+        self.client.delete(
+            collection_name=self._collection_name,
+            points_selector=models.PointIdsList(points=point_ids),
+            wait=True,
+        )
+        collection_versions.bump(tenant_ids)
+
+    def get_chunk_indexes_by_metadata(
+        self, metadata_filter: Dict[str, any], page_size: int = 1000
+    ) -> Dict[str, int]:
+        """
+        Lists the points matching a metadata filter without fetching their vectors.
+
+        Args:
+            metadata_filter (Dict[str, any]): The metadata identifying the points.
+            page_size (int): Number of points fetched per scroll request.
+
+        Returns:
+            Dict[str, int]: The chunk index of every matching point, keyed by point id.
+        """
+        db_filter = self._build_filter_from_metadata(metadata_filter=metadata_filter)
+
+        chunk_indexes = {}
+        offset = None
+        while True:
+            records, offset = self.client.scroll(
+                collection_name=self._collection_name,
+                scroll_filter=db_filter,
+                limit=page_size,
+                offset=offset,
+                with_payload=["metadata.chunk_index"],
+                with_vectors=False,
+            )
+            for record in records:
+                metadata = (record.payload or {}).get("metadata", {})
+                chunk_indexes[str(record.id)] = metadata.get("chunk_index", -1)
+            if offset is None:
+                return chunk_indexes
+
+    def get_chunk_indexes_by_field(
+        self, metadata_filter: Dict[str, any], field: str, page_size: int = 1000
+    ) -> Dict[any, Dict[str, int]]:
+        """
+        Lists the points matching a metadata filter grouped by the value of a
+        metadata field, e.g. the path of a file, so the stored points of many
+        documents are read in one scroll instead of one scroll per document.
+
+        Args:
+            metadata_filter (Dict[str, any]): The metadata identifying the points.
+            field (str): The metadata field identifying a document.
+            page_size (int): Number of points fetched per scroll request.
+
+        Returns:
+            Dict[any, Dict[str, int]]: The chunk index of every matching point,
+                keyed by point id, for every value of the field.
+        """
+        db_filter = self._build_filter_from_metadata(metadata_filter=metadata_filter)
+
+        chunk_indexes: Dict[any, Dict[str, int]] = {}
+        offset = None
+        while True:
+            records, offset = self.client.scroll(
+                collection_name=self._collection_name,
+                scroll_filter=db_filter,
+                limit=page_size,
+                offset=offset,
+                with_payload=["metadata.chunk_index", f"metadata.{field}"],
+                with_vectors=False,
+            )
+            for record in records:
+                metadata = (record.payload or {}).get("metadata", {})
+                chunk_indexes.setdefault(metadata.get(field), {})[str(record.id)] = (
+                    metadata.get("chunk_index", -1)
+                )
+            if offset is None:
+                return chunk_indexes
+
+    def get_metadata_values(
+        self, metadata_filter: Dict[str, any], fields: List[str], page_size: int = 1000
+    ) -> Set[Tuple[any, ...]]:
+        """
+        Lists the distinct values of metadata fields over the points matching a
+        filter, without fetching their vectors.
+
+        Args:
+            metadata_filter (Dict[str, any]): The metadata identifying the points.
+            fields (List[str]): The metadata fields to read.
+            page_size (int): Number of points fetched per scroll request.
+
+        Returns:
+            Set[Tuple[any, ...]]: The values of the fields, in order, None for a
+                field a point doesn't have.
+        """
+        db_filter = self._build_filter_from_metadata(metadata_filter=metadata_filter)
+
+        values = set()
+        offset = None
+        while True:
+            records, offset = self.client.scroll(
+                collection_name=self._collection_name,
+                scroll_filter=db_filter,
+                limit=page_size,
+                offset=offset,
+                with_payload=[f"metadata.{field}" for field in fields],
+                with_vectors=False,
+            )
+            for record in records:
+                metadata = (record.payload or {}).get("metadata", {})
+                values.add(tuple(metadata.get(field) for field in fields))
+            if offset is None:
+                return values
+
+    def set_metadata(self, updates: List[Tuple[Dict[str, any], Dict[str, any]]]):
+        """
+        Sets metadata fields of the points matching each filter, in one request.
+
+        Args:
+            updates (List[Tuple[Dict[str, any], Dict[str, any]]]): The metadata
+                filter identifying the points, and the fields to set on them.
+        """
+        if not updates:
+            return
+
+        self.client.batch_update_points(
+            collection_name=self._collection_name,
+            update_operations=[
+                models.SetPayloadOperation(
+                    set_payload=models.SetPayload(
+                        payload=fields,
+                        filter=self._build_filter_from_metadata(
+                            metadata_filter=metadata_filter
+                        ),
+                        key="metadata",
+                    )
+                )
+                for metadata_filter, fields in updates
+            ],
+            wait=True,
+        )
+        collection_versions.bump(
+            self._get_tenants(metadata_filter for metadata_filter, _ in updates)
+        )
+
+    def set_chunk_indexes(
+        self,
+        chunk_indexes: Dict[str, int],
+        tenant_ids: Optional[Iterable[Optional[str]]] = None,
+    ):
+        """
+        Updates the stored chunk index of existing points whose chunk moved.
+
+        Args:
+            chunk_indexes (Dict[str, int]): The new chunk index keyed by point id.
+            tenant_ids (Optional[Iterable[Optional[str]]]): The tenants the
+                points belong to, all tenants if omitted.
+        """
+        if not chunk_indexes:
+            return
+
+        self.client.batch_update_points(
+            collection_name=self._collection_name,
+            update_operations=[
+                models.SetPayloadOperation(
+                    set_payload=models.SetPayload(
+                        payload={"chunk_index": chunk_index},
+                        points=[point_id],
+                        key="metadata",
+                    )
+                )
+                for point_id, chunk_index in chunk_indexes.items()
+            ],
+            wait=True,
+        )
+        collection_versions.bump(tenant_ids)
+        logger.info(f"Updated the chunk index of {len(chunk_indexes)} points.")
+
+    @property
+    def _uses_grpc(self) -> bool:
+        return bool(self.client.init_options.get("prefer_grpc"))
+
+    @property
+    def _is_local(self) -> bool:
+        """Whether the client runs Qdrant embedded in this process."""
+        return isinstance(self.client._client, QdrantLocal)
+
+    def _build_point(
+        self,
+        point_id: str,
+        vector: Union[np.ndarray, Sequence[float]],
+        payload: Dict,
+        sparse_vector: Optional[models.SparseVector] = None,
+    ) -> Union[grpc.PointStruct, models.PointStruct]:
+        """
+        Builds a point in the wire format of the client. This is the only place
+        embedding rows are converted to Python floats, one row at a time.
+        """
+        if isinstance(vector, np.ndarray):
+            # Much faster for protobuf to consume than the numpy scalars.
+            vector = vector.tolist()
+        if not self._has_sparse_vectors:
+            sparse_vector = None
+
+        if self._uses_grpc:
+            dense = grpc.Vector(dense=grpc.DenseVector(data=vector))
+            if sparse_vector is None:
+                vectors = grpc.Vectors(vector=dense)
+            else:
+                sparse = grpc.Vector(
+                    sparse=grpc.SparseVector(
+                        indices=sparse_vector.indices, values=sparse_vector.values
+                    )
+                )
+                vectors = grpc.Vectors(
+                    vectors=grpc.NamedVectors(
+                        vectors={
+                            self._dense_vector_name: dense,
+                            self._sparse_vector_name: sparse,
+                        }
+                    )
+                )
+            return grpc.PointStruct(
+                id=RestToGrpc.convert_extended_point_id(point_id),
+                vectors=vectors,
+                payload=payload_to_grpc(payload),
+            )
+
+        if sparse_vector is None:
+            return models.PointStruct(id=point_id, vector=list(vector), payload=payload)
+        return models.PointStruct(
+            id=point_id,
+            vector={
+                self._dense_vector_name: list(vector),
+                self._sparse_vector_name: sparse_vector,
+            },
+            payload=payload,
+        )
+
     def upsert_points(
         self,
         text_chunks: List[str],
-        embeddings: List[List[float]],
-        metadata: Dict[str, any],
+        embeddings: Union[np.ndarray, Sequence[Sequence[float]]],
+        metadata: Union[Dict[str, any], Sequence[Dict[str, any]]],
+        point_ids: Optional[List[str]] = None,
+        chunk_indexes: Optional[List[int]] = None,
+        batch_size: Optional[int] = None,
+        parallel: Optional[int] = None,
+        wait: Optional[bool] = None,
+        barrier: bool = True,
+        sparse_vectors: Optional[Sequence[models.SparseVector]] = None,
     ):
         """
-        Builds and upserts a list of points (rows) into the Qdrant collection.
+        Builds and upserts points (rows) into the Qdrant collection in batches.
         This method only adds new data.
 
+        Points are built one batch at a time and up to `parallel` batches are in
+        flight at once. Unless `wait` is set, batches are only acknowledged by
+        Qdrant, not applied. With `barrier`, the last batch is then sent with
+        `wait=True` once all others were acknowledged. Qdrant applies the updates
+        of a collection in order, so all points are searchable when this method
+        returns. Callers writing a document in several calls can skip the barrier
+        on all but the last one.
+
         Args:
             text_chunks (List[str]): The list of original text pieces.
-            embeddings (List[List[float]]): The corresponding vector embeddings.
-            metadata (dict): A dictionary of metadata to be associated with every chunk.
+            embeddings (Union[np.ndarray, Sequence[Sequence[float]]]): The
+                corresponding vector embeddings, one row per chunk.
+            metadata (Union[dict, Sequence[dict]]): A dictionary of metadata to be
+                associated with every chunk, or one per chunk when the chunks come
+                from several documents.
+            point_ids (Optional[List[str]]): Ids of the points, random ids if omitted.
+            chunk_indexes (Optional[List[int]]): Position of every chunk in its
+                document, defaults to the position in `text_chunks`.
+            batch_size (Optional[int]): Points per upsert request.
+            parallel (Optional[int]): Maximum number of requests in flight.
+            wait (Optional[bool]): Wait for every batch to be applied.
+            barrier (bool): Wait for all batches to be applied before returning.
+            sparse_vectors (Optional[Sequence[models.SparseVector]]): The lexical
+                vector of every chunk, for hybrid search.
         """
 
         if not text_chunks:
             logger.warning("upsert_points called with no text chunks. Nothing to do.")
             return
 
-        points_to_insert = []
-        for i, chunk in enumerate(text_chunks):
-            point_id = str(generate_unique_id())
+        batch_size = batch_size or settings.QDRANT_UPSERT_BATCH_SIZE
+        parallel = parallel or settings.QDRANT_UPSERT_PARALLELISM
+        if self._is_local:
+            # The embedded local mode used in development isn't thread safe.
+            parallel = 1
+        wait = settings.QDRANT_UPSERT_WAIT if wait is None else wait
+
+        def build_batch(start: int) -> List[Any]:
+            points = []
+            for i in range(start, min(start + batch_size, len(text_chunks))):
+                point_id = point_ids[i] if point_ids else str(generate_unique_id())
 
-            point_metadata = metadata.copy()
-            point_metadata["chunk_index"] = i
+                point_metadata = (
+                    metadata if isinstance(metadata, dict) else metadata[i]
+                ).copy()
+                point_metadata["chunk_index"] = chunk_indexes[i] if chunk_indexes else i
 
-            payload = {"text_chunk": chunk, "metadata": point_metadata}
+                payload = {"text_chunk": text_chunks[i], "metadata": point_metadata}
+                points.append(
+                    self._build_point(
+                        point_id,
+                        embeddings[i],
+                        payload,
+                        sparse_vectors[i] if sparse_vectors else None,
+                    )
+                )
+            return points
 
-            points_to_insert.append(
-                models.PointStruct(id=point_id, vector=embeddings[i], payload=payload)
+        def send_batch(points: List[Any], wait_for_batch: bool):
+            self.client.upsert(
+                collection_name=self._collection_name,
+                points=points,
+                wait=wait_for_batch,
             )
 
-        logger.info(
-            f"Preparing to upsert {len(points_to_insert)} points with base metadata: {metadata}"
+        if isinstance(metadata, dict):
+            logger.info(
+                f"Preparing to upsert {len(text_chunks)} points with base metadata: {metadata}"
+            )
+        else:
+            logger.info(
+                f"Preparing to upsert {len(text_chunks)} points of "
+                f"{len({id(m) for m in metadata})} documents."
+            )
+
+        starts = range(0, len(text_chunks), batch_size)
+        *leading, last = starts
+        with ThreadPoolExecutor(max_workers=parallel) as pool:
+            in_flight = deque()
+            for start in leading:
+                if len(in_flight) >= parallel:
+                    in_flight.popleft().result()
+                in_flight.append(pool.submit(send_batch, build_batch(start), wait))
+
+            for future in in_flight:
+                future.result()
+
+        # Consistency barrier: every other batch has been acknowledged by now.
+        send_batch(build_batch(last), wait or barrier)
+        # Without a barrier the points may not be applied yet, the caller's last
+        # call bumps the version again once they are.
+        collection_versions.bump(
+            self._get_tenants([metadata] if isinstance(metadata, dict) else metadata)
+        )
+        logger.info(f"Successfully upserted {len(text_chunks)} points.")
+
+    def search(
+        self,
+        query_vector: Union[np.ndarray, List[float]],
+        limit: int,
+        metadata_filter: Optional[Dict[str, any]] = None,
+        sparse_query: Optional[models.SparseVector] = None,
+        prefetch_limit: Optional[int] = None,
+        with_vectors: bool = False,
+    ) -> List[models.ScoredPoint]:
+        """
+        Finds the points closest to a query vector.
+
+        With a sparse query, this is a hybrid search: the `prefetch_limit` best
+        points by dense and by sparse vector are fused with reciprocal rank
+        fusion, so a point ranked high by either makes it to the top. Scores
+        are then fused ranks rather than similarities.
+
+        Args:
+            query_vector (Union[np.ndarray, List[float]]): The embedded query.
+            limit (int): Maximum number of points to return.
+            metadata_filter (Optional[Dict[str, any]]): Metadata the points must match.
+            sparse_query (Optional[models.SparseVector]): The lexical query terms.
+            prefetch_limit (Optional[int]): Candidates taken from each vector.
+            with_vectors (bool): Return the dense vector of the points too.
+
+        Returns:
+            List[models.ScoredPoint]: The matching points with their payloads.
+        """
+        db_filter = (
+            self._build_filter_from_metadata(metadata_filter=metadata_filter)
+            if metadata_filter
+            else None
+        )
+
+        hybrid = (
+            sparse_query is not None
+            and bool(sparse_query.indices)
+            and self._has_sparse_vectors
         )
+        search_params = self._search_params()
+        vectors = [self._dense_vector_name] if with_vectors else False
+        if not hybrid:
+            response = self.client.query_points(
+                collection_name=self._collection_name,
+                query=query_vector,
+                query_filter=db_filter,
+                search_params=search_params,
+                limit=limit,
+                with_payload=True,
+                with_vectors=vectors,
+            )
+            return response.points
 
-        self.client.upsert(
-            collection_name=self._collection_name, points=points_to_insert, wait=True
+        if isinstance(query_vector, np.ndarray):
+            query_vector = query_vector.tolist()
+        prefetch_limit = max(limit, prefetch_limit or settings.SEARCH_PREFETCH_LIMIT)
+        response = self.client.query_points(
+            collection_name=self._collection_name,
+            prefetch=[
+                models.Prefetch(
+                    query=query_vector,
+                    filter=db_filter,
+                    params=search_params,
+                    limit=prefetch_limit,
+                ),
+                models.Prefetch(
+                    query=sparse_query,
+                    using=self._sparse_vector_name,
+                    filter=db_filter,
+                    limit=prefetch_limit,
+                ),
+            ],
+            query=models.FusionQuery(fusion=models.Fusion.RRF),
+            limit=limit,
+            with_payload=True,
+            with_vectors=vectors,
         )
-        logger.info(f"Successfully upserted {len(points_to_insert)} points.")
+        return response.points
 
 
 vector_db_manager = VectorDBManager()
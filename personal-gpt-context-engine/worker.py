@@ -0,0 +1,223 @@
+import os
+import signal
+import socket
+import asyncio
+import logging
+from typing import Dict, List
+
+from starlette.concurrency import run_in_threadpool
+
+from config import (
+    settings,
+    connect_to_redis,
+    connect_to_async_redis,
+    connect_to_qdrant,
+)
+from background_jobs import JOB_HANDLERS
+from job_manager import job_manager
+from job_queue import job_queue
+from models import JobStatus, QueuedJob
+from services import (
+    embedding_cache,
+    inference_executor,
+    warm_up_page_pool,
+    shutdown_page_pool,
+)
+from vector_db_manager import vector_db_manager, collection_versions
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+class IngestionWorker:
+    """
+    Claims processing jobs from the job queue and runs their handlers.
+
+    Several workers, on one or many machines, can consume the same queue. Each
+    one keeps at most `concurrency` jobs in flight, heartbeats them so they
+    aren't reclaimed while still running, and periodically takes over jobs
+    left behind by workers that died.
+    """
+
+    def __init__(self, consumer_name: str, concurrency: int):
+        self.consumer_name = consumer_name
+        self.concurrency = max(1, concurrency)
+        self.claim_idle_ms = settings.JOB_QUEUE_CLAIM_IDLE_MS
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._stopping = asyncio.Event()
+
+    def stop(self):
+        """Stops claiming new jobs. Jobs already in flight are allowed to finish."""
+        if not self._stopping.is_set():
+            logger.info(f"Worker '{self.consumer_name}' is shutting down...")
+            self._stopping.set()
+
+    async def _fail_job(self, job: QueuedJob, error_msg: str):
+        await job_manager.update_job(
+            job_id=job.job_id,
+            updates={"status": JobStatus.FAILED, "errorMsg": error_msg},
+        )
+
+    async def _process(self, job: QueuedJob):
+        logger.info(
+            f"Processing job '{job.job_id}' ({job.job_type.value}), delivery {job.deliveries}."
+        )
+        handler = JOB_HANDLERS.get(job.job_type)
+        if handler is None:
+            logger.error(f"No handler registered for job type '{job.job_type.value}'.")
+            await self._fail_job(job, f"Unsupported job type '{job.job_type.value}'.")
+            await run_in_threadpool(
+                job_queue.dead_letter,
+                job.message_id,
+                job.model_dump(mode="json"),
+                "No handler registered",
+            )
+            return
+
+        try:
+            await handler(job_id=job.job_id, **job.payload)
+        except Exception as e:
+            # Handlers record their own failures, this only guards the worker loop.
+            logger.error(f"Handler for job '{job.job_id}' raised: {e}", exc_info=True)
+            await self._fail_job(job, f"An unexpected error occurred: {str(e)}")
+
+        await run_in_threadpool(job_queue.ack, job.message_id)
+
+    def _start(self, job: QueuedJob):
+        if job.message_id in self._in_flight:
+            return
+
+        task = asyncio.create_task(self._process(job))
+        self._in_flight[job.message_id] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(job.message_id, None))
+
+    async def _heartbeat_loop(self):
+        interval = max(self.claim_idle_ms / 3000, 1)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await run_in_threadpool(
+                    job_queue.heartbeat, self.consumer_name, list(self._in_flight)
+                )
+            except Exception as e:
+                logger.warning(f"Failed to heartbeat in-flight jobs: {e}")
+
+    async def _reclaim(self, count: int) -> List[QueuedJob]:
+        retries, exhausted = await run_in_threadpool(
+            job_queue.reclaim_stalled,
+            self.consumer_name,
+            self.claim_idle_ms,
+            count,
+            settings.JOB_QUEUE_MAX_DELIVERIES,
+        )
+        for job in exhausted:
+            await self._fail_job(
+                job,
+                f"Job was abandoned after {settings.JOB_QUEUE_MAX_DELIVERIES} attempts.",
+            )
+        return retries
+
+    async def run(self):
+        """Runs the claim loop until `stop` is called, then drains in-flight jobs."""
+        loop = asyncio.get_running_loop()
+        heartbeat = asyncio.create_task(self._heartbeat_loop())
+        reclaim_interval = self.claim_idle_ms / 1000
+        last_reclaim = float("-inf")
+
+        logger.info(
+            f"Worker '{self.consumer_name}' started with concurrency {self.concurrency}."
+        )
+
+        try:
+            while not self._stopping.is_set():
+                free_slots = self.concurrency - len(self._in_flight)
+                if free_slots <= 0:
+                    await asyncio.wait(
+                        list(self._in_flight.values()),
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    continue
+
+                try:
+                    jobs = []
+                    if loop.time() - last_reclaim >= reclaim_interval:
+                        last_reclaim = loop.time()
+                        jobs = await self._reclaim(free_slots)
+
+                    if not jobs:
+                        jobs = await run_in_threadpool(
+                            job_queue.claim,
+                            self.consumer_name,
+                            free_slots,
+                            settings.JOB_QUEUE_BLOCK_MS,
+                        )
+                except Exception as e:
+                    logger.error(f"Failed to claim jobs: {e}", exc_info=True)
+                    await asyncio.sleep(1)
+                    continue
+
+                for job in jobs:
+                    self._start(job)
+        finally:
+            if self._in_flight:
+                logger.info(f"Waiting for {len(self._in_flight)} in-flight job(s)...")
+                await asyncio.gather(*self._in_flight.values(), return_exceptions=True)
+            heartbeat.cancel()
+
+
+async def run_worker():
+    redis = await run_in_threadpool(connect_to_redis)
+    async_redis = await connect_to_async_redis()
+    job_manager.set_client(async_redis)
+    job_queue.set_client(redis)
+    job_queue.ensure_group()
+
+    binary_redis = await run_in_threadpool(connect_to_redis, False)
+    embedding_cache.set_client(binary_redis)
+    collection_versions.set_client(redis)
+
+    vector_db_client = await run_in_threadpool(connect_to_qdrant)
+    vector_db_manager.set_client(vector_db_client)
+    vector_db_manager.ensure_collection_exists()
+
+    await inference_executor.start()
+    await warm_up_page_pool()
+
+    worker = IngestionWorker(
+        consumer_name=f"{socket.gethostname()}:{os.getpid()}",
+        concurrency=settings.WORKER_CONCURRENCY,
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    try:
+        await worker.run()
+    finally:
+        await inference_executor.stop()
+        await run_in_threadpool(shutdown_page_pool)
+        try:
+            redis.close()
+            binary_redis.close()
+            await async_redis.aclose()
+        except Exception:
+            logger.exception("Error while closing redis on shutdown")
+
+
+def main():
+
+    if not settings:
+        print("FATAL: Couldn't load settings. Exiting.")
+        return
+
+    print("Starting Personal GPT Context Engine ingestion worker")
+    asyncio.run(run_worker())
+
+
+if __name__ == "__main__":
+    main()